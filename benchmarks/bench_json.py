@@ -0,0 +1,83 @@
+"""JSON codec cost on realistic request and response bodies.
+
+Compares the standard library codec with orjson on decoding a 100-event
+``events.list`` page and encoding ``send-event`` request bodies.
+
+Run with::
+
+    pip install hookbase[orjson]
+    python benchmarks/bench_json.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from hookbase.codec import JSONCodec, OrjsonCodec, StdlibJSONCodec
+
+EVENTS_PAGE = StdlibJSONCodec().dumps({
+    "data": [
+        {
+            "id": f"evt_{i:08d}",
+            "sourceId": "src_2f9a1c",
+            "organizationId": "org_81bd44",
+            "eventType": "order.created",
+            "payloadHash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+            "signatureValid": 1,
+            "receivedAt": "2024-06-01T12:34:56.789Z",
+            "ipAddress": "203.0.113.24",
+            "sourceName": "Shopify production",
+            "sourceSlug": "shopify-prod",
+            "status": "delivered",
+            "deliveryStats": {"total": 3, "delivered": 3, "failed": 0, "pending": 0},
+        }
+        for i in range(100)
+    ],
+    "pagination": {"total": 12_345, "limit": 100, "offset": 0},
+})
+
+SEND_EVENT_BODY: dict[str, Any] = {
+    "applicationId": "app_5c1e2d",
+    "eventType": "order.created",
+    "eventId": "ord_2024_000123",
+    "payload": {
+        "id": "ord_2024_000123",
+        "customer": {"id": "cus_88", "email": "jane@example.com", "name": "Jane Doe"},
+        "currency": "EUR",
+        "total": 12_499,
+        "lineItems": [
+            {"sku": f"SKU-{n:04d}", "name": "Widget édition", "qty": n % 3 + 1,
+             "price": 1_999, "tags": ["summer", "sale"]}
+            for n in range(20)
+        ],
+        "shipping": {"method": "express", "address": {"city": "Berlin", "zip": "10115"}},
+        "createdAt": "2024-06-01T12:34:56.789Z",
+    },
+    "metadata": {"tenant": "acme", "trace": "00-4bf92f3577b34da6-00f067aa0ba902b7-01"},
+}
+
+
+def bench(codec: JSONCodec, number: int = 2_000) -> tuple[float, float]:
+    decode = min(timeit.repeat(lambda: codec.loads(EVENTS_PAGE), number=number, repeat=5))
+    encode = min(timeit.repeat(lambda: codec.dumps(SEND_EVENT_BODY), number=number, repeat=5))
+    return decode / number * 1e6, encode / number * 1e6
+
+
+def main() -> None:
+    codecs: list[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed; only the stdlib codec is measured")
+
+    print(f"events.list page: {len(EVENTS_PAGE):,} bytes, 100 events")
+    print(f"send-event body:  {len(codecs[0].dumps(SEND_EVENT_BODY)):,} bytes")
+    print(f"{'codec':<8} {'decode page':>14} {'encode body':>14}")
+    for codec in codecs:
+        decode, encode = bench(codec)
+        print(f"{codec.name:<8} {decode:11.1f} us {encode:11.1f} us")
+
+
+if __name__ == "__main__":
+    main()
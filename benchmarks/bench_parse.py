@@ -0,0 +1,52 @@
+"""Per-call cost of parsing a 20-item events page.
+
+Compares building a fresh ``TypeAdapter`` on every call (the old behaviour)
+with the cached validator registry used by the SDK.
+
+Run with::
+
+    python benchmarks/bench_parse.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from pydantic import TypeAdapter
+
+from hookbase import _validation
+from hookbase.models import Event
+
+PAGE = [
+    {
+        "id": f"evt_{i}",
+        "sourceId": "src_1",
+        "organizationId": "org_1",
+        "eventType": "order.created",
+        "payloadHash": "abc123",
+        "signatureValid": 1,
+        "receivedAt": "2024-01-01T00:00:00Z",
+        "status": "delivered",
+    }
+    for i in range(20)
+]
+
+
+def uncached() -> None:
+    TypeAdapter(list[Event]).validate_python(PAGE)
+
+
+def cached() -> None:
+    _validation.parse_list(Event, PAGE)
+
+
+def main() -> None:
+    number = 2_000
+    for name, fn in (("fresh TypeAdapter", uncached), ("cached registry", cached)):
+        fn()  # warm-up
+        best = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:<18} {best / number * 1e6:8.1f} us/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,76 @@
 """Hookbase Python SDK - Official client for the Hookbase webhook platform."""
 
 from ._version import __version__
+from .batch import AsyncSendManyResult, SendManyResult, SendResult, SendStats
+from .cache import CacheBackend, CacheEntry, InMemoryCache, ResponseCache
 from .client import AsyncHookbase, Hookbase
+from .codec import JSONCodec, OrjsonCodec, StdlibJSONCodec
+from .concurrency import ConcurrencyLimiter
 from .errors import (
     APIError,
     AuthenticationError,
+    BulkOperationError,
     ConflictError,
     ForbiddenError,
     HookbaseError,
     NetworkError,
     NotFoundError,
+    OutboxFullError,
+    QueueFullError,
     RateLimitError,
     TimeoutError,
     ValidationError,
+    WebhookReplayError,
     WebhookVerificationError,
 )
-from .webhook import Webhook
+from .outbox import Outbox, OutboxDrainResult, OutboxEvent, OutboxStats
+from .producer import AsyncProducer, Producer
+from .ratelimit import RateLimiter
+from .replay import InMemoryReplayGuard, ReplayGuard
+from .resources.deliveries import ReplayFailedResult
+from .resources.dlq import DrainProgress
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .webhook import Webhook, WebhookSecret
 
 __all__ = [
     "__version__",
     # Clients
     "Hookbase",
     "AsyncHookbase",
+    # Rate and concurrency limiting
+    "RateLimiter",
+    "ConcurrencyLimiter",
+    # Request coalescing
+    "SingleFlight",
+    "AsyncSingleFlight",
+    # Response caching
+    "ResponseCache",
+    "CacheBackend",
+    "CacheEntry",
+    "InMemoryCache",
+    # JSON codecs
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    # Batch sending
+    "SendManyResult",
+    "AsyncSendManyResult",
+    "SendResult",
+    "SendStats",
+    "Producer",
+    "AsyncProducer",
+    "Outbox",
+    "OutboxEvent",
+    "OutboxStats",
+    "OutboxDrainResult",
+    # Bulk operations
+    "DrainProgress",
+    "ReplayFailedResult",
     # Webhook verification
     "Webhook",
+    "WebhookSecret",
+    "ReplayGuard",
+    "InMemoryReplayGuard",
     # Errors
     "HookbaseError",
     "APIError",
@@ -36,4 +83,8 @@ __all__ = [
     "TimeoutError",
     "NetworkError",
     "WebhookVerificationError",
+    "WebhookReplayError",
+    "QueueFullError",
+    "OutboxFullError",
+    "BulkOperationError",
 ]
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import random
 import time
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import httpx
 
 from ._constants import DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT, RETRY_STATUS_CODES
+from ._parallel import map_bounded
 from ._version import __version__
+from .cache import ResponseCache
+from .codec import DEFAULT_CODEC, JSONCodec
+from .concurrency import ConcurrencyLimiter
 from .errors import (
     APIError,
     AuthenticationError,
@@ -20,6 +27,8 @@ from .errors import (
     TimeoutError,
     ValidationError,
 )
+from .ratelimit import RateLimiter
+from .singleflight import AsyncSingleFlight, SingleFlight
 
 logger = logging.getLogger("hookbase")
 
@@ -76,6 +85,73 @@ def _backoff(attempt: int) -> float:
     return base + jitter
 
 
+def _response_error(resp: httpx.Response) -> APIError:
+    """Build the typed error for a non-success response (body must be read)."""
+    try:
+        body = resp.json()
+    except Exception:
+        body = {}
+
+    error = _parse_error(resp.status_code, body, resp.headers.get("x-request-id"))
+
+    # For 429, use Retry-After header
+    if isinstance(error, RateLimitError):
+        retry_after_header = resp.headers.get("retry-after")
+        if retry_after_header:
+            try:
+                error.retry_after = float(retry_after_header)
+            except ValueError:
+                pass
+    return error
+
+
+def _retry_delay(error: APIError, attempt: int, limiter: RateLimiter | None) -> float:
+    """Seconds to sleep before retrying after *error*."""
+    if isinstance(error, RateLimitError):
+        if limiter is not None:
+            # The limiter's pause gate holds this and every other caller.
+            limiter.pause(error.retry_after)
+            return 0.0
+        return error.retry_after
+    return _backoff(attempt)
+
+
+def _build_timeout(
+    timeout: float,
+    connect: float | None,
+    read: float | None,
+    write: float | None,
+    pool: float | None,
+) -> httpx.Timeout:
+    """Split *timeout* into phases; any phase left as ``None`` uses *timeout*."""
+    return httpx.Timeout(
+        timeout,
+        connect=timeout if connect is None else connect,
+        read=timeout if read is None else read,
+        write=timeout if write is None else write,
+        pool=timeout if pool is None else pool,
+    )
+
+
+def _request_key(path: str, params: dict[str, Any] | None) -> str:
+    """Key identifying a GET by path and (order-independent) query params."""
+    query = str(httpx.QueryParams(sorted(params.items()))) if params else ""
+    return f"{path}?{query}"
+
+
+def _encode(
+    codec: JSONCodec, body: Any, headers: dict[str, str]
+) -> tuple[bytes | None, dict[str, str]]:
+    """Serialize a JSON request body with *codec*, adding its Content-Type.
+
+    A ``bytes`` body is taken to be JSON encoded already and sent as-is.
+    """
+    if body is None:
+        return None, headers
+    content = body if isinstance(body, bytes) else codec.dumps(body)
+    return content, {**headers, "Content-Type": "application/json"}
+
+
 def _clean_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
     if params is None:
         return None
@@ -93,6 +169,16 @@ class SyncTransport:
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
         http_client: httpx.Client | None = None,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        single_flight: SingleFlight | None = None,
+        cache: ResponseCache | None = None,
+        codec: JSONCodec | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
@@ -103,9 +189,33 @@ class SyncTransport:
         self._client = http_client or httpx.Client(
             base_url=self._base_url,
             headers=self._headers,
-            timeout=timeout,
+            timeout=_build_timeout(
+                timeout, connect_timeout, read_timeout, write_timeout, pool_timeout
+            ),
+            limits=limits or httpx.Limits(),
+            http2=http2,
         )
         self._owns_client = http_client is None
+        self._rate_limiter = rate_limiter
+        self._single_flight = single_flight
+        self._cache = cache
+        self._codec = codec or DEFAULT_CODEC
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        return self._single_flight
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def codec(self) -> JSONCodec:
+        return self._codec
 
     def request(
         self,
@@ -120,19 +230,69 @@ class SyncTransport:
         headers: dict[str, str] = {}
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
-
+        elif method == "GET" and self._single_flight is not None:
+            return self._single_flight.do(
+                _request_key(path, cleaned),
+                lambda: self._request(method, path, json, cleaned, headers),
+            )
+        return self._request(method, path, json, cleaned, headers)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Any,
+        cleaned: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> Any:
+        cache = self._cache
+        if cache is None:
+            return self._decode(self._fetch(method, path, json, cleaned, headers))
+        if method != "GET":
+            try:
+                return self._decode(self._fetch(method, path, json, cleaned, headers))
+            finally:
+                cache.invalidate(path)
+        if cache.ttl_for(path) is None:
+            return self._decode(self._fetch(method, path, json, cleaned, headers))
+
+        key = _request_key(path, cleaned)
+        content, etag = cache.lookup(key)
+        if content is not None:
+            return self._codec.loads(content)
+        conditional = {**headers, "If-None-Match": etag} if etag else headers
+        resp = self._fetch(method, path, json, cleaned, conditional)
+        if resp.status_code == 304:
+            content = cache.revalidated(key, path)
+            if content is not None:
+                return self._codec.loads(content)
+            # The entry was evicted in the meantime; fetch the full body.
+            resp = self._fetch(method, path, json, cleaned, headers)
+        if resp.status_code != 204:
+            cache.store(key, path, resp.content, resp.headers.get("etag"))
+        return self._decode(resp)
+
+    def _decode(self, resp: httpx.Response) -> Any:
+        return None if resp.status_code == 204 else self._codec.loads(resp.content)
+
+    def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: Any,
+        cleaned: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send with retries; return a 2xx (or 304 revalidation) response."""
         if self._debug:
             logger.debug("[Hookbase] %s %s params=%s", method, path, cleaned)
 
+        content, headers = _encode(self._codec, json, headers)
         last_exc: Exception | None = None
         for attempt in range(self._max_retries + 1):
             try:
-                resp = self._client.request(
-                    method,
-                    path,
-                    json=json,
-                    params=cleaned,
-                    headers=headers,
+                resp = self._send(
+                    method, path, content=content, params=cleaned, headers=headers
                 )
             except httpx.TimeoutException as exc:
                 last_exc = TimeoutError(f"Request timed out after {self._timeout}s")
@@ -148,30 +308,13 @@ class SyncTransport:
                     continue
                 raise last_exc from exc
 
-            request_id = resp.headers.get("x-request-id")
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(resp.status_code, resp.headers)
 
-            if resp.status_code == 204:
-                return None
+            if resp.is_success or resp.status_code == 304:
+                return resp
 
-            if resp.is_success:
-                return resp.json()
-
-            # Parse error body
-            try:
-                body = resp.json()
-            except Exception:
-                body = {}
-
-            error = _parse_error(resp.status_code, body, request_id)
-
-            # For 429, use Retry-After header
-            if isinstance(error, RateLimitError):
-                retry_after_header = resp.headers.get("retry-after")
-                if retry_after_header:
-                    try:
-                        error.retry_after = float(retry_after_header)
-                    except ValueError:
-                        pass
+            error = _response_error(resp)
 
             # Don't retry client errors (except 429 and 409)
             if not _should_retry(resp.status_code):
@@ -180,10 +323,7 @@ class SyncTransport:
             last_exc = error
 
             if attempt < self._max_retries:
-                if isinstance(error, RateLimitError):
-                    time.sleep(error.retry_after)
-                else:
-                    time.sleep(_backoff(attempt))
+                time.sleep(_retry_delay(error, attempt, self._rate_limiter))
             else:
                 raise error
 
@@ -191,6 +331,89 @@ class SyncTransport:
             raise last_exc
         raise NetworkError("Request failed after retries")  # pragma: no cover
 
+    def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        return self._client.request(method, path, **kwargs)
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[httpx.Response]:
+        """Send a request and yield the response with its body still unread.
+
+        Retries apply until a successful status line arrives. The caller then
+        consumes the body incrementally (e.g. ``resp.iter_bytes()``) and the
+        connection is released when the context exits.
+        """
+        resp = self._open_stream(method, path, _clean_params(params))
+        try:
+            yield resp
+        finally:
+            resp.close()
+
+    def _open_stream(
+        self, method: str, path: str, params: dict[str, Any] | None
+    ) -> httpx.Response:
+        if self._debug:
+            logger.debug("[Hookbase] %s %s params=%s (stream)", method, path, params)
+
+        for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                request = self._client.build_request(method, path, params=params)
+                resp = self._client.send(request, stream=True)
+            except httpx.TimeoutException as exc:
+                if attempt < self._max_retries:
+                    time.sleep(_backoff(attempt))
+                    continue
+                raise TimeoutError(f"Request timed out after {self._timeout}s") from exc
+            except httpx.HTTPError as exc:
+                if attempt < self._max_retries:
+                    time.sleep(_backoff(attempt))
+                    continue
+                raise NetworkError(str(exc), cause=exc) from exc
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(resp.status_code, resp.headers)
+
+            if resp.is_success:
+                return resp
+
+            resp.read()
+            resp.close()
+            error = _response_error(resp)
+            if not _should_retry(resp.status_code) or attempt >= self._max_retries:
+                raise error
+            time.sleep(_retry_delay(error, attempt, self._rate_limiter))
+
+        raise NetworkError("Request failed after retries")  # pragma: no cover
+
+    def warmup(self, connections: int = 1) -> None:
+        """Open *connections* pooled connections ahead of the first request.
+
+        Sends that many ``HEAD /`` requests concurrently so each one performs
+        its own TCP and TLS handshake; the connections then stay in the
+        keep-alive pool. Rate limiting and retries do not apply.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        for _ in map_bounded(self._warm_connection, range(connections), connections):
+            pass
+
+    def _warm_connection(self, _: int) -> None:
+        try:
+            self._client.request("HEAD", "/")
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(f"Request timed out after {self._timeout}s") from exc
+        except httpx.HTTPError as exc:
+            raise NetworkError(str(exc), cause=exc) from exc
+
     def close(self) -> None:
         if self._owns_client:
             self._client.close()
@@ -207,6 +430,17 @@ class AsyncTransport:
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
         http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        single_flight: AsyncSingleFlight | None = None,
+        cache: ResponseCache | None = None,
+        codec: JSONCodec | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
@@ -217,9 +451,38 @@ class AsyncTransport:
         self._client = http_client or httpx.AsyncClient(
             base_url=self._base_url,
             headers=self._headers,
-            timeout=timeout,
+            timeout=_build_timeout(
+                timeout, connect_timeout, read_timeout, write_timeout, pool_timeout
+            ),
+            limits=limits or httpx.Limits(),
+            http2=http2,
         )
         self._owns_client = http_client is None
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._single_flight = single_flight
+        self._cache = cache
+        self._codec = codec or DEFAULT_CODEC
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def single_flight(self) -> AsyncSingleFlight | None:
+        return self._single_flight
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def codec(self) -> JSONCodec:
+        return self._codec
+
+    @property
+    def concurrency_limiter(self) -> ConcurrencyLimiter | None:
+        return self._concurrency_limiter
 
     async def request(
         self,
@@ -230,25 +493,73 @@ class AsyncTransport:
         params: dict[str, Any] | None = None,
         idempotency_key: str | None = None,
     ) -> Any:
-        import asyncio
-
         cleaned = _clean_params(params)
         headers: dict[str, str] = {}
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
-
+        elif method == "GET" and self._single_flight is not None:
+            return await self._single_flight.do(
+                _request_key(path, cleaned),
+                lambda: self._request(method, path, json, cleaned, headers),
+            )
+        return await self._request(method, path, json, cleaned, headers)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Any,
+        cleaned: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> Any:
+        cache = self._cache
+        if cache is None:
+            return self._decode(await self._fetch(method, path, json, cleaned, headers))
+        if method != "GET":
+            try:
+                return self._decode(await self._fetch(method, path, json, cleaned, headers))
+            finally:
+                cache.invalidate(path)
+        if cache.ttl_for(path) is None:
+            return self._decode(await self._fetch(method, path, json, cleaned, headers))
+
+        key = _request_key(path, cleaned)
+        content, etag = cache.lookup(key)
+        if content is not None:
+            return self._codec.loads(content)
+        conditional = {**headers, "If-None-Match": etag} if etag else headers
+        resp = await self._fetch(method, path, json, cleaned, conditional)
+        if resp.status_code == 304:
+            content = cache.revalidated(key, path)
+            if content is not None:
+                return self._codec.loads(content)
+            # The entry was evicted in the meantime; fetch the full body.
+            resp = await self._fetch(method, path, json, cleaned, headers)
+        if resp.status_code != 204:
+            cache.store(key, path, resp.content, resp.headers.get("etag"))
+        return self._decode(resp)
+
+    def _decode(self, resp: httpx.Response) -> Any:
+        return None if resp.status_code == 204 else self._codec.loads(resp.content)
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: Any,
+        cleaned: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send with retries; return a 2xx (or 304 revalidation) response."""
         if self._debug:
             logger.debug("[Hookbase] %s %s params=%s", method, path, cleaned)
 
+        content, headers = _encode(self._codec, json, headers)
         last_exc: Exception | None = None
         for attempt in range(self._max_retries + 1):
             try:
-                resp = await self._client.request(
-                    method,
-                    path,
-                    json=json,
-                    params=cleaned,
-                    headers=headers,
+                resp = await self._send(
+                    method, path, content=content, params=cleaned, headers=headers
                 )
             except httpx.TimeoutException as exc:
                 last_exc = TimeoutError(f"Request timed out after {self._timeout}s")
@@ -264,28 +575,13 @@ class AsyncTransport:
                     continue
                 raise last_exc from exc
 
-            request_id = resp.headers.get("x-request-id")
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(resp.status_code, resp.headers)
 
-            if resp.status_code == 204:
-                return None
+            if resp.is_success or resp.status_code == 304:
+                return resp
 
-            if resp.is_success:
-                return resp.json()
-
-            try:
-                body = resp.json()
-            except Exception:
-                body = {}
-
-            error = _parse_error(resp.status_code, body, request_id)
-
-            if isinstance(error, RateLimitError):
-                retry_after_header = resp.headers.get("retry-after")
-                if retry_after_header:
-                    try:
-                        error.retry_after = float(retry_after_header)
-                    except ValueError:
-                        pass
+            error = _response_error(resp)
 
             if not _should_retry(resp.status_code):
                 raise error
@@ -293,10 +589,7 @@ class AsyncTransport:
             last_exc = error
 
             if attempt < self._max_retries:
-                if isinstance(error, RateLimitError):
-                    await asyncio.sleep(error.retry_after)
-                else:
-                    await asyncio.sleep(_backoff(attempt))
+                await asyncio.sleep(_retry_delay(error, attempt, self._rate_limiter))
             else:
                 raise error
 
@@ -304,6 +597,104 @@ class AsyncTransport:
             raise last_exc
         raise NetworkError("Request failed after retries")  # pragma: no cover
 
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            return await self._client.request(method, path, **kwargs)
+
+        await limiter.acquire()
+        started = time.monotonic()
+        try:
+            resp = await self._client.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            limiter.release(time.monotonic() - started, overloaded=True)
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+        limiter.release(
+            time.monotonic() - started,
+            overloaded=resp.status_code == 429 or resp.status_code >= 500,
+        )
+        return resp
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a request and yield the response with its body still unread.
+
+        Retries apply until a successful status line arrives. The caller then
+        consumes the body incrementally (e.g. ``resp.aiter_bytes()``) and the
+        connection is released when the context exits.
+        """
+        resp = await self._open_stream(method, path, _clean_params(params))
+        try:
+            yield resp
+        finally:
+            await resp.aclose()
+
+    async def _open_stream(
+        self, method: str, path: str, params: dict[str, Any] | None
+    ) -> httpx.Response:
+        if self._debug:
+            logger.debug("[Hookbase] %s %s params=%s (stream)", method, path, params)
+
+        for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            try:
+                request = self._client.build_request(method, path, params=params)
+                resp = await self._client.send(request, stream=True)
+            except httpx.TimeoutException as exc:
+                if attempt < self._max_retries:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                raise TimeoutError(f"Request timed out after {self._timeout}s") from exc
+            except httpx.HTTPError as exc:
+                if attempt < self._max_retries:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                raise NetworkError(str(exc), cause=exc) from exc
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(resp.status_code, resp.headers)
+
+            if resp.is_success:
+                return resp
+
+            await resp.aread()
+            await resp.aclose()
+            error = _response_error(resp)
+            if not _should_retry(resp.status_code) or attempt >= self._max_retries:
+                raise error
+            await asyncio.sleep(_retry_delay(error, attempt, self._rate_limiter))
+
+        raise NetworkError("Request failed after retries")  # pragma: no cover
+
+    async def warmup(self, connections: int = 1) -> None:
+        """Open *connections* pooled connections ahead of the first request.
+
+        Async counterpart of :meth:`SyncTransport.warmup`.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        await asyncio.gather(*(self._warm_connection() for _ in range(connections)))
+
+    async def _warm_connection(self) -> None:
+        try:
+            await self._client.request("HEAD", "/")
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(f"Request timed out after {self._timeout}s") from exc
+        except httpx.HTTPError as exc:
+            raise NetworkError(str(exc), cause=exc) from exc
+
     async def close(self) -> None:
         if self._owns_client:
             await self._client.aclose()
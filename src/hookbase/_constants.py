@@ -2,3 +2,6 @@ DEFAULT_BASE_URL = "https://api.hookbase.app"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
@@ -1,14 +1,144 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
-from typing import Any, Generic, TypeVar
-
-from pydantic import TypeAdapter
-
+import asyncio
+import math
+import queue
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from typing import Any, Generic, TypeVar, Union
+
+from . import _validation
 from ._client import AsyncTransport, SyncTransport
+from ._parallel import async_map_bounded, map_bounded
 
 T = TypeVar("T")
 
+DEFAULT_PAGE_SIZE = 20
+
+
+class PageNumberPagination:
+    """Pagination driven by ``page``/``pageSize`` query parameters.
+
+    Args:
+        data_key: Response key holding the items (falls back to ``data``).
+        page_param: Query parameter carrying the 1-based page number.
+        page_size_param: Query parameter carrying the page size.
+    """
+
+    def __init__(
+        self,
+        data_key: str | None = None,
+        *,
+        page_param: str = "page",
+        page_size_param: str = "pageSize",
+    ) -> None:
+        self.data_key = data_key
+        self.page_param = page_param
+        self.page_size_param = page_size_param
+
+    def page_params(self, params: dict[str, Any], page: int, page_size: int) -> dict[str, Any]:
+        """Return the query parameters that request page *page* directly."""
+        return {**params, self.page_param: page}
+
+    def extract(
+        self, resp: Any, params: dict[str, Any]
+    ) -> tuple[list[Any], int, int, int]:
+        """Return ``(items, total, page, page_size)`` from a response."""
+        if not isinstance(resp, dict):
+            return [], 0, 1, DEFAULT_PAGE_SIZE
+        pagination: dict[str, Any] = resp.get("pagination") or {}
+        total = pagination.get("total", 0)
+        page = pagination.get("page", params.get(self.page_param, 1))
+        page_size = pagination.get(
+            "pageSize",
+            pagination.get("page_size", params.get(self.page_size_param, DEFAULT_PAGE_SIZE)),
+        )
+        return _extract_items(resp, self.data_key), total, page, page_size
+
+
+class LimitOffsetPagination:
+    """Pagination driven by ``limit``/``offset`` query parameters.
+
+    Page numbers are derived from the offset, so page *k* maps to
+    ``offset = (k - 1) * limit``.
+
+    Args:
+        data_key: Response key holding the items (falls back to ``data``).
+        limit_param: Query parameter carrying the page size.
+        offset_param: Query parameter carrying the item offset.
+    """
+
+    def __init__(
+        self,
+        data_key: str | None = None,
+        *,
+        limit_param: str = "limit",
+        offset_param: str = "offset",
+    ) -> None:
+        self.data_key = data_key
+        self.limit_param = limit_param
+        self.offset_param = offset_param
+
+    def page_params(self, params: dict[str, Any], page: int, page_size: int) -> dict[str, Any]:
+        """Return the query parameters that request page *page* directly."""
+        if page_size < 1:
+            raise ValueError(f"Cannot address pages of size {page_size}; limit must be at least 1")
+        # Keep any unaligned starting offset so pages never overlap.
+        origin = int(params.get(self.offset_param, 0)) % page_size
+        return {
+            **params,
+            self.limit_param: page_size,
+            self.offset_param: (page - 1) * page_size + origin,
+        }
+
+    def extract(
+        self, resp: Any, params: dict[str, Any]
+    ) -> tuple[list[Any], int, int, int]:
+        """Return ``(items, total, page, page_size)`` from a response."""
+        if not isinstance(resp, dict):
+            return [], 0, 1, DEFAULT_PAGE_SIZE
+        pagination: dict[str, Any] = resp.get("pagination") or {}
+        total = int(pagination.get("total") or resp.get("total") or 0)
+        limit = int(pagination.get(
+            "limit",
+            pagination.get("pageSize", params.get(self.limit_param, DEFAULT_PAGE_SIZE)),
+        ))
+        offset = int(pagination.get("offset", params.get(self.offset_param, 0)))
+        page = offset // limit + 1 if limit > 0 else 1
+        return _extract_items(resp, self.data_key), total, page, limit
+
+
+class CursorPagination:
+    """Pagination driven by an opaque ``cursor`` query parameter.
+
+    Args:
+        data_key: Response key holding the items (falls back to ``data``).
+        cursor_param: Query parameter carrying the cursor.
+    """
+
+    def __init__(self, data_key: str | None = None, *, cursor_param: str = "cursor") -> None:
+        self.data_key = data_key
+        self.cursor_param = cursor_param
+
+    def cursor_params(self, params: dict[str, Any], cursor: str | None) -> dict[str, Any]:
+        """Return the query parameters that request the page at *cursor*."""
+        return {**params, self.cursor_param: cursor}
+
+    def extract(self, resp: Any) -> tuple[list[Any], bool, str | None]:
+        """Return ``(items, has_more, next_cursor)`` from a response."""
+        if not isinstance(resp, dict):
+            return [], False, None
+        pagination: dict[str, Any] = resp.get("pagination") or {}
+        has_more = pagination.get("hasMore", pagination.get("has_more", False))
+        next_cursor = pagination.get("nextCursor", pagination.get("next_cursor"))
+        return _extract_items(resp, self.data_key), has_more, next_cursor
+
+
+OffsetPagination = Union[PageNumberPagination, LimitOffsetPagination]
+
+PAGE_NUMBER = PageNumberPagination()
+CURSOR = CursorPagination()
+
 
 class SyncOffsetPage(Generic[T]):
     """Offset-based paginated response (sync)."""
@@ -29,6 +159,7 @@ class SyncOffsetPage(Generic[T]):
         path: str,
         params: dict[str, Any],
         model: type[T],
+        strategy: OffsetPagination = PAGE_NUMBER,
     ) -> None:
         self.data = data
         self.total = total
@@ -38,20 +169,69 @@ class SyncOffsetPage(Generic[T]):
         self._path = path
         self._params = params
         self._model = model
+        self._strategy = strategy
 
     @property
     def has_more(self) -> bool:
-        return self.page * self.page_size < self.total
+        # A zero page size (e.g. ``limit=0``) cannot reach further pages.
+        return self.page_size > 0 and self.page * self.page_size < self.total
 
     def next_page(self) -> SyncOffsetPage[T]:
+        return self.get_page(self.page + 1)
+
+    def iter_pages(
+        self, *, concurrency: int = 4, ordered: bool = True
+    ) -> Iterator[SyncOffsetPage[T]]:
+        """Yield this page and every remaining page, fetched concurrently.
+
+        The remaining page numbers are derived from ``total`` and
+        ``page_size``, so up to *concurrency* requests run at once.
+
+        Args:
+            concurrency: Maximum number of pages fetched at the same time.
+            ordered: Yield pages in page order (default) rather than as
+                they arrive.
+        """
+        yield self
+        yield from map_bounded(
+            self.get_page, _remaining_pages(self), concurrency, ordered=ordered
+        )
+
+    def fetch_all(self, *, concurrency: int = 4, ordered: bool = True) -> list[T]:
+        """Fetch every remaining page concurrently and return all items."""
+        return [
+            item
+            for page in self.iter_pages(concurrency=concurrency, ordered=ordered)
+            for item in page.data
+        ]
+
+    def iter_unordered(self, *, concurrency: int = 4) -> Iterator[T]:
+        """Iterate over all items, yielding each page as soon as it arrives."""
+        for page in self.iter_pages(concurrency=concurrency, ordered=False):
+            yield from page.data
+
+    def get_page(self, page: int) -> SyncOffsetPage[T]:
+        """Fetch page *page* (1-based) of the same listing directly."""
         return _fetch_offset_page(
             self._transport,
             self._path,
-            {**self._params, "page": self.page + 1},
+            self._strategy.page_params(self._params, page, self.page_size),
             self._model,
+            strategy=self._strategy,
         )
 
-    def auto_paging_iter(self) -> Iterator[T]:
+    def auto_paging_iter(self, *, prefetch: int = 0) -> Generator[T, None, None]:
+        """Iterate over every item across all pages.
+
+        Args:
+            prefetch: Number of upcoming pages to fetch on a background
+                thread while the current page is consumed (default 0,
+                fetch strictly on demand).
+        """
+        if prefetch > 0:
+            for page in _prefetch_pages(self, prefetch):
+                yield from page.data
+            return
         page = self
         while True:
             yield from page.data
@@ -85,6 +265,7 @@ class AsyncOffsetPage(Generic[T]):
         path: str,
         params: dict[str, Any],
         model: type[T],
+        strategy: OffsetPagination = PAGE_NUMBER,
     ) -> None:
         self.data = data
         self.total = total
@@ -94,20 +275,78 @@ class AsyncOffsetPage(Generic[T]):
         self._path = path
         self._params = params
         self._model = model
+        self._strategy = strategy
 
     @property
     def has_more(self) -> bool:
-        return self.page * self.page_size < self.total
+        # A zero page size (e.g. ``limit=0``) cannot reach further pages.
+        return self.page_size > 0 and self.page * self.page_size < self.total
 
     async def next_page(self) -> AsyncOffsetPage[T]:
+        return await self.get_page(self.page + 1)
+
+    async def iter_pages(
+        self, *, concurrency: int = 4, ordered: bool = True
+    ) -> AsyncIterator[AsyncOffsetPage[T]]:
+        """Yield this page and every remaining page, fetched concurrently.
+
+        The remaining page numbers are derived from ``total`` and
+        ``page_size``, so up to *concurrency* requests run at once.
+
+        Args:
+            concurrency: Maximum number of pages fetched at the same time.
+            ordered: Yield pages in page order (default) rather than as
+                they arrive.
+        """
+        yield self
+        async for page in async_map_bounded(
+            self.get_page, _remaining_pages(self), concurrency, ordered=ordered
+        ):
+            yield page
+
+    async def fetch_all(self, *, concurrency: int = 4, ordered: bool = True) -> list[T]:
+        """Fetch every remaining page concurrently and return all items."""
+        return [
+            item
+            async for page in self.iter_pages(concurrency=concurrency, ordered=ordered)
+            for item in page.data
+        ]
+
+    async def iter_unordered(self, *, concurrency: int = 4) -> AsyncIterator[T]:
+        """Iterate over all items, yielding each page as soon as it arrives."""
+        async for page in self.iter_pages(concurrency=concurrency, ordered=False):
+            for item in page.data:
+                yield item
+
+    async def get_page(self, page: int) -> AsyncOffsetPage[T]:
+        """Fetch page *page* (1-based) of the same listing directly."""
         return await _async_fetch_offset_page(
             self._transport,
             self._path,
-            {**self._params, "page": self.page + 1},
+            self._strategy.page_params(self._params, page, self.page_size),
             self._model,
+            strategy=self._strategy,
         )
 
-    async def auto_paging_iter(self) -> AsyncIterator[T]:
+    async def auto_paging_iter(self, *, prefetch: int = 0) -> AsyncGenerator[T, None]:
+        """Iterate over every item across all pages.
+
+        Args:
+            prefetch: Number of upcoming pages to fetch in a background task
+                while the current page is consumed (default 0, fetch
+                strictly on demand).
+        """
+        if prefetch > 0:
+            pages = _async_prefetch_pages(self, prefetch)
+            try:
+                async for page in pages:
+                    for item in page.data:
+                        yield item
+            finally:
+                # Async generators are not closed when dropped; cancel the
+                # prefetch task now rather than at garbage collection.
+                await pages.aclose()
+            return
         page = self
         while True:
             for item in page.data:
@@ -140,6 +379,7 @@ class SyncCursorPage(Generic[T]):
         path: str,
         params: dict[str, Any],
         model: type[T],
+        strategy: CursorPagination = CURSOR,
     ) -> None:
         self.data = data
         self.has_more = has_more
@@ -148,16 +388,29 @@ class SyncCursorPage(Generic[T]):
         self._path = path
         self._params = params
         self._model = model
+        self._strategy = strategy
 
     def next_page(self) -> SyncCursorPage[T]:
         return _fetch_cursor_page(
             self._transport,
             self._path,
-            {**self._params, "cursor": self.next_cursor},
+            self._strategy.cursor_params(self._params, self.next_cursor),
             self._model,
+            strategy=self._strategy,
         )
 
-    def auto_paging_iter(self) -> Iterator[T]:
+    def auto_paging_iter(self, *, prefetch: int = 0) -> Generator[T, None, None]:
+        """Iterate over every item across all pages.
+
+        Args:
+            prefetch: Number of upcoming pages to fetch on a background
+                thread while the current page is consumed (default 0,
+                fetch strictly on demand).
+        """
+        if prefetch > 0:
+            for page in _prefetch_pages(self, prefetch):
+                yield from page.data
+            return
         page = self
         while True:
             yield from page.data
@@ -189,6 +442,7 @@ class AsyncCursorPage(Generic[T]):
         path: str,
         params: dict[str, Any],
         model: type[T],
+        strategy: CursorPagination = CURSOR,
     ) -> None:
         self.data = data
         self.has_more = has_more
@@ -197,16 +451,36 @@ class AsyncCursorPage(Generic[T]):
         self._path = path
         self._params = params
         self._model = model
+        self._strategy = strategy
 
     async def next_page(self) -> AsyncCursorPage[T]:
         return await _async_fetch_cursor_page(
             self._transport,
             self._path,
-            {**self._params, "cursor": self.next_cursor},
+            self._strategy.cursor_params(self._params, self.next_cursor),
             self._model,
+            strategy=self._strategy,
         )
 
-    async def auto_paging_iter(self) -> AsyncIterator[T]:
+    async def auto_paging_iter(self, *, prefetch: int = 0) -> AsyncGenerator[T, None]:
+        """Iterate over every item across all pages.
+
+        Args:
+            prefetch: Number of upcoming pages to fetch in a background task
+                while the current page is consumed (default 0, fetch
+                strictly on demand).
+        """
+        if prefetch > 0:
+            pages = _async_prefetch_pages(self, prefetch)
+            try:
+                async for page in pages:
+                    for item in page.data:
+                        yield item
+            finally:
+                # Async generators are not closed when dropped; cancel the
+                # prefetch task now rather than at garbage collection.
+                await pages.aclose()
+            return
         page = self
         while True:
             for item in page.data:
@@ -222,12 +496,120 @@ class AsyncCursorPage(Generic[T]):
         return len(self.data)
 
 
+def _remaining_pages(page: SyncOffsetPage[Any] | AsyncOffsetPage[Any]) -> range:
+    if page.page_size <= 0:
+        return range(0)
+    last = math.ceil(page.total / page.page_size)
+    return range(page.page + 1, last + 1)
+
+
+# --- Prefetching ---
+
+
+class _Done:
+    pass
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_DONE = _Done()
+_POLL_INTERVAL = 0.1
+
+
+def _prefetch_pages(first: Any, prefetch: int) -> Iterator[Any]:
+    """Yield *first* and every following page, fetching ahead on a thread.
+
+    At most *prefetch* pages are fetched but not yet handed to the consumer
+    at any time. Errors raised while fetching are re-raised in the consumer,
+    and closing the generator stops the background thread.
+    """
+    pages: queue.Queue[Any] = queue.Queue()
+    slots = threading.Semaphore(prefetch)
+    stop = threading.Event()
+
+    def _acquire_slot() -> bool:
+        while not stop.is_set():
+            if slots.acquire(timeout=_POLL_INTERVAL):
+                return True
+        return False
+
+    def _worker() -> None:
+        page = first
+        try:
+            while page.has_more:
+                if not _acquire_slot():
+                    return
+                page = page.next_page()
+                pages.put(page)
+            pages.put(_DONE)
+        except BaseException as exc:
+            pages.put(_Failure(exc))
+
+    thread = threading.Thread(target=_worker, name="hookbase-prefetch", daemon=True)
+    thread.start()
+    try:
+        yield first
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+async def _async_prefetch_pages(first: Any, prefetch: int) -> AsyncGenerator[Any, None]:
+    """Yield *first* and every following page, fetching ahead in a task.
+
+    At most *prefetch* pages are fetched but not yet handed to the consumer
+    at any time. Errors raised while fetching are re-raised in the consumer,
+    and closing the generator cancels the background task.
+    """
+    pages: asyncio.Queue[Any] = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def _worker() -> None:
+        page = first
+        try:
+            while page.has_more:
+                await slots.acquire()
+                page = await page.next_page()
+                pages.put_nowait(page)
+            pages.put_nowait(_DONE)
+        except Exception as exc:
+            pages.put_nowait(_Failure(exc))
+
+    task = asyncio.ensure_future(_worker())
+    try:
+        yield first
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            slots.release()
+            yield item
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
 # --- Helper functions for fetching pages ---
 
 
 def _parse_list(raw: Any, model: type[T]) -> list[T]:
-    adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
-    return adapter.validate_python(raw)
+    return _validation.parse_list(model, raw)
 
 
 def _fetch_offset_page(
@@ -236,10 +618,10 @@ def _fetch_offset_page(
     params: dict[str, Any],
     model: type[T],
     *,
-    data_key: str | None = None,
+    strategy: OffsetPagination = PAGE_NUMBER,
 ) -> SyncOffsetPage[T]:
     resp = transport.request("GET", path, params=params)
-    items, total, page, page_size = _extract_offset_data(resp, data_key)
+    items, total, page, page_size = strategy.extract(resp, params)
     return SyncOffsetPage(
         data=_parse_list(items, model),
         total=total,
@@ -249,6 +631,7 @@ def _fetch_offset_page(
         path=path,
         params=params,
         model=model,
+        strategy=strategy,
     )
 
 
@@ -258,10 +641,10 @@ async def _async_fetch_offset_page(
     params: dict[str, Any],
     model: type[T],
     *,
-    data_key: str | None = None,
+    strategy: OffsetPagination = PAGE_NUMBER,
 ) -> AsyncOffsetPage[T]:
     resp = await transport.request("GET", path, params=params)
-    items, total, page, page_size = _extract_offset_data(resp, data_key)
+    items, total, page, page_size = strategy.extract(resp, params)
     return AsyncOffsetPage(
         data=_parse_list(items, model),
         total=total,
@@ -271,6 +654,7 @@ async def _async_fetch_offset_page(
         path=path,
         params=params,
         model=model,
+        strategy=strategy,
     )
 
 
@@ -279,9 +663,11 @@ def _fetch_cursor_page(
     path: str,
     params: dict[str, Any],
     model: type[T],
+    *,
+    strategy: CursorPagination = CURSOR,
 ) -> SyncCursorPage[T]:
     resp = transport.request("GET", path, params=params)
-    items, has_more, next_cursor = _extract_cursor_data(resp)
+    items, has_more, next_cursor = strategy.extract(resp)
     return SyncCursorPage(
         data=_parse_list(items, model),
         has_more=has_more,
@@ -290,6 +676,7 @@ def _fetch_cursor_page(
         path=path,
         params=params,
         model=model,
+        strategy=strategy,
     )
 
 
@@ -298,9 +685,11 @@ async def _async_fetch_cursor_page(
     path: str,
     params: dict[str, Any],
     model: type[T],
+    *,
+    strategy: CursorPagination = CURSOR,
 ) -> AsyncCursorPage[T]:
     resp = await transport.request("GET", path, params=params)
-    items, has_more, next_cursor = _extract_cursor_data(resp)
+    items, has_more, next_cursor = strategy.extract(resp)
     return AsyncCursorPage(
         data=_parse_list(items, model),
         has_more=has_more,
@@ -309,47 +698,14 @@ async def _async_fetch_cursor_page(
         path=path,
         params=params,
         model=model,
+        strategy=strategy,
     )
 
 
-def _extract_offset_data(
-    resp: Any, data_key: str | None = None
-) -> tuple[list[Any], int, int, int]:
-    """Extract items + pagination from an offset-based API response."""
-    if not isinstance(resp, dict):
-        return [], 0, 1, 20
-
-    pagination = resp.get("pagination", {})
-    total = pagination.get("total", 0)
-    page = pagination.get("page", 1)
-    page_size = pagination.get("pageSize", pagination.get("page_size", 20))
-
+def _extract_items(resp: dict[str, Any], data_key: str | None) -> list[Any]:
+    """Return the item list stored under *data_key* (or ``data``)."""
     if data_key and data_key in resp:
         items = resp[data_key]
-    elif "data" in resp:
-        items = resp["data"]
     else:
-        # Try common keys
-        for key in ("sources", "destinations", "routes", "events", "deliveries",
-                     "transforms", "filters", "schemas", "cronJobs", "tunnels",
-                     "apiKeys", "members", "invites"):
-            if key in resp:
-                items = resp[key]
-                break
-        else:
-            items = []
-
-    return items if isinstance(items, list) else [], total, page, page_size
-
-
-def _extract_cursor_data(resp: Any) -> tuple[list[Any], bool, str | None]:
-    """Extract items + pagination from a cursor-based API response."""
-    if not isinstance(resp, dict):
-        return [], False, None
-
-    items = resp.get("data", [])
-    pagination = resp.get("pagination", {})
-    has_more = pagination.get("hasMore", pagination.get("has_more", False))
-    next_cursor = pagination.get("nextCursor", pagination.get("next_cursor"))
-
-    return items if isinstance(items, list) else [], has_more, next_cursor
+        items = resp.get("data", [])
+    return items if isinstance(items, list) else []
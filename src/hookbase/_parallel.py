@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+
+def map_bounded(
+    fn: Callable[[A], R],
+    items: Iterable[A],
+    concurrency: int,
+    *,
+    ordered: bool = True,
+) -> Generator[R, None, None]:
+    """Apply *fn* to *items* on a thread pool with at most *concurrency* in flight.
+
+    Items are pulled from *items* lazily, so the input may be a generator.
+    Results are yielded in input order when *ordered* is true, otherwise as
+    each call completes. The first exception raised by *fn* propagates to
+    the caller; closing the iterator cancels calls that have not started.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = iter(items)
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="hookbase")
+    try:
+        if ordered:
+            queue: deque[Future[R]] = deque()
+            for item in source:
+                queue.append(pool.submit(fn, item))
+                if len(queue) >= concurrency:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        else:
+            pending: set[Future[R]] = set()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(fn, item))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_map_bounded(
+    fn: Callable[[A], Awaitable[R]],
+    items: Iterable[A] | AsyncIterable[A],
+    concurrency: int,
+    *,
+    ordered: bool = True,
+) -> AsyncGenerator[R, None]:
+    """Await *fn* over *items* with at most *concurrency* calls in flight.
+
+    Async counterpart of :func:`map_bounded`; *items* may also be an async
+    iterable, pulled lazily like a sync one. Closing the iterator cancels
+    any calls still running.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    source = _aiter(items)
+    tasks: set[asyncio.Future[R]] = set()
+    try:
+        if ordered:
+            queue: deque[asyncio.Future[R]] = deque()
+            async for item in source:
+                task = asyncio.ensure_future(fn(item))
+                tasks.add(task)
+                queue.append(task)
+                if len(queue) >= concurrency:
+                    head = queue.popleft()
+                    tasks.discard(head)
+                    yield await head
+            while queue:
+                head = queue.popleft()
+                tasks.discard(head)
+                yield await head
+        else:
+            exhausted = False
+            while True:
+                while not exhausted and len(tasks) < concurrency:
+                    try:
+                        item = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    tasks.add(asyncio.ensure_future(fn(item)))
+                if not tasks:
+                    break
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    yield finished.result()
+    finally:
+        for unfinished in tasks:
+            unfinished.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await source.aclose()
+
+
+async def _aiter(items: Iterable[A] | AsyncIterable[A]) -> AsyncGenerator[A, None]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import codecs
+import contextlib
+import csv
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from typing import IO, Any, Union
+
+from .errors import HookbaseError
+
+ExportDestination = Union[str, "os.PathLike[str]", IO[bytes]]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class NDJSONParser:
+    """Incrementally parse newline-delimited JSON."""
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> list[Any]:
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def close(self) -> list[Any]:
+        rest, self._buffer = self._buffer, b""
+        return [json.loads(rest)] if rest.strip() else []
+
+
+class CSVParser:
+    """Incrementally parse CSV with a header row into dicts.
+
+    Quoted fields may contain newlines; a record is complete once it holds
+    an even number of quote characters.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._pending = ""
+        self._record = ""
+        self._fieldnames: list[str] | None = None
+
+    def feed(self, data: bytes) -> list[Any]:
+        self._pending += self._decoder.decode(data)
+        *lines, self._pending = self._pending.split("\n")
+        return self._consume(lines)
+
+    def close(self) -> list[Any]:
+        self._pending += self._decoder.decode(b"", final=True)
+        lines = [self._pending] if self._pending else []
+        self._pending = ""
+        rows = self._consume(lines)
+        if self._record:
+            raise HookbaseError("Export ended inside a quoted CSV field")
+        return rows
+
+    def _consume(self, lines: list[str]) -> list[Any]:
+        rows: list[Any] = []
+        for line in lines:
+            self._record = f"{self._record}\n{line}" if self._record else line
+            if self._record.count('"') % 2:
+                continue
+            record, self._record = self._record, ""
+            if not record.strip():
+                continue
+            values = next(csv.reader([record.rstrip("\r")]))
+            if self._fieldnames is None:
+                self._fieldnames = values
+            else:
+                rows.append(dict(zip(self._fieldnames, values)))
+        return rows
+
+
+class JSONArrayParser:
+    """Incrementally parse the elements of a JSON array.
+
+    The array may be the top-level value or wrapped in an object such as
+    ``{"data": [...]}``, in which case the first array found is streamed.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._in_array = False
+        self._done = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, data: bytes) -> list[Any]:
+        return self._parse(self._decoder.decode(data), final=False)
+
+    def close(self) -> list[Any]:
+        items = self._parse(self._decoder.decode(b"", final=True), final=True)
+        if self._in_array and not self._done:
+            raise HookbaseError("Export ended inside a JSON array")
+        return items
+
+    def _parse(self, text: str, *, final: bool) -> list[Any]:
+        if self._done:
+            return []
+        if not self._in_array:
+            text = self._seek_array(text)
+            if not self._in_array:
+                return []
+        self._buffer += text
+
+        items: list[Any] = []
+        buf = self._buffer
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                self._done = True
+                pos = len(buf)
+                break
+            try:
+                item, end = self._json.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # A value touching the end of the buffer (e.g. a number) may be
+            # truncated; wait for the next chunk unless the stream is over.
+            if end >= len(buf) and not final:
+                break
+            items.append(item)
+            pos = end
+        self._buffer = buf[pos:]
+        return items
+
+    def _seek_array(self, text: str) -> str:
+        """Skip text up to the first ``[`` outside a string; return the rest."""
+        for index, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "[":
+                self._in_array = True
+                return text[index + 1:]
+        return ""
+
+
+def make_parser(format: str) -> NDJSONParser | CSVParser | JSONArrayParser:
+    """Return an incremental record parser for an export *format*."""
+    if format in ("ndjson", "jsonl"):
+        return NDJSONParser()
+    if format == "csv":
+        return CSVParser()
+    if format == "json":
+        return JSONArrayParser()
+    raise ValueError(f"Unsupported export format: {format!r}")
+
+
+@contextlib.contextmanager
+def open_destination(destination: ExportDestination) -> Iterator[IO[bytes]]:
+    """Yield a writable binary file for *destination*.
+
+    A path is written through a temporary file next to it and only replaces
+    the target once the block completes, so a failed export leaves any
+    existing file untouched. File objects are yielded as-is and not closed.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        yield destination
+        return
+    path = os.fspath(destination)
+    partial = f"{path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(partial, "xb") as file:
+            yield file
+        os.replace(partial, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(partial)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar("T")
+
+# Process-wide registry of compiled validators. Building a TypeAdapter
+# compiles a pydantic-core schema, which costs far more than validating a
+# typical response, so every adapter is built once per type and reused.
+_adapters: dict[Any, TypeAdapter[Any]] = {}
+_lock = threading.Lock()
+
+
+def get_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return the cached ``TypeAdapter`` for *tp*, building it on first use."""
+    adapter = _adapters.get(tp)
+    if adapter is None:
+        with _lock:
+            adapter = _adapters.get(tp)
+            if adapter is None:
+                adapter = TypeAdapter(tp)
+                _adapters[tp] = adapter
+    return adapter
+
+
+def parse(model: type[T], data: Any) -> T:
+    """Validate *data* as a single *model* instance."""
+    return get_adapter(model).validate_python(data)  # type: ignore[no-any-return]
+
+
+def parse_list(model: type[T], data: Any) -> list[T]:
+    """Validate *data* as a list of *model* instances."""
+    return get_adapter(list[model]).validate_python(data)  # type: ignore[valid-type,no-any-return]
+
+
+def warm_up(models: Iterable[type[Any]] | None = None) -> int:
+    """Pre-build validators for *models* and ``list[model]``.
+
+    Args:
+        models: Model types to compile. Defaults to every model exported
+            from ``hookbase.models``.
+
+    Returns:
+        Number of validators in the registry after warm-up.
+    """
+    if models is None:
+        from . import models as _models
+
+        candidates = (getattr(_models, name) for name in _models.__all__)
+        models = [
+            m for m in candidates if isinstance(m, type) and issubclass(m, BaseModel)
+        ]
+    for model in models:
+        get_adapter(model)
+        get_adapter(list[model])  # type: ignore[valid-type]
+    return len(_adapters)
+
+
+def clear() -> None:
+    """Drop every cached validator (mainly useful in tests and benchmarks)."""
+    with _lock:
+        _adapters.clear()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import math
+import time
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from typing import Any, NamedTuple
+
+from .models.messages import SendEventParams, SendEventResponse
+
+DEFAULT_SEND_CONCURRENCY = 8
+
+
+class SendResult(NamedTuple):
+    """Outcome of one item sent by ``send_many``.
+
+    ``position`` is the item's index in the input. Exactly one of
+    ``response`` and ``error`` is set. ``item`` is the normalized
+    :class:`SendEventParams`, or the raw dict if it failed validation.
+    ``idempotency_key`` is the key the item was sent with; resending a
+    failed item with the same key cannot deliver it twice.
+    """
+
+    position: int
+    item: SendEventParams | dict[str, Any]
+    idempotency_key: str
+    response: SendEventResponse | None
+    error: Exception | None
+    latency: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SendStats(NamedTuple):
+    """Throughput and latency of a ``send_many`` batch.
+
+    Latencies are in seconds and include client-side retries.
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float
+    throughput: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.results: list[SendResult] = []
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.done = False
+        self.stopped = False
+
+    def start(self) -> None:
+        if self.started is None:
+            self.started = time.monotonic()
+
+    def record(self, result: SendResult) -> SendResult:
+        self.results.append(result)
+        self.finished = time.monotonic()
+        return result
+
+    def stats(self) -> SendStats:
+        latencies = sorted(r.latency for r in self.results)
+        failed = sum(1 for r in self.results if r.error is not None)
+        elapsed = (
+            self.finished - self.started
+            if self.started is not None and self.finished is not None
+            else 0.0
+        )
+        return SendStats(
+            total=len(self.results),
+            succeeded=len(self.results) - failed,
+            failed=failed,
+            elapsed=elapsed,
+            throughput=len(self.results) / elapsed if elapsed > 0 else 0.0,
+            latency_p50=_percentile(latencies, 50),
+            latency_p95=_percentile(latencies, 95),
+            latency_p99=_percentile(latencies, 99),
+            latency_max=latencies[-1] if latencies else 0.0,
+        )
+
+
+class SendManyResult:
+    """Results of :meth:`Messages.send_many`, streamed as they arrive.
+
+    Iterate to receive a :class:`SendResult` per item, in input order or in
+    completion order depending on ``ordered``. Nothing is sent until the
+    first iteration or :meth:`wait`; a batch dropped before that warns that
+    no events were sent. If iteration stops early (e.g. on ``break``), the
+    items not yet started are cancelled and the batch cannot be resumed.
+    ``results``, ``errors`` and ``stats`` cover every item received so far.
+
+    Example::
+
+        batch = client.outbound.messages.send_many("app_123", events, concurrency=16)
+        for result in batch:
+            if not result.ok:
+                print(result.position, result.error)
+        print(batch.stats.throughput, batch.stats.latency_p95)
+    """
+
+    def __init__(self, results: Generator[SendResult, None, None]) -> None:
+        self._source = results
+        self._recorder = _Recorder()
+
+    def __iter__(self) -> Iterator[SendResult]:
+        if self._recorder.done or self._recorder.stopped:
+            return
+        self._recorder.start()
+        try:
+            for result in self._source:
+                yield self._recorder.record(result)
+            self._recorder.done = True
+        finally:
+            if not self._recorder.done:
+                self._recorder.stopped = True
+                self._source.close()
+
+    def __del__(self) -> None:
+        _warn_if_unsent(self._recorder)
+
+    def wait(self) -> SendManyResult:
+        """Send every remaining item and return ``self``.
+
+        Call this (or iterate) to actually send the batch.
+        """
+        for _ in self:
+            pass
+        return self
+
+    @property
+    def done(self) -> bool:
+        """Whether every item has been sent."""
+        return self._recorder.done
+
+    @property
+    def results(self) -> list[SendResult]:
+        return list(self._recorder.results)
+
+    @property
+    def errors(self) -> list[SendResult]:
+        """Results of the items that failed."""
+        return [r for r in self._recorder.results if r.error is not None]
+
+    @property
+    def stats(self) -> SendStats:
+        return self._recorder.stats()
+
+
+class AsyncSendManyResult:
+    """Results of :meth:`AsyncMessages.send_many`, streamed as they arrive.
+
+    Async counterpart of :class:`SendManyResult`: use ``async for`` or
+    ``await batch.wait()``.
+    """
+
+    def __init__(self, results: AsyncGenerator[SendResult, None]) -> None:
+        self._source = results
+        self._recorder = _Recorder()
+
+    async def __aiter__(self) -> AsyncIterator[SendResult]:
+        if self._recorder.done or self._recorder.stopped:
+            return
+        self._recorder.start()
+        try:
+            async for result in self._source:
+                yield self._recorder.record(result)
+            self._recorder.done = True
+        finally:
+            if not self._recorder.done:
+                self._recorder.stopped = True
+                await self._source.aclose()
+
+    def __del__(self) -> None:
+        _warn_if_unsent(self._recorder)
+
+    async def wait(self) -> AsyncSendManyResult:
+        """Send every remaining item and return ``self``.
+
+        Await this (or iterate) to actually send the batch.
+        """
+        async for _ in self:
+            pass
+        return self
+
+    @property
+    def done(self) -> bool:
+        """Whether every item has been sent."""
+        return self._recorder.done
+
+    @property
+    def results(self) -> list[SendResult]:
+        return list(self._recorder.results)
+
+    @property
+    def errors(self) -> list[SendResult]:
+        """Results of the items that failed."""
+        return [r for r in self._recorder.results if r.error is not None]
+
+    @property
+    def stats(self) -> SendStats:
+        return self._recorder.stats()
+
+
+def _warn_if_unsent(recorder: _Recorder) -> None:
+    if recorder.started is None:
+        warnings.warn(
+            "send_many() batch was never iterated or waited on; no events were sent",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import NamedTuple
+
+# Read-mostly configuration resources cached by default, keyed by path prefix.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/api/sources": 60.0,
+    "/api/destinations": 60.0,
+    "/api/routes": 60.0,
+    "/api/filters": 60.0,
+    "/api/transforms": 60.0,
+    "/api/schemas": 60.0,
+    "/api/event-types": 60.0,
+    "/api/webhook-applications": 60.0,
+}
+
+# Live state and secrets under cached resources that must always be fetched.
+_NEVER_CACHED = ("/circuit-status", "/reveal-secret")
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body.
+
+    ``content`` holds the raw JSON bytes so entries are safe to share and to
+    store out of process; ``expires_at`` is a Unix timestamp.
+    """
+
+    content: bytes
+    etag: str | None
+    expires_at: float
+
+
+class CacheBackend(ABC):
+    """Storage interface for :class:`ResponseCache`.
+
+    Implement this to share cached responses between processes (e.g. in
+    Redis). Backends may evict entries at any time; expired entries should
+    be kept while space allows so they can be revalidated with their ETag.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under *key*, if any."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store *entry* under *key*, replacing any existing entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under *key*, if any."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every entry for the path *prefix* or a path below it.
+
+        Match on a path-segment boundary: ``/api/routes`` covers
+        ``/api/routes?...`` and ``/api/routes/rt_1`` but not
+        ``/api/routes-archive``.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class InMemoryCache(CacheBackend):
+    """Thread-safe in-process LRU backend bounded to *max_entries*."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        below = (prefix + "/", prefix + "?")
+        with self._lock:
+            for key in [k for k in self._entries if k == prefix or k.startswith(below)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """TTL cache for GET responses of read-mostly resources.
+
+    GET responses under a configured path prefix are served from the cache
+    until their TTL expires; after that, a response that carried an ``ETag``
+    is revalidated with ``If-None-Match`` and a ``304`` refreshes it without
+    a new body. Any other request method under the same resource (create,
+    update, delete, bulk and import operations) invalidates every cached
+    response for that resource.
+
+    Args:
+        backend: Where entries are stored (default: an :class:`InMemoryCache`).
+        ttls: Seconds to cache responses for, keyed by path prefix such as
+            ``"/api/sources"``; the longest matching prefix wins and paths
+            that match none are not cached. Defaults to
+            :data:`DEFAULT_CACHE_TTLS`. Circuit status and secrets are never
+            cached.
+
+    Example::
+
+        from hookbase import Hookbase, ResponseCache
+
+        cache = ResponseCache(ttls={"/api/sources": 300, "/api/routes": 30})
+        client = Hookbase(api_key="whr_...", cache=cache)
+        client.sources.get("src_123")  # network
+        client.sources.get("src_123")  # cache
+        print(cache.hits, cache.misses)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self._backend = backend if backend is not None else InMemoryCache()
+        rules = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        # Longest prefix first so the most specific rule wins.
+        self._ttls = sorted(rules.items(), key=lambda rule: len(rule[0]), reverse=True)
+        self._cached = tuple(prefix for prefix, ttl in self._ttls if ttl > 0)
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    @property
+    def hits(self) -> int:
+        """Requests answered from a fresh entry or a ``304`` revalidation."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Cacheable requests that needed a full response."""
+        return self._misses
+
+    @property
+    def revalidations(self) -> int:
+        """Expired entries confirmed unchanged by a ``304``."""
+        return self._revalidations
+
+    def ttl_for(self, path: str) -> float | None:
+        """Return the TTL for *path*, or ``None`` when it is not cacheable."""
+        if path.endswith(_NEVER_CACHED):
+            return None
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl if ttl > 0 else None
+        return None
+
+    def lookup(self, key: str) -> tuple[bytes | None, str | None]:
+        """Return ``(content, etag)`` for *key*.
+
+        ``content`` is set when a fresh entry exists; otherwise ``etag`` is
+        the validator of a stale entry to revalidate, if it had one.
+        """
+        entry = self._backend.get(key)
+        if entry is None:
+            return None, None
+        if entry.expires_at > time.time():
+            self._hits += 1
+            return entry.content, None
+        if entry.etag is None:
+            self._backend.delete(key)
+            return None, None
+        return None, entry.etag
+
+    def store(self, key: str, path: str, content: bytes, etag: str | None) -> None:
+        """Cache a full ``200`` response for *path*."""
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return
+        self._misses += 1
+        self._backend.set(key, CacheEntry(content, etag, time.time() + ttl))
+
+    def revalidated(self, key: str, path: str) -> bytes | None:
+        """Refresh the entry for *key* after a ``304`` and return its content."""
+        entry = self._backend.get(key)
+        ttl = self.ttl_for(path)
+        if entry is None or ttl is None:
+            return None
+        self._hits += 1
+        self._revalidations += 1
+        self._backend.set(key, entry._replace(expires_at=time.time() + ttl))
+        return entry.content
+
+    def invalidate(self, path: str) -> None:
+        """Drop every cached response for the resource that *path* belongs to.
+
+        Writes to resources with no TTL rule (such as ``/api/send-event``)
+        return at once without touching the backend.
+        """
+        resource = resource_prefix(path)
+        if any(_within(prefix, resource) or _within(resource, prefix) for prefix in self._cached):
+            self._backend.delete_prefix(resource)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._backend.clear()
+
+
+def resource_prefix(path: str) -> str:
+    """Return the resource collection a path belongs to, e.g. ``/api/sources``."""
+    return "/".join(path.split("/")[:3])
+
+
+def _within(path: str, prefix: str) -> bool:
+    return path == prefix or path.startswith(prefix.rstrip("/") + "/")
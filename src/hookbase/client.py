@@ -4,8 +4,21 @@ from typing import Any
 
 import httpx
 
+from . import _validation
 from ._client import AsyncTransport, SyncTransport
-from ._constants import DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+from ._constants import (
+    DEFAULT_BASE_URL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_TIMEOUT,
+)
+from .cache import ResponseCache
+from .codec import JSONCodec
+from .concurrency import ConcurrencyLimiter
+from .outbox import Outbox
+from .ratelimit import RateLimiter
 from .resources import (
     DLQ,
     Analytics,
@@ -50,6 +63,27 @@ from .resources import (
     Transforms,
     Tunnels,
 )
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _make_rate_limiter(rate_limit: float | RateLimiter | None) -> RateLimiter | None:
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate=rate_limit)
+
+
+def _make_concurrency_limiter(
+    adaptive_concurrency: bool | ConcurrencyLimiter,
+) -> ConcurrencyLimiter | None:
+    if isinstance(adaptive_concurrency, ConcurrencyLimiter):
+        return adaptive_concurrency
+    return ConcurrencyLimiter() if adaptive_concurrency else None
+
+
+def _make_cache(cache: bool | ResponseCache) -> ResponseCache | None:
+    if isinstance(cache, ResponseCache):
+        return cache
+    return ResponseCache() if cache else None
 
 
 class _OutboundNamespace:
@@ -60,12 +94,12 @@ class _OutboundNamespace:
         "messages", "message_log", "portal_tokens", "dlq",
     )
 
-    def __init__(self, transport: SyncTransport) -> None:
+    def __init__(self, transport: SyncTransport, outbox: Outbox | None = None) -> None:
         self.applications = Applications(transport)
         self.endpoints = Endpoints(transport)
         self.event_types = EventTypes(transport)
         self.subscriptions = Subscriptions(transport)
-        self.messages = Messages(transport)
+        self.messages = Messages(transport, outbox)
         self.message_log = MessageLog(transport)
         self.portal_tokens = PortalTokens(transport)
         self.dlq = DLQ(transport)
@@ -79,12 +113,12 @@ class _AsyncOutboundNamespace:
         "messages", "message_log", "portal_tokens", "dlq",
     )
 
-    def __init__(self, transport: AsyncTransport) -> None:
+    def __init__(self, transport: AsyncTransport, outbox: Outbox | None = None) -> None:
         self.applications = AsyncApplications(transport)
         self.endpoints = AsyncEndpoints(transport)
         self.event_types = AsyncEventTypes(transport)
         self.subscriptions = AsyncSubscriptions(transport)
-        self.messages = AsyncMessages(transport)
+        self.messages = AsyncMessages(transport, outbox)
         self.message_log = AsyncMessageLog(transport)
         self.portal_tokens = AsyncPortalTokens(transport)
         self.dlq = AsyncDLQ(transport)
@@ -100,6 +134,36 @@ class Hookbase:
         max_retries: Max retry attempts for transient failures (default: 3).
         debug: Enable debug logging of requests.
         http_client: Optional custom ``httpx.Client`` instance.
+        warm_validators: Compile the response validators for every model up
+            front instead of on first use (default: False).
+        rate_limit: Client-side rate limit shared by every resource, either
+            as requests per second or a :class:`RateLimiter` (default: none).
+        max_connections: Maximum concurrent connections in the pool
+            (default: 100).
+        max_keepalive_connections: Idle connections kept open for reuse
+            (default: 20).
+        keepalive_expiry: Seconds an idle connection stays in the pool
+            (default: 5).
+        http2: Negotiate HTTP/2 so requests multiplex over one connection.
+            Requires the ``http2`` extra (``pip install hookbase[http2]``).
+        connect_timeout: Seconds to wait for a connection (default: ``timeout``).
+        read_timeout: Seconds to wait for response data (default: ``timeout``).
+        write_timeout: Seconds to wait while sending the request body
+            (default: ``timeout``).
+        pool_timeout: Seconds to wait for a free pooled connection
+            (default: ``timeout``).
+        coalesce_requests: Share one network call between concurrent
+            identical GET requests; see :class:`SingleFlight` (default: False).
+        cache: Cache GET responses of read-mostly resources with per-resource
+            TTLs and ETag revalidation. Pass ``True`` for the defaults or a
+            configured :class:`ResponseCache` (default: False).
+        json_codec: Codec for request and response bodies (default:
+            :class:`OrjsonCodec` when orjson is installed, otherwise the
+            standard library).
+        outbox: Durable :class:`Outbox` that ``outbound.messages`` spools
+            events to when the API is unreachable (default: none).
+
+        The pool and timeout options are ignored when ``http_client`` is given.
 
     Example::
 
@@ -138,10 +202,27 @@ class Hookbase:
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
         http_client: httpx.Client | None = None,
+        warm_validators: bool = False,
+        rate_limit: float | RateLimiter | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        coalesce_requests: bool = False,
+        cache: bool | ResponseCache = False,
+        json_codec: JSONCodec | None = None,
+        outbox: Outbox | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("api_key is required")
 
+        if warm_validators:
+            _validation.warm_up()
+
         self._transport = SyncTransport(
             api_key=api_key,
             base_url=base_url,
@@ -149,6 +230,20 @@ class Hookbase:
             max_retries=max_retries,
             debug=debug,
             http_client=http_client,
+            rate_limiter=_make_rate_limiter(rate_limit),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            single_flight=SingleFlight() if coalesce_requests else None,
+            cache=_make_cache(cache),
+            codec=json_codec,
         )
 
         # Inbound resources
@@ -162,7 +257,7 @@ class Hookbase:
         self.schemas = Schemas(self._transport)
 
         # Outbound namespace
-        self.outbound = _OutboundNamespace(self._transport)
+        self.outbound = _OutboundNamespace(self._transport, outbox)
 
         # Admin resources
         self.organizations = Organizations(self._transport)
@@ -171,6 +266,39 @@ class Hookbase:
         self.cron_jobs = CronJobs(self._transport)
         self.tunnels = Tunnels(self._transport)
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The rate limiter shared by every resource, if one is configured."""
+        return self._transport.rate_limiter
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Request coalescer with hit/miss counters, if enabled."""
+        return self._transport.single_flight
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The GET response cache, if enabled."""
+        return self._transport.cache
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The codec serializing request bodies and parsing responses."""
+        return self._transport.codec
+
+    def warmup(self, connections: int = 1) -> None:
+        """Pre-open pooled connections so early requests skip the handshake.
+
+        Args:
+            connections: Number of connections to open concurrently. With
+                ``http2=True`` one connection carries every request.
+
+        Raises:
+            NetworkError: If a connection could not be established.
+            TimeoutError: If connecting timed out.
+        """
+        self._transport.warmup(connections)
+
     def close(self) -> None:
         """Close the underlying HTTP client."""
         self._transport.close()
@@ -192,6 +320,40 @@ class AsyncHookbase:
         max_retries: Max retry attempts for transient failures (default: 3).
         debug: Enable debug logging of requests.
         http_client: Optional custom ``httpx.AsyncClient`` instance.
+        warm_validators: Compile the response validators for every model up
+            front instead of on first use (default: False).
+        rate_limit: Client-side rate limit shared by every resource, either
+            as requests per second or a :class:`RateLimiter` (default: none).
+        max_connections: Maximum concurrent connections in the pool
+            (default: 100).
+        max_keepalive_connections: Idle connections kept open for reuse
+            (default: 20).
+        keepalive_expiry: Seconds an idle connection stays in the pool
+            (default: 5).
+        http2: Negotiate HTTP/2 so requests multiplex over one connection.
+            Requires the ``http2`` extra (``pip install hookbase[http2]``).
+        connect_timeout: Seconds to wait for a connection (default: ``timeout``).
+        read_timeout: Seconds to wait for response data (default: ``timeout``).
+        write_timeout: Seconds to wait while sending the request body
+            (default: ``timeout``).
+        pool_timeout: Seconds to wait for a free pooled connection
+            (default: ``timeout``).
+        adaptive_concurrency: Bound in-flight requests with an AIMD
+            :class:`ConcurrencyLimiter` that adapts to latency and 429/5xx
+            rates. Pass ``True`` for the defaults or a configured limiter.
+        coalesce_requests: Share one network call between concurrent
+            identical GET requests; see :class:`AsyncSingleFlight`
+            (default: False).
+        cache: Cache GET responses of read-mostly resources with per-resource
+            TTLs and ETag revalidation. Pass ``True`` for the defaults or a
+            configured :class:`ResponseCache` (default: False).
+        json_codec: Codec for request and response bodies (default:
+            :class:`OrjsonCodec` when orjson is installed, otherwise the
+            standard library).
+        outbox: Durable :class:`Outbox` that ``outbound.messages`` spools
+            events to when the API is unreachable (default: none).
+
+        The pool and timeout options are ignored when ``http_client`` is given.
 
     Example::
 
@@ -230,10 +392,28 @@ class AsyncHookbase:
         max_retries: int = DEFAULT_MAX_RETRIES,
         debug: bool = False,
         http_client: httpx.AsyncClient | None = None,
+        warm_validators: bool = False,
+        rate_limit: float | RateLimiter | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        adaptive_concurrency: bool | ConcurrencyLimiter = False,
+        coalesce_requests: bool = False,
+        cache: bool | ResponseCache = False,
+        json_codec: JSONCodec | None = None,
+        outbox: Outbox | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("api_key is required")
 
+        if warm_validators:
+            _validation.warm_up()
+
         self._transport = AsyncTransport(
             api_key=api_key,
             base_url=base_url,
@@ -241,6 +421,21 @@ class AsyncHookbase:
             max_retries=max_retries,
             debug=debug,
             http_client=http_client,
+            rate_limiter=_make_rate_limiter(rate_limit),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            concurrency_limiter=_make_concurrency_limiter(adaptive_concurrency),
+            single_flight=AsyncSingleFlight() if coalesce_requests else None,
+            cache=_make_cache(cache),
+            codec=json_codec,
         )
 
         # Inbound resources
@@ -254,7 +449,7 @@ class AsyncHookbase:
         self.schemas = AsyncSchemas(self._transport)
 
         # Outbound namespace
-        self.outbound = _AsyncOutboundNamespace(self._transport)
+        self.outbound = _AsyncOutboundNamespace(self._transport, outbox)
 
         # Admin resources
         self.organizations = AsyncOrganizations(self._transport)
@@ -263,6 +458,44 @@ class AsyncHookbase:
         self.cron_jobs = AsyncCronJobs(self._transport)
         self.tunnels = AsyncTunnels(self._transport)
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The rate limiter shared by every resource, if one is configured."""
+        return self._transport.rate_limiter
+
+    @property
+    def single_flight(self) -> AsyncSingleFlight | None:
+        """Request coalescer with hit/miss counters, if enabled."""
+        return self._transport.single_flight
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The GET response cache, if enabled."""
+        return self._transport.cache
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The codec serializing request bodies and parsing responses."""
+        return self._transport.codec
+
+    @property
+    def concurrency_limiter(self) -> ConcurrencyLimiter | None:
+        """The adaptive in-flight request limiter, if enabled."""
+        return self._transport.concurrency_limiter
+
+    async def warmup(self, connections: int = 1) -> None:
+        """Pre-open pooled connections so early requests skip the handshake.
+
+        Args:
+            connections: Number of connections to open concurrently. With
+                ``http2=True`` one connection carries every request.
+
+        Raises:
+            NetworkError: If a connection could not be established.
+            TimeoutError: If connecting timed out.
+        """
+        await self._transport.warmup(connections)
+
     async def close(self) -> None:
         """Close the underlying async HTTP client."""
         await self._transport.close()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONCodec(ABC):
+    """Encoder/decoder used for request bodies, response bodies and webhooks.
+
+    Implement this to plug in another JSON library. ``dumps`` must return
+    UTF-8 bytes and ``loads`` must accept ``str`` and any bytes-like object;
+    decode errors should subclass :class:`ValueError`. Codecs used with
+    ``Webhook.verify_batch(..., processes=True)`` must be picklable.
+    """
+
+    name: str = "custom"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON."""
+
+    @abstractmethod
+    def loads(self, data: JSONInput) -> Any:
+        """Parse a JSON document."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec backed by the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same output as httpx's own ``json=`` encoding.
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: JSONInput) -> Any:
+        # json.loads takes str, bytes and bytearray; a memoryview is decoded
+        # straight from its buffer rather than copied into bytes first.
+        if isinstance(data, memoryview):
+            data = str(data, "utf-8")
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    Several times faster than the standard library on large pages and
+    payloads. Integers beyond 64 bits decode as floats.
+
+    Raises:
+        ImportError: If orjson is not installed (``pip install hookbase[orjson]``).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson; install it with `pip install hookbase[orjson]`"
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: JSONInput) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """Return :class:`OrjsonCodec` when orjson is installed, else the stdlib codec."""
+    return OrjsonCodec() if orjson is not None else StdlibJSONCodec()
+
+
+STDLIB_CODEC = StdlibJSONCodec()
+DEFAULT_CODEC = default_codec()
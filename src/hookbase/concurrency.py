@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+
+
+class ConcurrencyLimiter:
+    """Adaptive (AIMD) limit on the number of in-flight requests.
+
+    The limit grows by roughly one request per round trip while the API keeps
+    up and is cut multiplicatively when it signals overload: a 429 or 5xx
+    response, a transport error, or latency well above the best latency seen
+    recently (in the spirit of TCP Vegas). Callers beyond the limit queue in
+    FIFO order, so ``asyncio.gather`` over many requests self-tunes to the
+    API's current capacity.
+
+    Args:
+        initial: Starting limit.
+        min_limit: Lowest limit the controller will back off to.
+        max_limit: Highest limit the controller will grow to.
+        backoff: Factor applied to the limit on overload (default 0.5).
+        latency_tolerance: Latency above ``tolerance * baseline`` counts as
+            overload (default 2.0).
+
+    Example::
+
+        from hookbase import AsyncHookbase, ConcurrencyLimiter
+
+        client = AsyncHookbase(api_key="whr_...", adaptive_concurrency=True)
+        await asyncio.gather(*(client.outbound.endpoints.get(i) for i in ids))
+        print(client.concurrency_limiter.limit)
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline: float | None = None
+        self._smoothed: float | None = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of in-flight requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for an in-flight slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled: hand it on.
+                self._in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float | None = None, *, overloaded: bool = False) -> None:
+        """Return a slot, feeding back the request's latency and outcome.
+
+        Args:
+            latency: Round-trip time in seconds, or ``None`` when the request
+                did not complete (e.g. it was cancelled) and carries no signal.
+            overloaded: Whether the API signalled overload (429, 5xx, error).
+        """
+        saturated = self._in_flight >= self.limit or bool(self._waiters)
+        self._in_flight -= 1
+        if latency is not None:
+            self._update(latency, overloaded=overloaded, saturated=saturated)
+        self._wake()
+
+    def _update(self, latency: float, *, overloaded: bool, saturated: bool) -> None:
+        self._smoothed = latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            # Let the baseline drift up slowly so a one-off fast response
+            # does not pin it forever.
+            self._baseline *= 1.001
+
+        congested = self._smoothed > self._baseline * self._latency_tolerance
+        if overloaded or congested:
+            now = time.monotonic()
+            # At most one decrease per round trip.
+            if now - self._last_decrease >= self._smoothed:
+                self._last_decrease = now
+                self._limit = max(float(self._min_limit), math.floor(self._limit * self._backoff))
+        elif saturated:
+            self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -164,3 +164,53 @@ class NetworkError(HookbaseError):
 
 class WebhookVerificationError(HookbaseError):
     """Raised when webhook signature verification fails."""
+
+
+class WebhookReplayError(WebhookVerificationError):
+    """Raised when a verified webhook's ``webhook-id`` was already received."""
+
+    webhook_id: str
+
+    def __init__(self, webhook_id: str) -> None:
+        super().__init__(f"Webhook {webhook_id} was already received")
+        self.webhook_id = webhook_id
+
+
+class QueueFullError(HookbaseError):
+    """Raised when a producer's in-memory queue has no room for another event."""
+
+    max_queue: int
+
+    def __init__(self, max_queue: int) -> None:
+        super().__init__(f"Producer queue is full ({max_queue} events waiting)")
+        self.max_queue = max_queue
+
+
+class OutboxFullError(HookbaseError):
+    """Raised when an outbox has reached its event or size cap."""
+
+    depth: int
+    size_bytes: int
+
+    def __init__(self, depth: int, size_bytes: int) -> None:
+        super().__init__(f"Outbox is full ({depth} events, {size_bytes} bytes)")
+        self.depth = depth
+        self.size_bytes = size_bytes
+
+
+class BulkOperationError(HookbaseError):
+    """Raised when some chunks of a chunked bulk operation failed.
+
+    ``result`` merges the responses of the chunks that succeeded; ``failed``
+    pairs each failed chunk's items with the error it failed with, so just
+    those items can be resubmitted.
+    """
+
+    result: Any
+    failed: list[tuple[list[Any], HookbaseError]]
+
+    def __init__(self, result: Any, failed: list[tuple[list[Any], HookbaseError]]) -> None:
+        items = sum(len(chunk) for chunk, _ in failed)
+        super().__init__(f"{len(failed)} bulk chunk(s) failed ({items} items): {failed[0][1]}")
+        self.result = result
+        self.failed = failed
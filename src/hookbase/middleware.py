@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import io
+import json
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Iterable, MutableMapping
+from typing import Any
+
+from .errors import WebhookReplayError, WebhookVerificationError
+from .webhook import DEFAULT_TOLERANCE, Webhook
+
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024  # 1 MiB
+
+# Size of each read from a WSGI input stream.
+_WSGI_CHUNK_SIZE = 64 * 1024
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+StartResponse = Callable[..., Any]
+WSGIApp = Callable[[dict[str, Any], StartResponse], Iterable[bytes]]
+
+_STATUS_LINES = {200: "200 OK", 401: "401 Unauthorized", 413: "413 Payload Too Large"}
+
+
+class ASGIWebhookMiddleware:
+    """ASGI middleware that verifies webhook signatures before the app runs.
+
+    Headers and the timestamp are checked before the body is read. The body
+    is hashed chunk by chunk as it arrives, capped at ``max_body_size``, and
+    once the signature checks out the same chunks are replayed to the app.
+    Failed verification gets a ``401`` and oversized bodies a ``413``; the
+    wrapped app is not called. With a replay guard on the :class:`Webhook`,
+    redeliveries of an id already verified are acknowledged with a ``200``
+    without calling the app.
+
+    Args:
+        app: The ASGI application to protect.
+        webhook: Verifier holding the signing secret, or the secret itself.
+        paths: Only verify requests to these paths (default: every request).
+        max_body_size: Largest body accepted, in bytes (default: 1 MiB).
+        tolerance: Maximum age of the webhook in seconds (default 300).
+
+    Example::
+
+        from hookbase.middleware import ASGIWebhookMiddleware
+
+        app = ASGIWebhookMiddleware(app, "whsec_...", paths={"/webhooks"})
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        webhook: Webhook | str,
+        *,
+        paths: Collection[str] | None = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        tolerance: int = DEFAULT_TOLERANCE,
+    ) -> None:
+        self._app = app
+        self._webhook = webhook if isinstance(webhook, Webhook) else Webhook(webhook)
+        self._paths = paths
+        self._max_body_size = max_body_size
+        self._tolerance = tolerance
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self._paths is not None and scope["path"] not in self._paths
+        ):
+            await self._app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", ())
+        }
+        try:
+            verifier = self._webhook.verifier(headers, tolerance=self._tolerance)
+        except WebhookVerificationError as exc:
+            await _asgi_respond(send, 401, str(exc))
+            return
+        length = _content_length(headers.get("content-length"))
+        if length is not None and length > self._max_body_size:
+            await _asgi_respond(send, 413, "Request body too large")
+            return
+
+        chunks: list[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body = message.get("body", b"")
+            if body:
+                size += len(body)
+                if size > self._max_body_size:
+                    await _asgi_respond(send, 413, "Request body too large")
+                    return
+                verifier.update(body)
+                chunks.append(body)
+            if not message.get("more_body", False):
+                break
+
+        try:
+            verifier.verify()
+        except WebhookReplayError:
+            await _asgi_respond(send, 200, "Duplicate webhook ignored")
+            return
+        except WebhookVerificationError as exc:
+            await _asgi_respond(send, 401, str(exc))
+            return
+        await self._app(scope, _replay(chunks, receive), send)
+
+
+class WSGIWebhookMiddleware:
+    """WSGI middleware that verifies webhook signatures before the app runs.
+
+    WSGI counterpart of :class:`ASGIWebhookMiddleware`: ``wsgi.input`` is
+    read and hashed in chunks, then replaced with a stream over the same
+    chunks for the wrapped app.
+
+    Args:
+        app: The WSGI application to protect.
+        webhook: Verifier holding the signing secret, or the secret itself.
+        paths: Only verify requests to these paths (default: every request).
+        max_body_size: Largest body accepted, in bytes (default: 1 MiB).
+        tolerance: Maximum age of the webhook in seconds (default 300).
+
+    Example::
+
+        from hookbase.middleware import WSGIWebhookMiddleware
+
+        app.wsgi_app = WSGIWebhookMiddleware(app.wsgi_app, "whsec_...")
+    """
+
+    def __init__(
+        self,
+        app: WSGIApp,
+        webhook: Webhook | str,
+        *,
+        paths: Collection[str] | None = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        tolerance: int = DEFAULT_TOLERANCE,
+    ) -> None:
+        self._app = app
+        self._webhook = webhook if isinstance(webhook, Webhook) else Webhook(webhook)
+        self._paths = paths
+        self._max_body_size = max_body_size
+        self._tolerance = tolerance
+
+    def __call__(self, environ: dict[str, Any], start_response: StartResponse) -> Iterable[bytes]:
+        if self._paths is not None and environ.get("PATH_INFO") not in self._paths:
+            return self._app(environ, start_response)
+
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        try:
+            verifier = self._webhook.verifier(headers, tolerance=self._tolerance)
+        except WebhookVerificationError as exc:
+            return _wsgi_respond(start_response, 401, str(exc))
+        remaining = _content_length(environ.get("CONTENT_LENGTH"))
+        if remaining is not None and remaining > self._max_body_size:
+            return _wsgi_respond(start_response, 413, "Request body too large")
+        # Without a length, only read to EOF when the server guarantees one.
+        if remaining is None and not environ.get("wsgi.input_terminated"):
+            remaining = 0
+
+        stream = environ["wsgi.input"]
+        chunks: list[bytes] = []
+        size = 0
+        while remaining is None or remaining > 0:
+            want = _WSGI_CHUNK_SIZE if remaining is None else min(_WSGI_CHUNK_SIZE, remaining)
+            chunk = stream.read(want)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > self._max_body_size:
+                return _wsgi_respond(start_response, 413, "Request body too large")
+            verifier.update(chunk)
+            chunks.append(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+
+        try:
+            verifier.verify()
+        except WebhookReplayError:
+            return _wsgi_respond(start_response, 200, "Duplicate webhook ignored")
+        except WebhookVerificationError as exc:
+            return _wsgi_respond(start_response, 401, str(exc))
+
+        environ["wsgi.input"] = ChunkReader(chunks)
+        environ["CONTENT_LENGTH"] = str(size)
+        return self._app(environ, start_response)
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file over a list of byte chunks, without joining them."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        super().__init__()
+        self._chunks = deque(chunks)
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        # Unlike a raw stream, fill the request unless the body runs out:
+        # WSGI apps expect read(n) to return n bytes before EOF.
+        limit = -1 if size is None else size
+        parts: list[bytes] = []
+        while self._chunks and limit != 0:
+            chunk = self._chunks[0]
+            start = self._offset
+            end = len(chunk) if limit < 0 else min(len(chunk), start + limit)
+            parts.append(chunk if start == 0 and end == len(chunk) else chunk[start:end])
+            if limit > 0:
+                limit -= end - start
+            self._advance(end - start)
+        return b"".join(parts)
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._chunks:
+            return 0
+        view = memoryview(self._chunks[0])[self._offset:]
+        n = min(len(buffer), len(view))
+        buffer[:n] = view[:n]
+        self._advance(n)
+        return n
+
+    def readline(self, size: int | None = -1) -> bytes:
+        limit = -1 if size is None else size
+        parts: list[bytes] = []
+        while self._chunks and limit != 0:
+            chunk = self._chunks[0]
+            start = self._offset
+            newline = chunk.find(b"\n", start)
+            end = len(chunk) if newline < 0 else newline + 1
+            if limit > 0:
+                end = min(end, start + limit)
+                limit -= end - start
+            parts.append(chunk[start:end])
+            self._advance(end - start)
+            if parts[-1].endswith(b"\n"):
+                break
+        return b"".join(parts)
+
+    def _advance(self, n: int) -> None:
+        self._offset += n
+        if self._offset >= len(self._chunks[0]):
+            self._chunks.popleft()
+            self._offset = 0
+
+
+def _content_length(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _replay(chunks: list[bytes], receive: Receive) -> Receive:
+    """A ``receive`` that yields *chunks* as request messages, then defers."""
+    pending = deque(chunks)
+    finished = False
+
+    async def replay() -> Message:
+        nonlocal finished
+        if finished:
+            return await receive()
+        body = pending.popleft() if pending else b""
+        finished = not pending
+        return {"type": "http.request", "body": body, "more_body": not finished}
+
+    return replay
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
+
+
+async def _asgi_respond(send: Send, status: int, message: str) -> None:
+    body = _error_body(message)
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _wsgi_respond(start_response: StartResponse, status: int, message: str) -> list[bytes]:
+    body = _error_body(message)
+    start_response(_STATUS_LINES[status], [
+        ("Content-Type", "application/json"),
+        ("Content-Length", str(len(body))),
+    ])
+    return [body]
+
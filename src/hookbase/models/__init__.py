@@ -63,6 +63,7 @@ from .filters import (
 )
 from .messages import (
     MessageStatus,
+    MessageWithAttempts,
     OutboundAttempt,
     OutboundMessage,
     SendEventParams,
@@ -174,6 +175,7 @@ __all__ = [
     "MessageStatus",
     "OutboundAttempt",
     "OutboundMessage",
+    "MessageWithAttempts",
     "OutboundReplayResult",
     "SendEventParams",
     "SendEventResponse",
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
+from pydantic import StrictBytes
+
 from ._base import HookbaseModel
 
 MessageStatus = Literal["pending", "success", "failed", "exhausted"]
@@ -9,7 +11,9 @@ MessageStatus = Literal["pending", "success", "failed", "exhausted"]
 
 class SendEventParams(HookbaseModel):
     event_type: str
-    payload: dict[str, Any]
+    # Strict so a str is rejected rather than coerced to bytes and spliced
+    # into the request body unchecked.
+    payload: dict[str, Any] | StrictBytes
     event_id: str | None = None
     metadata: dict[str, Any] | None = None
     endpoint_ids: list[str] | None = None
@@ -57,6 +61,13 @@ class OutboundAttempt(HookbaseModel):
     attempted_at: str = ""
 
 
+class MessageWithAttempts(HookbaseModel):
+    """An outbound message joined with its delivery attempts."""
+
+    message: OutboundMessage
+    attempts: list[OutboundAttempt] = []
+
+
 class StatsSummary(HookbaseModel):
     pending: int = 0
     processing: int = 0
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from .errors import HookbaseError, OutboxFullError
+
+DEFAULT_OUTBOX_MAX_EVENTS = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL,
+    body BLOB NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+class OutboxEvent(NamedTuple):
+    """A spooled send-event request.
+
+    ``body`` is the JSON request body exactly as it will be sent.
+    """
+
+    seq: int
+    idempotency_key: str
+    body: bytes
+    created_at: float
+
+
+class OutboxStats(NamedTuple):
+    """Depth metrics of an :class:`Outbox`."""
+
+    depth: int
+    size_bytes: int
+    oldest_age: float
+    max_events: int
+    max_bytes: int | None
+
+
+class OutboxDrainResult(NamedTuple):
+    """Outcome of draining an outbox.
+
+    ``rejected`` holds events the API refused outright (e.g. validation
+    errors); they are removed rather than retried. ``error`` is the
+    transient failure that stopped the drain early, if any; ``remaining``
+    events stay in the outbox for the next drain.
+    """
+
+    sent: int
+    rejected: list[tuple[OutboxEvent, HookbaseError]]
+    remaining: int
+    error: HookbaseError | None
+
+
+class Outbox:
+    """Durable local spool for send-event requests, backed by SQLite.
+
+    Events are appended in order with their encoded body and idempotency
+    key, survive restarts, and are removed once delivered, so a drain that
+    is interrupted can simply run again: the API deduplicates re-sent
+    events by their idempotency key. Attach it with ``Hookbase(outbox=...)``
+    and use ``messages.spool``, ``messages.send_or_spool`` and
+    ``messages.drain_outbox``.
+
+    One process should own an outbox file at a time; depth metrics are kept
+    in memory.
+
+    Args:
+        path: SQLite database file, created if missing (``":memory:"`` for
+            a non-durable outbox in tests).
+        max_events: Most events held at once (default: 100,000).
+        max_bytes: Most body bytes held at once (default: unbounded).
+
+    Example::
+
+        from hookbase import Hookbase, Outbox
+
+        client = Hookbase(api_key="whr_...", outbox=Outbox("hookbase-outbox.db"))
+        messages = client.outbound.messages
+        messages.send_or_spool("app_123", event_type="order.created", payload=order)
+        print(messages.outbox.stats().depth)
+        messages.drain_outbox()  # e.g. from a periodic job
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_events: int = DEFAULT_OUTBOX_MAX_EVENTS,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._max_events = max_events
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Durable across process crashes; only a power loss can drop the
+        # most recent appends.
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        depth, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM events"
+        ).fetchone()
+        self._depth: int = depth
+        self._size: int = size
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be delivered."""
+        return self._depth
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the waiting request bodies."""
+        return self._size
+
+    def stats(self) -> OutboxStats:
+        with self._lock:
+            row = self._db.execute("SELECT MIN(created_at) FROM events").fetchone()
+        oldest = row[0]
+        return OutboxStats(
+            depth=self._depth,
+            size_bytes=self._size,
+            oldest_age=time.time() - oldest if oldest is not None else 0.0,
+            max_events=self._max_events,
+            max_bytes=self._max_bytes,
+        )
+
+    def append(self, idempotency_key: str, body: bytes) -> int:
+        """Persist an encoded send-event body and return its sequence number.
+
+        Raises:
+            OutboxFullError: If the event would exceed ``max_events`` or
+                ``max_bytes``.
+        """
+        with self._lock:
+            if self._depth >= self._max_events or (
+                self._max_bytes is not None and self._size + len(body) > self._max_bytes
+            ):
+                raise OutboxFullError(self._depth, self._size)
+            cursor = self._db.execute(
+                "INSERT INTO events (idempotency_key, body, created_at) VALUES (?, ?, ?)",
+                (idempotency_key, body, time.time()),
+            )
+            self._depth += 1
+            self._size += len(body)
+            return cursor.lastrowid or 0
+
+    def peek(self, limit: int) -> list[OutboxEvent]:
+        """Return up to *limit* of the oldest events, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, idempotency_key, body, created_at FROM events ORDER BY seq LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [OutboxEvent(seq, key, bytes(body), created) for seq, key, body, created in rows]
+
+    def remove(self, events: Iterable[OutboxEvent]) -> None:
+        """Delete delivered (or permanently rejected) events."""
+        events = list(events)
+        if not events:
+            return
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for event in events:
+                    cursor = self._db.execute("DELETE FROM events WHERE seq = ?", (event.seq,))
+                    if cursor.rowcount:
+                        self._depth -= 1
+                        self._size -= len(event.body)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                self._depth, self._size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM events"
+                ).fetchone()
+                raise
+            self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> Outbox:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
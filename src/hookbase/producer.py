@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import queue
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .errors import QueueFullError
+from .models.messages import SendEventResponse
+
+if TYPE_CHECKING:
+    from .resources.messages import AsyncMessages, Messages
+
+DEFAULT_LINGER_MS = 5.0
+DEFAULT_MAX_BATCH = 100
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_PRODUCER_CONCURRENCY = 8
+
+# Queued by close() behind every pending event to stop the worker thread.
+_STOP = object()
+
+
+class _Event(NamedTuple):
+    application_id: str
+    kwargs: dict[str, Any]
+    future: Any
+
+
+def _event_kwargs(
+    event_type: str,
+    payload: dict[str, Any] | bytes,
+    event_id: str | None,
+    metadata: dict[str, Any] | None,
+    endpoint_ids: list[str] | None,
+    idempotency_key: str | None,
+) -> dict[str, Any]:
+    return {
+        "event_type": event_type,
+        "payload": payload,
+        "event_id": event_id,
+        "metadata": metadata,
+        "endpoint_ids": endpoint_ids,
+        # Fixed now so every retry of this event carries the same key.
+        "idempotency_key": idempotency_key or str(uuid.uuid4()),
+    }
+
+
+def _check_options(linger_ms: float, max_batch: int, max_queue: int, concurrency: int) -> None:
+    if linger_ms < 0:
+        raise ValueError("linger_ms must not be negative")
+    if max_batch < 1:
+        raise ValueError("max_batch must be at least 1")
+    if max_queue < 1:
+        raise ValueError("max_queue must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+class Producer:
+    """Send events in the background instead of on the caller's thread.
+
+    :meth:`enqueue` puts an event on a bounded in-memory queue and returns a
+    future at once. A worker thread waits up to ``linger_ms`` for more events
+    (or until ``max_batch`` are queued) and then dispatches the batch with at
+    most ``concurrency`` sends in flight. When sends fall behind the queue
+    fills up and :meth:`enqueue` raises :class:`QueueFullError` rather than
+    buffering without bound. Every event gets an idempotency key, so the
+    transport's retries cannot deliver it twice.
+
+    Events are only held in memory: call :meth:`close` (or use the producer
+    as a context manager) before exiting so queued events are delivered.
+
+    Args:
+        messages: The messages resource to send through.
+        linger_ms: How long to wait for a batch to fill, in milliseconds
+            (default: 5).
+        max_batch: Dispatch as soon as this many events are queued
+            (default: 100).
+        max_queue: Events that may wait in the queue (default: 10,000).
+        concurrency: Maximum sends in flight (default: 8).
+
+    Example::
+
+        from hookbase import Hookbase, Producer
+
+        client = Hookbase(api_key="whr_...")
+        with Producer(client.outbound.messages, linger_ms=10) as producer:
+            future = producer.enqueue("app_123", event_type="order.created", payload=order)
+        print(future.result().event_id)
+    """
+
+    def __init__(
+        self,
+        messages: Messages,
+        *,
+        linger_ms: float = DEFAULT_LINGER_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        concurrency: int = DEFAULT_PRODUCER_CONCURRENCY,
+    ) -> None:
+        _check_options(linger_ms, max_batch, max_queue, concurrency)
+        self._messages = messages
+        self._linger = linger_ms / 1000
+        self._max_batch = max_batch
+        self._max_queue = max_queue
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._wake = threading.Event()
+        self._slots = threading.Semaphore(concurrency)
+        self._pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="hookbase-producer"
+        )
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="hookbase-producer", daemon=True)
+        self._worker.start()
+
+    @property
+    def pending(self) -> int:
+        """Events enqueued but not yet sent (queued or in flight)."""
+        return self._pending
+
+    def enqueue(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> Future[SendEventResponse]:
+        """Queue an event for sending; takes the same arguments as ``send``.
+
+        Returns:
+            A future resolving to the :class:`SendEventResponse`, or to the
+            error the send failed with. Cancelling it before the event is
+            dispatched skips the send.
+
+        Raises:
+            QueueFullError: If ``max_queue`` events are already waiting.
+            RuntimeError: If the producer is closed.
+        """
+        future: Future[SendEventResponse] = Future()
+        event = _Event(
+            application_id,
+            _event_kwargs(event_type, payload, event_id, metadata, endpoint_ids, idempotency_key),
+            future,
+        )
+        with self._idle:
+            if self._closed:
+                raise RuntimeError("Producer is closed")
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                raise QueueFullError(self._max_queue) from None
+            self._pending += 1
+        if self._queue.qsize() >= self._max_batch:
+            self._wake.set()
+        return future
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything queued so far and wait for it to finish.
+
+        Returns:
+            ``False`` if *timeout* seconds passed first, else ``True``.
+        """
+        self._wake.set()
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self) -> None:
+        """Stop accepting events, deliver every pending one, then stop."""
+        with self._idle:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._wake.set()
+        self._worker.join()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> Producer:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            if self._queue.qsize() + 1 < self._max_batch:
+                self._wake.wait(self._linger)
+            self._wake.clear()
+
+            batch = [first]
+            stop = False
+            while len(batch) < self._max_batch:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    stop = True
+                    break
+                batch.append(event)
+            for event in batch:
+                # Blocks while `concurrency` sends are in flight, which lets
+                # the queue fill up and push back on enqueue().
+                self._slots.acquire()
+                self._pool.submit(self._send, event)
+            if stop:
+                return
+
+    def _send(self, event: _Event) -> None:
+        try:
+            if event.future.set_running_or_notify_cancel():
+                try:
+                    response = self._messages.send(event.application_id, **event.kwargs)
+                except Exception as exc:
+                    event.future.set_exception(exc)
+                else:
+                    event.future.set_result(response)
+        finally:
+            self._slots.release()
+            with self._idle:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
+
+
+class AsyncProducer:
+    """Send events in the background from an event loop.
+
+    Async counterpart of :class:`Producer`: :meth:`enqueue` is a plain
+    (non-blocking) method returning an :class:`asyncio.Future`, and the
+    worker runs as a task on the loop of the first :meth:`enqueue` call.
+
+    Example::
+
+        async with AsyncProducer(client.outbound.messages) as producer:
+            producer.enqueue("app_123", event_type="order.created", payload=order)
+    """
+
+    def __init__(
+        self,
+        messages: AsyncMessages,
+        *,
+        linger_ms: float = DEFAULT_LINGER_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        concurrency: int = DEFAULT_PRODUCER_CONCURRENCY,
+    ) -> None:
+        _check_options(linger_ms, max_batch, max_queue, concurrency)
+        self._messages = messages
+        self._linger = linger_ms / 1000
+        self._max_batch = max_batch
+        self._max_queue = max_queue
+        self._concurrency = concurrency
+        self._pending = 0
+        self._closed = False
+        self._worker: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Created on first use so they bind to the running loop.
+        self._queue: asyncio.Queue[_Event] | None = None
+        self._wake: asyncio.Event | None = None
+        self._idle: asyncio.Event | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def pending(self) -> int:
+        """Events enqueued but not yet sent (queued or in flight)."""
+        return self._pending
+
+    def enqueue(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> asyncio.Future[SendEventResponse]:
+        """Queue an event for sending; takes the same arguments as ``send``.
+
+        Raises:
+            QueueFullError: If ``max_queue`` events are already waiting.
+            RuntimeError: If the producer is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Producer is closed")
+        queue_ = self._start()
+        future: asyncio.Future[SendEventResponse] = asyncio.get_running_loop().create_future()
+        event = _Event(
+            application_id,
+            _event_kwargs(event_type, payload, event_id, metadata, endpoint_ids, idempotency_key),
+            future,
+        )
+        try:
+            queue_.put_nowait(event)
+        except asyncio.QueueFull:
+            raise QueueFullError(self._max_queue) from None
+        self._pending += 1
+        assert self._idle is not None and self._wake is not None
+        self._idle.clear()
+        if queue_.qsize() >= self._max_batch:
+            self._wake.set()
+        return future
+
+    async def flush(self) -> None:
+        """Send everything queued so far and wait for it to finish."""
+        if self._idle is None or self._wake is None:
+            return
+        self._wake.set()
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop accepting events, deliver every pending one, then stop."""
+        self._closed = True
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    async def __aenter__(self) -> AsyncProducer:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def _start(self) -> asyncio.Queue[_Event]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._wake = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._idle.set()
+            self._slots = asyncio.Semaphore(self._concurrency)
+            self._worker = asyncio.ensure_future(self._run())
+        return self._queue
+
+    async def _run(self) -> None:
+        assert self._queue is not None and self._wake is not None and self._slots is not None
+        while True:
+            first = await self._queue.get()
+            if self._queue.qsize() + 1 < self._max_batch:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), self._linger)
+            self._wake.clear()
+
+            batch = [first]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for event in batch:
+                await self._slots.acquire()
+                task = asyncio.ensure_future(self._send(event))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, event: _Event) -> None:
+        assert self._slots is not None and self._idle is not None
+        try:
+            if not event.future.cancelled():
+                try:
+                    response = await self._messages.send(event.application_id, **event.kwargs)
+                except Exception as exc:
+                    if not event.future.done():
+                        event.future.set_exception(exc)
+                else:
+                    if not event.future.done():
+                        event.future.set_result(response)
+        finally:
+            self._slots.release()
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.set()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+
+# Header names checked for server-advertised limits, in priority order.
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+_RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+
+# Reset values above this are absolute Unix timestamps rather than deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Window over which the send rate is measured when no rate was configured.
+_OBSERVATION_WINDOW = 10.0
+
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class RateLimiter:
+    """Adaptive token-bucket rate limiter shared by every request on a client.
+
+    The limiter spaces requests to at most ``rate`` per second (with bursts of
+    up to ``burst``) and learns from the server: a 429 halves the rate and
+    closes a global pause gate for the ``Retry-After`` period, so every
+    in-flight caller waits together instead of retrying independently.
+    ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers tighten the rate
+    to the remaining budget, and successful responses let it recover.
+
+    Args:
+        rate: Requests per second to allow. ``None`` starts unlimited and only
+            applies limits learned from the server.
+        burst: Number of requests allowed back to back (default: 1).
+        min_rate: Lowest rate the limiter will back off to.
+
+    Example::
+
+        from hookbase import Hookbase, RateLimiter
+
+        limiter = RateLimiter(rate=20)
+        client = Hookbase(api_key="whr_...", rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        *,
+        burst: int = 1,
+        min_rate: float = 0.1,
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._max_rate = rate
+        self._rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._tat = 0.0  # theoretical arrival time of the next request
+        self._paused_until = 0.0
+        self._sent: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        """Current requests-per-second limit (``None`` when unlimited)."""
+        return self._rate
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds remaining before the pause gate opens (0 when open)."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request and return how long to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._paused_until)
+            if self._rate is not None:
+                interval = 1.0 / self._rate
+                tat = max(self._tat, start)
+                start = max(start, tat - (self._burst - 1) * interval)
+                self._tat = tat + interval
+            self._record_send(start)
+            return start - now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Close the gate for *seconds*; every caller waits until it reopens."""
+        with self._lock:
+            self._pause(time.monotonic(), seconds)
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Update the limit from a response's status and rate-limit headers."""
+        with self._lock:
+            now = time.monotonic()
+            if status_code == 429:
+                retry_after = parse_retry_after(headers.get("retry-after"))
+                self._decrease(now)
+                self._pause(now, retry_after if retry_after is not None else DEFAULT_RETRY_AFTER)
+                return
+
+            remaining = _first_number(headers, _REMAINING_HEADERS)
+            reset = _first_number(headers, _RESET_HEADERS)
+            if remaining is not None and reset is not None:
+                if reset > _EPOCH_THRESHOLD:
+                    reset -= time.time()
+                reset = max(reset, 0.0)
+                if remaining <= 0:
+                    self._pause(now, reset)
+                elif reset > 0:
+                    self._set_rate(remaining / reset)
+                return
+
+            if self._rate is not None and 200 <= status_code < 300:
+                # Additive increase: roughly +1 req/s for every ``rate`` successes.
+                ceiling = self._max_rate
+                increased = self._rate + 1.0 / self._rate
+                if ceiling is not None:
+                    increased = min(ceiling, increased)
+                self._rate = increased
+
+    # -- internals (lock held) --
+
+    def _pause(self, now: float, seconds: float) -> None:
+        until = now + max(seconds, 0.0)
+        if until <= self._paused_until:
+            return
+        self._paused_until = until
+        # Spread callers out after the pause instead of releasing a burst.
+        if self._rate is not None:
+            self._tat = max(self._tat, until + (self._burst - 1) / self._rate)
+
+    def _decrease(self, now: float) -> None:
+        if self._rate is None:
+            observed = self._observed_rate(now)
+            if observed is None:
+                return
+            self._rate = observed
+        self._set_rate(self._rate / 2)
+
+    def _set_rate(self, rate: float) -> None:
+        rate = max(self._min_rate, rate)
+        if self._max_rate is not None:
+            rate = min(self._max_rate, rate)
+        self._rate = rate
+
+    def _record_send(self, at: float) -> None:
+        self._sent.append(at)
+        while self._sent and self._sent[0] < at - _OBSERVATION_WINDOW:
+            self._sent.popleft()
+
+    def _observed_rate(self, now: float) -> float | None:
+        recent = [t for t in self._sent if t >= now - _OBSERVATION_WINDOW]
+        if len(recent) < 2:
+            return None
+        span = max(now - recent[0], 1.0)
+        return len(recent) / span
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def _first_number(headers: Mapping[str, str], names: tuple[str, ...]) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from .webhook import DEFAULT_TOLERANCE
+
+DEFAULT_MAX_IDS = 100_000
+
+
+class ReplayGuard(ABC):
+    """Record of webhook ids already received, used to reject replays.
+
+    Implement this to share the record between processes (e.g. with Redis
+    ``SET NX`` and an expiry of twice the tolerance).
+    """
+
+    @abstractmethod
+    def add(self, webhook_id: str, timestamp: int) -> bool:
+        """Record *webhook_id*; return ``False`` if it was already recorded.
+
+        Args:
+            webhook_id: The ``webhook-id`` header of a verified webhook.
+            timestamp: Its ``webhook-timestamp``. A redelivery is re-signed
+                with a new timestamp, so the id must match whatever the
+                timestamp; it only decides how long the id has to be kept.
+        """
+
+    @abstractmethod
+    def discard(self, webhook_id: str, timestamp: int) -> None:
+        """Forget *webhook_id* so a redelivery is accepted again.
+
+        Call this when processing a verified webhook failed and the sender
+        should be allowed to retry it.
+        """
+
+
+class InMemoryReplayGuard(ReplayGuard):
+    """Thread-safe in-process replay guard.
+
+    Ids are kept in buckets of ``tolerance`` seconds keyed by the webhook's
+    own timestamp, and whole buckets are dropped once they are too old for
+    :meth:`Webhook.verify` to accept. Only a few buckets cover the accepted
+    window, so a lookup checks each of them and matches an id regardless of
+    the timestamp it was redelivered with. If more than ``max_ids`` ids are
+    held, the oldest buckets are dropped early.
+
+    Args:
+        tolerance: The tolerance passed to :meth:`Webhook.verify`
+            (default 300).
+        max_ids: Upper bound on the number of ids held (default 100,000).
+
+    Example::
+
+        from hookbase import InMemoryReplayGuard, Webhook
+
+        wh = Webhook("whsec_...", replay_guard=InMemoryReplayGuard())
+    """
+
+    def __init__(
+        self, tolerance: int = DEFAULT_TOLERANCE, *, max_ids: int = DEFAULT_MAX_IDS
+    ) -> None:
+        if tolerance < 1:
+            raise ValueError("tolerance must be at least 1 second")
+        self._tolerance = tolerance
+        self._max_ids = max_ids
+        self._buckets: dict[int, set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, webhook_id: str, timestamp: int) -> bool:
+        bucket_key = timestamp // self._tolerance
+        with self._lock:
+            self._evict(time.time())
+            if any(webhook_id in bucket for bucket in self._buckets.values()):
+                return False
+            self._buckets.setdefault(bucket_key, set()).add(webhook_id)
+            self._size += 1
+            while self._size > self._max_ids and len(self._buckets) > 1:
+                self._drop(min(self._buckets))
+            return True
+
+    def discard(self, webhook_id: str, timestamp: int) -> None:
+        with self._lock:
+            for bucket in self._buckets.values():
+                if webhook_id in bucket:
+                    bucket.remove(webhook_id)
+                    self._size -= 1
+                    return
+
+    def _evict(self, now: float) -> None:
+        # Timestamps older than now - tolerance are rejected before the guard
+        # is consulted, so a bucket ending before that can never match again.
+        oldest = (now - self._tolerance) // self._tolerance - 1
+        for key in [k for k in self._buckets if k < oldest]:
+            self._drop(key)
+
+    def _drop(self, key: int) -> None:
+        self._size -= len(self._buckets.pop(key))
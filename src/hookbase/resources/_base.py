@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, TypeVar
 
-from pydantic import TypeAdapter
-
+from .. import _validation
 from .._client import AsyncTransport, SyncTransport
+from .._constants import RETRY_STATUS_CODES
+from .._streaming import DEFAULT_CHUNK_SIZE, ExportDestination, make_parser, open_destination
+from ..errors import APIError, HookbaseError, NetworkError, TimeoutError
 
 T = TypeVar("T")
 
@@ -16,6 +20,15 @@ def _to_body(params: Any) -> Any:
     return params
 
 
+def _is_transient(exc: HookbaseError) -> bool:
+    """Whether a request that failed with *exc* after retries may succeed later."""
+    if isinstance(exc, (TimeoutError, NetworkError)):
+        return True
+    return isinstance(exc, APIError) and (
+        exc.status_code in RETRY_STATUS_CODES or exc.status_code >= 500
+    )
+
+
 class SyncResource:
     """Base class for synchronous API resources."""
 
@@ -36,12 +49,34 @@ class SyncResource:
         )
 
     def _parse(self, model: type[T], data: Any) -> T:
-        adapter = TypeAdapter(model)
-        return adapter.validate_python(data)
+        return _validation.parse(model, data)
 
     def _parse_list(self, model: type[T], data: Any) -> list[T]:
-        adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
-        return adapter.validate_python(data)
+        return _validation.parse_list(model, data)
+
+    def _stream_records(
+        self, path: str, params: dict[str, Any], format: str
+    ) -> Iterator[Any]:
+        parser = make_parser(format)
+        with self._transport.stream("GET", path, params=params) as resp:
+            for chunk in resp.iter_bytes():
+                yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def _stream_to(
+        self,
+        path: str,
+        params: dict[str, Any],
+        destination: ExportDestination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        written = 0
+        with self._transport.stream("GET", path, params=params) as resp:
+            with open_destination(destination) as file:
+                for chunk in resp.iter_bytes(chunk_size):
+                    file.write(chunk)
+                    written += len(chunk)
+        return written
 
     @staticmethod
     def _clean_params(params: dict[str, Any]) -> dict[str, Any]:
@@ -68,12 +103,37 @@ class AsyncResource:
         )
 
     def _parse(self, model: type[T], data: Any) -> T:
-        adapter = TypeAdapter(model)
-        return adapter.validate_python(data)
+        return _validation.parse(model, data)
 
     def _parse_list(self, model: type[T], data: Any) -> list[T]:
-        adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
-        return adapter.validate_python(data)
+        return _validation.parse_list(model, data)
+
+    async def _stream_records(
+        self, path: str, params: dict[str, Any], format: str
+    ) -> AsyncIterator[Any]:
+        parser = make_parser(format)
+        async with self._transport.stream("GET", path, params=params) as resp:
+            async for chunk in resp.aiter_bytes():
+                for record in parser.feed(chunk):
+                    yield record
+        for record in parser.close():
+            yield record
+
+    async def _stream_to(
+        self,
+        path: str,
+        params: dict[str, Any],
+        destination: ExportDestination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        written = 0
+        async with self._transport.stream("GET", path, params=params) as resp:
+            with open_destination(destination) as file:
+                async for chunk in resp.aiter_bytes(chunk_size):
+                    # Disk writes run on a worker thread, off the event loop.
+                    await asyncio.to_thread(file.write, chunk)
+                    written += len(chunk)
+        return written
 
     @staticmethod
     def _clean_params(params: dict[str, Any]) -> dict[str, Any]:
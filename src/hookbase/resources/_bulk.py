@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Optional, TypeVar
+
+from .._parallel import async_map_bounded, map_bounded
+from ..errors import BulkOperationError, HookbaseError
+from ..models.common import BulkDeleteResult
+from ..models.deliveries import BulkReplayResult
+from ._base import _is_transient
+
+DEFAULT_BULK_CHUNK_SIZE = 100
+DEFAULT_BULK_CONCURRENCY = 4
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+_Outcome = tuple[Optional[R], Optional[HookbaseError]]
+
+
+def _split(items: Sequence[A], chunk_size: int) -> list[list[A]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    # An empty input is still sent as one (empty) request, as before chunking.
+    return [list(items[i:i + chunk_size]) for i in range(0, len(items), chunk_size)] or [[]]
+
+
+def _settle(
+    chunks: list[list[A]], outcomes: list[_Outcome[R]], merge: Callable[[list[R]], R]
+) -> R:
+    results = [result for result, error in outcomes if error is None and result is not None]
+    failed = [(chunk, error) for chunk, (_, error) in zip(chunks, outcomes) if error is not None]
+    if not failed:
+        return merge(results)
+    if not results:
+        # Nothing succeeded, so there is no partial result worth reporting.
+        raise failed[0][1]
+    raise BulkOperationError(merge(results), failed) from failed[0][1]
+
+
+def run_bulk(
+    call: Callable[[list[A]], R],
+    items: Sequence[A],
+    merge: Callable[[list[R]], R],
+    *,
+    chunk_size: int,
+    concurrency: int,
+) -> R:
+    """Run a bulk endpoint over *items* in chunks and merge the results.
+
+    Chunks are sent with at most *concurrency* requests in flight. A chunk
+    that fails with a transient error is retried once on its own after the
+    others finish; if any chunk still fails, :class:`BulkOperationError`
+    carries the merged result of the chunks that succeeded.
+    """
+    chunks = _split(items, chunk_size)
+    if len(chunks) == 1:
+        return call(chunks[0])
+
+    def attempt(chunk: list[A]) -> _Outcome[R]:
+        try:
+            return call(chunk), None
+        except HookbaseError as exc:
+            return None, exc
+
+    outcomes = list(map_bounded(attempt, chunks, concurrency))
+    for n, (chunk, (_, error)) in enumerate(zip(chunks, outcomes)):
+        if error is not None and _is_transient(error):
+            outcomes[n] = attempt(chunk)
+    return _settle(chunks, outcomes, merge)
+
+
+async def async_run_bulk(
+    call: Callable[[list[A]], Awaitable[R]],
+    items: Sequence[A],
+    merge: Callable[[list[R]], R],
+    *,
+    chunk_size: int,
+    concurrency: int,
+) -> R:
+    """Async counterpart of :func:`run_bulk`."""
+    chunks = _split(items, chunk_size)
+    if len(chunks) == 1:
+        return await call(chunks[0])
+
+    async def attempt(chunk: list[A]) -> _Outcome[R]:
+        try:
+            return await call(chunk), None
+        except HookbaseError as exc:
+            return None, exc
+
+    outcomes = [outcome async for outcome in async_map_bounded(attempt, chunks, concurrency)]
+    for n, (chunk, (_, error)) in enumerate(zip(chunks, outcomes)):
+        if error is not None and _is_transient(error):
+            outcomes[n] = await attempt(chunk)
+    return _settle(chunks, outcomes, merge)
+
+
+def merge_delete(results: list[BulkDeleteResult]) -> BulkDeleteResult:
+    return BulkDeleteResult(
+        success=all(r.success for r in results), deleted=sum(r.deleted for r in results)
+    )
+
+
+def merge_replay(results: list[BulkReplayResult]) -> BulkReplayResult:
+    return BulkReplayResult(
+        message=results[0].message if results else "",
+        queued=sum(r.queued for r in results),
+        skipped=sum(r.skipped for r in results),
+        results=[item for r in results for item in r.results],
+    )
+
+
+def merge_lists(results: list[list[A]]) -> list[A]:
+    return [item for chunk in results for item in chunk]
+
+
+def merge_dicts(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge untyped responses: sum counts, AND flags, concatenate lists."""
+    merged: dict[str, Any] = {}
+    for result in results:
+        for key, value in result.items():
+            if key not in merged:
+                merged[key] = value
+            elif isinstance(value, bool):
+                merged[key] = merged[key] and value
+            elif isinstance(value, int) and isinstance(merged[key], int):
+                merged[key] += value
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key] = merged[key] + value
+    return merged
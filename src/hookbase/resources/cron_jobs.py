@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -17,6 +18,8 @@ from ..models.cron_jobs import (
 )
 from ._base import AsyncResource, SyncResource, _to_body
 
+_PAGINATION = PageNumberPagination(data_key="cronJobs")
+
 
 class CronJobs(SyncResource):
     def list(
@@ -28,7 +31,7 @@ class CronJobs(SyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return _fetch_offset_page(
             self._transport, "/api/cron", params, CronJob,
-            data_key="cronJobs",
+            strategy=_PAGINATION,
         )
 
     def get(self, id: str) -> CronJob:
@@ -71,7 +74,7 @@ class AsyncCronJobs(AsyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return await _async_fetch_offset_page(
             self._transport, "/api/cron", params, CronJob,
-            data_key="cronJobs",
+            strategy=_PAGINATION,
         )
 
     async def get(self, id: str) -> CronJob:
@@ -1,13 +1,89 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from typing import NamedTuple
+
 from .._pagination import (
     AsyncOffsetPage,
+    LimitOffsetPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
 )
 from ..models.deliveries import BulkReplayResult, Delivery, DeliveryDetail, ReplayResult
+from ..ratelimit import RateLimiter
 from ._base import AsyncResource, SyncResource
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_replay,
+    run_bulk,
+)
+
+_PAGINATION = LimitOffsetPagination(data_key="deliveries")
+
+DEFAULT_REPLAY_PAGE_SIZE = 100
+DEFAULT_REPLAY_SCAN_CONCURRENCY = 4
+
+
+class ReplayFailedResult(NamedTuple):
+    """Outcome of :meth:`Deliveries.replay_failed`.
+
+    ``scanned`` counts the deliveries listed and ``deliveries`` those inside
+    the time window; ``event_ids`` are their distinct events in listing
+    order. ``queued`` and ``skipped`` are summed from the ``bulk-replay``
+    responses and stay 0 on a dry run.
+    """
+
+    scanned: int
+    deliveries: int
+    event_ids: list[str]
+    queued: int
+    skipped: int
+    dry_run: bool
+
+
+def _as_datetime(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        # fromisoformat() only accepts a trailing "Z" from Python 3.11.
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class _ReplayScan:
+    """Collects the distinct events of the deliveries inside a time window."""
+
+    def __init__(self, since: datetime | str | None, until: datetime | str | None) -> None:
+        self._since = _as_datetime(since) if since is not None else None
+        self._until = _as_datetime(until) if until is not None else None
+        self.scanned = 0
+        self.deliveries = 0
+        # A dict keeps first-seen order while deduplicating.
+        self.event_ids: dict[str, None] = {}
+
+    def add(self, deliveries: list[Delivery]) -> None:
+        self.scanned += len(deliveries)
+        for delivery in deliveries:
+            if self._in_window(delivery):
+                self.deliveries += 1
+                self.event_ids.setdefault(delivery.event_id)
+
+    def result(self, replayed: BulkReplayResult, *, dry_run: bool = False) -> ReplayFailedResult:
+        return ReplayFailedResult(
+            self.scanned, self.deliveries, list(self.event_ids),
+            replayed.queued, replayed.skipped, dry_run,
+        )
+
+    def _in_window(self, delivery: Delivery) -> bool:
+        if self._since is None and self._until is None:
+            return True
+        if not delivery.created_at:
+            return False
+        at = _as_datetime(delivery.created_at)
+        return (self._since is None or at >= self._since) and (
+            self._until is None or at < self._until
+        )
 
 
 class Deliveries(SyncResource):
@@ -25,7 +101,9 @@ class Deliveries(SyncResource):
             "limit": limit, "offset": offset, "eventId": event_id,
             "routeId": route_id, "destinationId": destination_id, "status": status,
         })
-        return _fetch_offset_page(self._transport, "/api/deliveries", params, Delivery)
+        return _fetch_offset_page(
+            self._transport, "/api/deliveries", params, Delivery, strategy=_PAGINATION
+        )
 
     def get(self, id: str) -> DeliveryDetail:
         resp = self._request("GET", f"/api/deliveries/{id}")
@@ -35,13 +113,108 @@ class Deliveries(SyncResource):
         resp = self._request("POST", f"/api/deliveries/{id}/replay")
         return self._parse(ReplayResult, resp)
 
-    def bulk_replay(self, ids: list[str]) -> BulkReplayResult:
-        resp = self._request("POST", "/api/deliveries/bulk-replay", json={"ids": ids})
-        return self._parse(BulkReplayResult, resp)
+    def bulk_replay(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkReplayResult:
+        """Replay deliveries by id, sending ``chunk_size`` ids per request.
 
-    def bulk_replay_events(self, event_ids: list[str]) -> BulkReplayResult:
-        resp = self._request("POST", "/api/deliveries/bulk-replay", json={"eventIds": event_ids})
-        return self._parse(BulkReplayResult, resp)
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def replay(chunk: list[str]) -> BulkReplayResult:
+            resp = self._request("POST", "/api/deliveries/bulk-replay", json={"ids": chunk})
+            return self._parse(BulkReplayResult, resp)
+
+        return run_bulk(
+            replay, ids, merge_replay,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
+
+    def bulk_replay_events(
+        self,
+        event_ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate: float | None = None,
+    ) -> BulkReplayResult:
+        """Replay every delivery of the given events, ``chunk_size`` per request.
+
+        *rate* caps the ``bulk-replay`` calls per second (default: none).
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        limiter = RateLimiter(rate) if rate is not None else None
+
+        def replay(chunk: list[str]) -> BulkReplayResult:
+            if limiter is not None:
+                limiter.acquire()
+            resp = self._request(
+                "POST", "/api/deliveries/bulk-replay", json={"eventIds": chunk}
+            )
+            return self._parse(BulkReplayResult, resp)
+
+        return run_bulk(
+            replay, event_ids, merge_replay,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
+
+    def replay_failed(
+        self,
+        *,
+        destination_id: str | None = None,
+        route_id: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        status: str = "failed",
+        page_size: int = DEFAULT_REPLAY_PAGE_SIZE,
+        scan_concurrency: int = DEFAULT_REPLAY_SCAN_CONCURRENCY,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        rate: float | None = None,
+        dry_run: bool = False,
+    ) -> ReplayFailedResult:
+        """Replay the failed deliveries of a time window, once per event.
+
+        Matching deliveries are listed with up to *scan_concurrency* pages
+        fetched at once, filtered to ``since <= created_at < until`` and
+        deduplicated by event, so every affected event is replayed through
+        ``bulk_replay_events`` exactly once. Replay calls are sent one at a
+        time, ``chunk_size`` events each, and *rate* caps them per second so
+        a recovering destination is not flooded.
+
+        Args:
+            destination_id: Only replay deliveries to this destination.
+            route_id: Only replay deliveries of this route.
+            since: Start of the window (inclusive); a ``datetime`` or ISO
+                8601 string, UTC when no offset is given.
+            until: End of the window (exclusive).
+            status: Delivery status to replay (default: ``"failed"``).
+            page_size: Deliveries per listing page (default: 100).
+            scan_concurrency: Listing pages fetched at once (default: 4).
+            chunk_size: Events per ``bulk-replay`` call (default: 100).
+            rate: Maximum ``bulk-replay`` calls per second (default: none).
+            dry_run: Only scan and report what would be replayed.
+
+        Raises:
+            BulkOperationError: If only some replay calls succeeded.
+        """
+        scan = _ReplayScan(since, until)
+        first = self.list(
+            destination_id=destination_id, route_id=route_id, status=status, limit=page_size
+        )
+        for page in first.iter_pages(concurrency=scan_concurrency):
+            scan.add(page.data)
+        if dry_run or not scan.event_ids:
+            return scan.result(BulkReplayResult(), dry_run=dry_run)
+        replayed = self.bulk_replay_events(
+            list(scan.event_ids), chunk_size=chunk_size, concurrency=1, rate=rate
+        )
+        return scan.result(replayed)
 
 
 class AsyncDeliveries(AsyncResource):
@@ -59,7 +232,9 @@ class AsyncDeliveries(AsyncResource):
             "limit": limit, "offset": offset, "eventId": event_id,
             "routeId": route_id, "destinationId": destination_id, "status": status,
         })
-        return await _async_fetch_offset_page(self._transport, "/api/deliveries", params, Delivery)
+        return await _async_fetch_offset_page(
+            self._transport, "/api/deliveries", params, Delivery, strategy=_PAGINATION
+        )
 
     async def get(self, id: str) -> DeliveryDetail:
         resp = await self._request("GET", f"/api/deliveries/{id}")
@@ -69,13 +244,84 @@ class AsyncDeliveries(AsyncResource):
         resp = await self._request("POST", f"/api/deliveries/{id}/replay")
         return self._parse(ReplayResult, resp)
 
-    async def bulk_replay(self, ids: list[str]) -> BulkReplayResult:
-        resp = await self._request("POST", "/api/deliveries/bulk-replay", json={"ids": ids})
-        return self._parse(BulkReplayResult, resp)
+    async def bulk_replay(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkReplayResult:
+        """Replay deliveries by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def replay(chunk: list[str]) -> BulkReplayResult:
+            resp = await self._request("POST", "/api/deliveries/bulk-replay", json={"ids": chunk})
+            return self._parse(BulkReplayResult, resp)
+
+        return await async_run_bulk(
+            replay, ids, merge_replay,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
+
+    async def bulk_replay_events(
+        self,
+        event_ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        rate: float | None = None,
+    ) -> BulkReplayResult:
+        """Replay every delivery of the given events, ``chunk_size`` per request.
 
-    async def bulk_replay_events(self, event_ids: list[str]) -> BulkReplayResult:
-        resp = await self._request(
-            "POST", "/api/deliveries/bulk-replay",
-            json={"eventIds": event_ids},
+        *rate* caps the ``bulk-replay`` calls per second (default: none).
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        limiter = RateLimiter(rate) if rate is not None else None
+
+        async def replay(chunk: list[str]) -> BulkReplayResult:
+            if limiter is not None:
+                await limiter.acquire_async()
+            resp = await self._request(
+                "POST", "/api/deliveries/bulk-replay", json={"eventIds": chunk}
+            )
+            return self._parse(BulkReplayResult, resp)
+
+        return await async_run_bulk(
+            replay, event_ids, merge_replay,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
+
+    async def replay_failed(
+        self,
+        *,
+        destination_id: str | None = None,
+        route_id: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        status: str = "failed",
+        page_size: int = DEFAULT_REPLAY_PAGE_SIZE,
+        scan_concurrency: int = DEFAULT_REPLAY_SCAN_CONCURRENCY,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        rate: float | None = None,
+        dry_run: bool = False,
+    ) -> ReplayFailedResult:
+        """Replay the failed deliveries of a time window, once per event.
+
+        Async counterpart of :meth:`Deliveries.replay_failed`.
+        """
+        scan = _ReplayScan(since, until)
+        first = await self.list(
+            destination_id=destination_id, route_id=route_id, status=status, limit=page_size
+        )
+        async for page in first.iter_pages(concurrency=scan_concurrency):
+            scan.add(page.data)
+        if dry_run or not scan.event_ids:
+            return scan.result(BulkReplayResult(), dry_run=dry_run)
+        replayed = await self.bulk_replay_events(
+            list(scan.event_ids), chunk_size=chunk_size, concurrency=1, rate=rate
         )
-        return self._parse(BulkReplayResult, resp)
+        return scan.result(replayed)
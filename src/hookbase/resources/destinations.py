@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -16,6 +17,15 @@ from ..models.destinations import (
     UpdateDestinationParams,
 )
 from ._base import AsyncResource, SyncResource, _to_body
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_delete,
+    run_bulk,
+)
+
+_PAGINATION = PageNumberPagination(data_key="destinations")
 
 
 class Destinations(SyncResource):
@@ -32,7 +42,7 @@ class Destinations(SyncResource):
             "search": search, "isActive": is_active,
         })
         return _fetch_offset_page(
-            self._transport, "/api/destinations", params, Destination, data_key="destinations"
+            self._transport, "/api/destinations", params, Destination, strategy=_PAGINATION
         )
 
     def get(self, id: str) -> Destination:
@@ -73,9 +83,26 @@ class Destinations(SyncResource):
         })
         return self._parse(ImportResult, resp)
 
-    def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = self._request("DELETE", "/api/destinations/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete destinations by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = self._request("DELETE", "/api/destinations/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
 
 class AsyncDestinations(AsyncResource):
@@ -92,7 +119,7 @@ class AsyncDestinations(AsyncResource):
             "search": search, "isActive": is_active,
         })
         return await _async_fetch_offset_page(
-            self._transport, "/api/destinations", params, Destination, data_key="destinations"
+            self._transport, "/api/destinations", params, Destination, strategy=_PAGINATION
         )
 
     async def get(self, id: str) -> Destination:
@@ -133,6 +160,23 @@ class AsyncDestinations(AsyncResource):
         })
         return self._parse(ImportResult, resp)
 
-    async def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = await self._request("DELETE", "/api/destinations/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    async def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete destinations by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = await self._request("DELETE", "/api/destinations/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return await async_run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
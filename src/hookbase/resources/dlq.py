@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, NamedTuple, Union
+
 from .._pagination import (
     AsyncCursorPage,
     SyncCursorPage,
     _async_fetch_cursor_page,
     _fetch_cursor_page,
 )
+from .._parallel import async_map_bounded, map_bounded
 from ..models.dlq import (
     DlqBulkDeleteResult,
     DlqBulkRetryResult,
@@ -13,8 +20,103 @@ from ..models.dlq import (
     DlqRetryResult,
     DlqStats,
 )
+from ..ratelimit import RateLimiter
 from ._base import AsyncResource, SyncResource
 
+DEFAULT_DRAIN_CHUNK_SIZE = 100
+DEFAULT_DRAIN_CONCURRENCY = 4
+
+Checkpoint = Union[str, os.PathLike[str]]
+
+
+class DrainProgress(NamedTuple):
+    """Progress of a :meth:`DLQ.drain`, reported after each chunk.
+
+    ``retried`` and ``failed`` count messages as reported by the
+    ``retry-bulk`` responses; ``cursor`` is where a resumed drain starts.
+    Counts include work done before the drain was resumed from a checkpoint.
+    """
+
+    pages: int
+    chunks: int
+    retried: int
+    failed: int
+    elapsed: float
+    cursor: str | None
+    done: bool
+
+
+class _Chunk(NamedTuple):
+    ids: list[str]
+    # Whether this is the last chunk of its page, and the cursor of the
+    # page after it (None on the final page).
+    page_end: bool
+    next_cursor: str | None
+
+
+class _DrainState:
+    """Counters and resumable cursor of a drain, optionally checkpointed."""
+
+    def __init__(self, path: Checkpoint | None, filters: dict[str, Any]) -> None:
+        self._path = os.fspath(path) if path is not None else None
+        self._filters = filters
+        self._started = time.monotonic()
+        self.cursor: str | None = None
+        self.pages = self.chunks = self.retried = self.failed = 0
+        if self._path is not None and os.path.exists(self._path):
+            with open(self._path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("filters") != filters:
+                raise ValueError("Checkpoint was written by a drain with different filters")
+            self.cursor = saved["cursor"]
+            self.pages = saved["pages"]
+            self.chunks = saved["chunks"]
+            self.retried = saved["retried"]
+            self.failed = saved["failed"]
+
+    def record(self, chunk: _Chunk, result: DlqBulkRetryResult | None) -> DrainProgress:
+        if result is not None:
+            self.chunks += 1
+            self.retried += result.retried
+            self.failed += result.failed
+        if chunk.page_end:
+            self.pages += 1
+            self.cursor = chunk.next_cursor
+            if chunk.next_cursor is not None:
+                self._save()
+        return self.progress(done=False)
+
+    def finish(self) -> DrainProgress:
+        # A finished drain leaves no checkpoint, so the next one starts over.
+        if self._path is not None and os.path.exists(self._path):
+            os.remove(self._path)
+        return self.progress(done=True)
+
+    def progress(self, *, done: bool) -> DrainProgress:
+        return DrainProgress(
+            self.pages, self.chunks, self.retried, self.failed,
+            time.monotonic() - self._started, self.cursor, done,
+        )
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        state = {
+            "filters": self._filters, "cursor": self.cursor, "pages": self.pages,
+            "chunks": self.chunks, "retried": self.retried, "failed": self.failed,
+        }
+        # Write then rename so a crash never leaves a torn checkpoint.
+        tmp = f"{self._path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self._path)
+
+
+def _page_chunks(ids: list[str], chunk_size: int, next_cursor: str | None) -> Iterator[_Chunk]:
+    parts = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)] or [[]]
+    for n, part in enumerate(parts):
+        yield _Chunk(part, n == len(parts) - 1, next_cursor)
+
 
 class DLQ(SyncResource):
     def list(
@@ -56,6 +158,86 @@ class DLQ(SyncResource):
         resp = self._request("DELETE", "/api/outbound-messages/dlq/bulk", json={"ids": ids})
         return self._parse(DlqBulkDeleteResult, resp)
 
+    def drain(
+        self,
+        *,
+        endpoint_id: str | None = None,
+        application_id: str | None = None,
+        dlq_reason: str | None = None,
+        event_type: str | None = None,
+        chunk_size: int = DEFAULT_DRAIN_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DRAIN_CONCURRENCY,
+        rate: float | None = None,
+        checkpoint: Checkpoint | None = None,
+        on_progress: Callable[[DrainProgress], None] | None = None,
+    ) -> DrainProgress:
+        """Retry every DLQ message matching the filters.
+
+        Message ids are read page by page (``chunk_size`` per page) and sent
+        to ``retry-bulk`` with up to *concurrency* chunks in flight. Requests
+        go through the client's rate limiter as usual; *rate* additionally
+        caps ``retry-bulk`` calls per second for this drain.
+
+        With a *checkpoint* file, the cursor is saved once every chunk of a
+        page has been retried, so a stopped or failed drain resumes where it
+        left off when run again with the same filters. The file is removed
+        when the drain completes.
+
+        Args:
+            endpoint_id: Only drain messages for this endpoint.
+            application_id: Only drain messages for this application.
+            dlq_reason: Only drain messages moved to the DLQ for this reason.
+            event_type: Only drain messages of this event type.
+            chunk_size: Message ids per ``retry-bulk`` call (default: 100).
+            concurrency: ``retry-bulk`` calls in flight (default: 4).
+            rate: Maximum ``retry-bulk`` calls per second (default: none).
+            checkpoint: Path of a JSON file to resume from and save to.
+            on_progress: Called with a :class:`DrainProgress` after each
+                chunk, in order.
+
+        Returns:
+            The final :class:`DrainProgress`.
+
+        Raises:
+            HookbaseError: If a page or chunk fails after the client's
+                retries; the checkpoint keeps the last completed page.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        filters = self._clean_params({
+            "endpointId": endpoint_id, "applicationId": application_id,
+            "dlqReason": dlq_reason, "eventType": event_type,
+        })
+        state = _DrainState(checkpoint, filters)
+        limiter = RateLimiter(rate) if rate is not None else None
+        path = "/api/outbound-messages/dlq/messages"
+
+        def chunks() -> Iterator[_Chunk]:
+            page = _fetch_cursor_page(
+                self._transport, path,
+                self._clean_params({**filters, "limit": chunk_size, "cursor": state.cursor}),
+                DlqMessage,
+            )
+            while True:
+                next_cursor = page.next_cursor if page.has_more else None
+                yield from _page_chunks([m.id for m in page.data], chunk_size, next_cursor)
+                if next_cursor is None:
+                    return
+                page = page.next_page()
+
+        def retry(chunk: _Chunk) -> tuple[_Chunk, DlqBulkRetryResult | None]:
+            if not chunk.ids:
+                return chunk, None
+            if limiter is not None:
+                limiter.acquire()
+            return chunk, self.retry_bulk(chunk.ids)
+
+        for chunk, result in map_bounded(retry, chunks(), concurrency):
+            progress = state.record(chunk, result)
+            if on_progress is not None:
+                on_progress(progress)
+        return state.finish()
+
 
 class AsyncDLQ(AsyncResource):
     async def list(
@@ -97,3 +279,57 @@ class AsyncDLQ(AsyncResource):
     async def bulk_delete(self, ids: list[str]) -> DlqBulkDeleteResult:
         resp = await self._request("DELETE", "/api/outbound-messages/dlq/bulk", json={"ids": ids})
         return self._parse(DlqBulkDeleteResult, resp)
+
+    async def drain(
+        self,
+        *,
+        endpoint_id: str | None = None,
+        application_id: str | None = None,
+        dlq_reason: str | None = None,
+        event_type: str | None = None,
+        chunk_size: int = DEFAULT_DRAIN_CHUNK_SIZE,
+        concurrency: int = DEFAULT_DRAIN_CONCURRENCY,
+        rate: float | None = None,
+        checkpoint: Checkpoint | None = None,
+        on_progress: Callable[[DrainProgress], None] | None = None,
+    ) -> DrainProgress:
+        """Retry every DLQ message matching the filters.
+
+        Async counterpart of :meth:`DLQ.drain`.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        filters = self._clean_params({
+            "endpointId": endpoint_id, "applicationId": application_id,
+            "dlqReason": dlq_reason, "eventType": event_type,
+        })
+        state = _DrainState(checkpoint, filters)
+        limiter = RateLimiter(rate) if rate is not None else None
+        path = "/api/outbound-messages/dlq/messages"
+
+        async def chunks() -> AsyncIterator[_Chunk]:
+            page = await _async_fetch_cursor_page(
+                self._transport, path,
+                self._clean_params({**filters, "limit": chunk_size, "cursor": state.cursor}),
+                DlqMessage,
+            )
+            while True:
+                next_cursor = page.next_cursor if page.has_more else None
+                for chunk in _page_chunks([m.id for m in page.data], chunk_size, next_cursor):
+                    yield chunk
+                if next_cursor is None:
+                    return
+                page = await page.next_page()
+
+        async def retry(chunk: _Chunk) -> tuple[_Chunk, DlqBulkRetryResult | None]:
+            if not chunk.ids:
+                return chunk, None
+            if limiter is not None:
+                await limiter.acquire_async()
+            return chunk, await self.retry_bulk(chunk.ids)
+
+        async for chunk, result in async_map_bounded(retry, chunks(), concurrency):
+            progress = state.record(chunk, result)
+            if on_progress is not None:
+                on_progress(progress)
+        return state.finish()
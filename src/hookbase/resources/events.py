@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    LimitOffsetPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
 )
+from .._streaming import DEFAULT_CHUNK_SIZE, ExportDestination
 from ..models.events import Event, EventDebugInfo, EventDetail
 from ._base import AsyncResource, SyncResource
 
+_PAGINATION = LimitOffsetPagination(data_key="events")
+
 
 class Events(SyncResource):
     def list(
@@ -32,7 +37,9 @@ class Events(SyncResource):
             "fromDate": from_date, "toDate": to_date,
             "signatureValid": signature_valid, "status": status,
         })
-        return _fetch_offset_page(self._transport, "/api/events", params, Event)
+        return _fetch_offset_page(
+            self._transport, "/api/events", params, Event, strategy=_PAGINATION
+        )
 
     def get(self, id: str) -> EventDetail:
         resp = self._request("GET", f"/api/events/{id}")
@@ -59,6 +66,55 @@ class Events(SyncResource):
         })
         return self._request("GET", "/api/events/export", params=params)
 
+    def iter_export(
+        self,
+        *,
+        format: str = "json",
+        source_id: str | None = None,
+        event_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        status: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream an export, yielding records as they are received.
+
+        Unlike :meth:`export`, the body is never held in memory as a whole:
+        ``json``, ``ndjson`` and ``csv`` exports are parsed incrementally.
+        """
+        params = self._clean_params({
+            "format": format, "sourceId": source_id,
+            "eventType": event_type,
+            "fromDate": from_date, "toDate": to_date, "status": status,
+        })
+        return self._stream_records("/api/events/export", params, format)
+
+    def export_to(
+        self,
+        destination: ExportDestination,
+        *,
+        format: str = "json",
+        source_id: str | None = None,
+        event_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        status: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Stream an export straight to a path or binary file object.
+
+        A path is written to a temporary file that replaces it only once the
+        export completes, so a failed export leaves an existing file as is.
+
+        Returns:
+            Number of bytes written.
+        """
+        params = self._clean_params({
+            "format": format, "sourceId": source_id,
+            "eventType": event_type,
+            "fromDate": from_date, "toDate": to_date, "status": status,
+        })
+        return self._stream_to("/api/events/export", params, destination, chunk_size)
+
 
 class AsyncEvents(AsyncResource):
     async def list(
@@ -80,7 +136,9 @@ class AsyncEvents(AsyncResource):
             "fromDate": from_date, "toDate": to_date,
             "signatureValid": signature_valid, "status": status,
         })
-        return await _async_fetch_offset_page(self._transport, "/api/events", params, Event)
+        return await _async_fetch_offset_page(
+            self._transport, "/api/events", params, Event, strategy=_PAGINATION
+        )
 
     async def get(self, id: str) -> EventDetail:
         resp = await self._request("GET", f"/api/events/{id}")
@@ -106,3 +164,52 @@ class AsyncEvents(AsyncResource):
             "fromDate": from_date, "toDate": to_date, "status": status,
         })
         return await self._request("GET", "/api/events/export", params=params)
+
+    def iter_export(
+        self,
+        *,
+        format: str = "json",
+        source_id: str | None = None,
+        event_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        status: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream an export, yielding records as they are received.
+
+        Unlike :meth:`export`, the body is never held in memory as a whole:
+        ``json``, ``ndjson`` and ``csv`` exports are parsed incrementally.
+        """
+        params = self._clean_params({
+            "format": format, "sourceId": source_id,
+            "eventType": event_type,
+            "fromDate": from_date, "toDate": to_date, "status": status,
+        })
+        return self._stream_records("/api/events/export", params, format)
+
+    async def export_to(
+        self,
+        destination: ExportDestination,
+        *,
+        format: str = "json",
+        source_id: str | None = None,
+        event_type: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        status: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Stream an export straight to a path or binary file object.
+
+        A path is written to a temporary file that replaces it only once the
+        export completes, so a failed export leaves an existing file as is.
+
+        Returns:
+            Number of bytes written.
+        """
+        params = self._clean_params({
+            "format": format, "sourceId": source_id,
+            "eventType": event_type,
+            "fromDate": from_date, "toDate": to_date, "status": status,
+        })
+        return await self._stream_to("/api/events/export", params, destination, chunk_size)
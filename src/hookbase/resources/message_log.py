@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 from .._pagination import (
@@ -8,9 +9,19 @@ from .._pagination import (
     _async_fetch_cursor_page,
     _fetch_cursor_page,
 )
-from ..models.messages import OutboundAttempt, OutboundMessage, ReplayResult, StatsSummary
+from .._parallel import async_map_bounded, map_bounded
+from .._streaming import DEFAULT_CHUNK_SIZE, ExportDestination
+from ..models.messages import (
+    MessageWithAttempts,
+    OutboundAttempt,
+    OutboundMessage,
+    ReplayResult,
+    StatsSummary,
+)
 from ._base import AsyncResource, SyncResource
 
+DEFAULT_ATTEMPTS_CONCURRENCY = 8
+
 
 class MessageLog(SyncResource):
     """Track outbound message delivery status."""
@@ -39,6 +50,42 @@ class MessageLog(SyncResource):
             params, OutboundMessage,
         )
 
+    def iter_with_attempts(
+        self,
+        *,
+        application_id: str | None = None,
+        endpoint_id: str | None = None,
+        message_id: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        concurrency: int = DEFAULT_ATTEMPTS_CONCURRENCY,
+    ) -> Iterator[MessageWithAttempts]:
+        """Iterate over matching messages, each joined with its attempts.
+
+        Takes the same filters as :meth:`list` (``limit`` is the page size).
+        Pages are streamed, and attempts are fetched on a thread pool with
+        at most *concurrency* requests in flight instead of one round trip
+        per message in turn. Messages are yielded in listing order.
+        """
+        first = self.list(
+            application_id=application_id, endpoint_id=endpoint_id, message_id=message_id,
+            status=status, event_type=event_type, start_date=start_date, end_date=end_date,
+            limit=limit,
+        )
+
+        def join(message: OutboundMessage) -> MessageWithAttempts:
+            return MessageWithAttempts(message=message, attempts=self.list_attempts(message.id))
+
+        pages = first.auto_paging_iter(prefetch=1)
+        try:
+            yield from map_bounded(join, pages, concurrency)
+        finally:
+            # Stops the prefetch thread when iteration ends early.
+            pages.close()
+
     def get(self, id: str) -> OutboundMessage:
         resp = self._request("GET", f"/api/outbound-messages/{id}")
         data = resp.get("data", resp)
@@ -79,6 +126,61 @@ class MessageLog(SyncResource):
         })
         return self._request("GET", "/api/outbound-messages/export", params=params)
 
+    def iter_export(
+        self,
+        *,
+        format: str = "json",
+        type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        application_id: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream an export, yielding records as they are received.
+
+        Unlike :meth:`export`, the body is never held in memory as a whole:
+        ``json``, ``ndjson`` and ``csv`` exports are parsed incrementally.
+        """
+        params = self._clean_params({
+            "format": format, "type": type,
+            "startDate": start_date, "endDate": end_date,
+            "status": status, "eventType": event_type,
+            "applicationId": application_id, "limit": limit,
+        })
+        return self._stream_records("/api/outbound-messages/export", params, format)
+
+    def export_to(
+        self,
+        destination: ExportDestination,
+        *,
+        format: str = "json",
+        type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        application_id: str | None = None,
+        limit: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Stream an export straight to a path or binary file object.
+
+        A path is written to a temporary file that replaces it only once the
+        export completes, so a failed export leaves an existing file as is.
+
+        Returns:
+            Number of bytes written.
+        """
+        params = self._clean_params({
+            "format": format, "type": type,
+            "startDate": start_date, "endDate": end_date,
+            "status": status, "eventType": event_type,
+            "applicationId": application_id, "limit": limit,
+        })
+        return self._stream_to("/api/outbound-messages/export", params, destination, chunk_size)
+
 
 class AsyncMessageLog(AsyncResource):
     """Track outbound message delivery status (async)."""
@@ -107,6 +209,42 @@ class AsyncMessageLog(AsyncResource):
             params, OutboundMessage,
         )
 
+    async def iter_with_attempts(
+        self,
+        *,
+        application_id: str | None = None,
+        endpoint_id: str | None = None,
+        message_id: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        concurrency: int = DEFAULT_ATTEMPTS_CONCURRENCY,
+    ) -> AsyncIterator[MessageWithAttempts]:
+        """Iterate over matching messages, each joined with its attempts.
+
+        Async counterpart of :meth:`MessageLog.iter_with_attempts`; attempts
+        are fetched as tasks on the running loop.
+        """
+        first = await self.list(
+            application_id=application_id, endpoint_id=endpoint_id, message_id=message_id,
+            status=status, event_type=event_type, start_date=start_date, end_date=end_date,
+            limit=limit,
+        )
+
+        async def join(message: OutboundMessage) -> MessageWithAttempts:
+            attempts = await self.list_attempts(message.id)
+            return MessageWithAttempts(message=message, attempts=attempts)
+
+        pages = first.auto_paging_iter(prefetch=1)
+        try:
+            async for joined in async_map_bounded(join, pages, concurrency):
+                yield joined
+        finally:
+            # async_map_bounded only closes its own wrapper around *pages*.
+            await pages.aclose()
+
     async def get(self, id: str) -> OutboundMessage:
         resp = await self._request("GET", f"/api/outbound-messages/{id}")
         data = resp.get("data", resp)
@@ -146,3 +284,60 @@ class AsyncMessageLog(AsyncResource):
             "applicationId": application_id, "limit": limit,
         })
         return await self._request("GET", "/api/outbound-messages/export", params=params)
+
+    def iter_export(
+        self,
+        *,
+        format: str = "json",
+        type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        application_id: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream an export, yielding records as they are received.
+
+        Unlike :meth:`export`, the body is never held in memory as a whole:
+        ``json``, ``ndjson`` and ``csv`` exports are parsed incrementally.
+        """
+        params = self._clean_params({
+            "format": format, "type": type,
+            "startDate": start_date, "endDate": end_date,
+            "status": status, "eventType": event_type,
+            "applicationId": application_id, "limit": limit,
+        })
+        return self._stream_records("/api/outbound-messages/export", params, format)
+
+    async def export_to(
+        self,
+        destination: ExportDestination,
+        *,
+        format: str = "json",
+        type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        status: str | None = None,
+        event_type: str | None = None,
+        application_id: str | None = None,
+        limit: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Stream an export straight to a path or binary file object.
+
+        A path is written to a temporary file that replaces it only once the
+        export completes, so a failed export leaves an existing file as is.
+
+        Returns:
+            Number of bytes written.
+        """
+        params = self._clean_params({
+            "format": format, "type": type,
+            "startDate": start_date, "endDate": end_date,
+            "status": status, "eventType": event_type,
+            "applicationId": application_id, "limit": limit,
+        })
+        return await self._stream_to(
+            "/api/outbound-messages/export", params, destination, chunk_size
+        )
@@ -1,70 +1,444 @@
 from __future__ import annotations
 
-from typing import Any
+import time
+import uuid
+from collections.abc import Iterable
+from typing import Any, Union
 
-from ..models.messages import SendEventResponse
-from ._base import AsyncResource, SyncResource
+from .._client import AsyncTransport, SyncTransport
+from .._parallel import async_map_bounded, map_bounded
+from ..batch import DEFAULT_SEND_CONCURRENCY, AsyncSendManyResult, SendManyResult, SendResult
+from ..codec import JSONCodec
+from ..errors import HookbaseError
+from ..models.messages import SendEventParams, SendEventResponse
+from ..outbox import Outbox, OutboxDrainResult, OutboxEvent
+from ._base import AsyncResource, SyncResource, _is_transient
+
+DEFAULT_DRAIN_BATCH_SIZE = 100
+
+SendItem = Union[SendEventParams, dict[str, Any]]
+
+
+def _send_event_body(
+    codec: JSONCodec,
+    application_id: str,
+    event_type: str,
+    payload: dict[str, Any] | bytes,
+    event_id: str | None,
+    metadata: dict[str, Any] | None,
+    endpoint_ids: list[str] | None,
+) -> dict[str, Any] | bytes:
+    body: dict[str, Any] = {"applicationId": application_id, "eventType": event_type}
+    if event_id is not None:
+        body["eventId"] = event_id
+    if metadata is not None:
+        body["metadata"] = metadata
+    if endpoint_ids is not None:
+        body["endpointIds"] = endpoint_ids
+    if not isinstance(payload, bytes):
+        body["payload"] = payload
+        return body
+    if not payload:
+        raise ValueError("payload must not be empty")
+    # Splice the pre-encoded payload in as the first member of the encoded
+    # body, so it is never decoded and re-encoded.
+    return b'{"payload":' + payload + b"," + codec.dumps(body)[1:]
+
+
+def _encoded_body(codec: JSONCodec, *args: Any) -> bytes:
+    body = _send_event_body(codec, *args)
+    return body if isinstance(body, bytes) else codec.dumps(body)
+
+
+def _require(outbox: Outbox | None) -> Outbox:
+    if outbox is None:
+        raise RuntimeError("No outbox configured; pass outbox= to the client")
+    return outbox
+
+
+def _settle(
+    outbox: Outbox,
+    batch: list[OutboxEvent],
+    errors: list[HookbaseError | None],
+    rejected: list[tuple[OutboxEvent, HookbaseError]],
+) -> tuple[int, HookbaseError | None]:
+    """Remove the settled events of a drained batch.
+
+    Returns the number sent and the transient error that stopped the batch,
+    if any. Events from that failure on stay in the outbox so the next drain
+    resumes in order.
+    """
+    settled: list[OutboxEvent] = []
+    sent = 0
+    stopped: HookbaseError | None = None
+    for event, error in zip(batch, errors):
+        if error is None:
+            sent += 1
+        elif _is_transient(error):
+            stopped = error
+            break
+        else:
+            rejected.append((event, error))
+        settled.append(event)
+    outbox.remove(settled)
+    return sent, stopped
+
+
+def _batch_key(item: SendItem) -> str:
+    """Pick the idempotency key a ``send_many`` item is sent with."""
+    if isinstance(item, SendEventParams):
+        return str(uuid.uuid4())
+    return item.get("idempotency_key") or str(uuid.uuid4())
+
+
+def _batch_params(item: SendItem) -> SendEventParams:
+    """Normalize a ``send_many`` item; raises ``ValueError`` if it is invalid."""
+    if isinstance(item, SendEventParams):
+        return item
+    return SendEventParams.model_validate(
+        {k: v for k, v in item.items() if k != "idempotency_key"}
+    )
 
 
 class Messages(SyncResource):
     """Send webhook events via the send-event endpoint."""
 
+    def __init__(self, transport: SyncTransport, outbox: Outbox | None = None) -> None:
+        super().__init__(transport)
+        self._outbox = outbox
+
+    @property
+    def outbox(self) -> Outbox | None:
+        """The durable outbox, if one is configured."""
+        return self._outbox
+
     def send(
         self,
         application_id: str,
         *,
         event_type: str,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | bytes,
         event_id: str | None = None,
         metadata: dict[str, Any] | None = None,
         endpoint_ids: list[str] | None = None,
         idempotency_key: str | None = None,
     ) -> SendEventResponse:
-        body: dict[str, Any] = {
-            "applicationId": application_id,
-            "eventType": event_type,
-            "payload": payload,
-        }
-        if event_id is not None:
-            body["eventId"] = event_id
-        if metadata is not None:
-            body["metadata"] = metadata
-        if endpoint_ids is not None:
-            body["endpointIds"] = endpoint_ids
+        """Send an event to the application's subscribed endpoints.
+
+        ``payload`` may be a dict or UTF-8 JSON bytes, e.g. a message read
+        straight from a queue; bytes are spliced into the request body
+        without being decoded and re-encoded.
+        """
+        body = _send_event_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        )
+        return self._post(body, idempotency_key)
+
+    def spool(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> str:
+        """Write an event to the outbox for :meth:`drain_outbox` to send.
+
+        Returns:
+            The idempotency key the event will be sent with.
+
+        Raises:
+            OutboxFullError: If the outbox is at its cap.
+        """
+        outbox = _require(self._outbox)
+        key = idempotency_key or str(uuid.uuid4())
+        outbox.append(key, _encoded_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        ))
+        return key
+
+    def send_or_spool(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> SendEventResponse | None:
+        """Send an event, spooling it to the outbox if the API is unreachable.
+
+        Timeouts, network errors and retryable statuses that persist after
+        the client's retries store the event (with its idempotency key) in
+        the outbox; other errors are raised as from :meth:`send`.
+
+        Returns:
+            The response, or ``None`` when the event was spooled.
+        """
+        outbox = _require(self._outbox)
+        key = idempotency_key or str(uuid.uuid4())
+        body = _encoded_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        )
+        try:
+            return self._post(body, key)
+        except HookbaseError as exc:
+            if not _is_transient(exc):
+                raise
+        outbox.append(key, body)
+        return None
+
+    def drain_outbox(
+        self, *, batch_size: int = DEFAULT_DRAIN_BATCH_SIZE, concurrency: int = 1
+    ) -> OutboxDrainResult:
+        """Send spooled events, oldest first, removing each once delivered.
+
+        Events are read in batches of *batch_size*. With the default
+        *concurrency* of 1 they are sent strictly in order; higher values
+        send each batch concurrently. The drain stops at the first transient
+        failure, leaving that event and those after it for the next drain.
+        """
+        outbox = _require(self._outbox)
+        rejected: list[tuple[OutboxEvent, HookbaseError]] = []
+        sent = 0
+        while True:
+            batch = outbox.peek(batch_size)
+            if not batch:
+                return OutboxDrainResult(sent, rejected, outbox.depth, None)
+            errors = list(map_bounded(self._resend, batch, concurrency))
+            count, stopped = _settle(outbox, batch, errors, rejected)
+            sent += count
+            if stopped is not None:
+                return OutboxDrainResult(sent, rejected, outbox.depth, stopped)
+
+    def _resend(self, event: OutboxEvent) -> HookbaseError | None:
+        try:
+            self._post(event.body, event.idempotency_key)
+        except HookbaseError as exc:
+            return exc
+        return None
+
+    def _post(self, body: dict[str, Any] | bytes, idempotency_key: str | None) -> SendEventResponse:
         resp = self._request(
             "POST", "/api/send-event", json=body, idempotency_key=idempotency_key
         )
         data = resp.get("data", resp) if isinstance(resp, dict) else resp
         return self._parse(SendEventResponse, data)
 
+    def send_many(
+        self,
+        application_id: str,
+        items: Iterable[SendItem],
+        *,
+        concurrency: int = DEFAULT_SEND_CONCURRENCY,
+        ordered: bool = True,
+    ) -> SendManyResult:
+        """Send many events with at most *concurrency* requests in flight.
+
+        Each item is a :class:`SendEventParams` or a dict of :meth:`send`
+        keyword arguments, and is sent with its own idempotency key (a dict
+        may supply one as ``idempotency_key``). A failed item is reported in
+        its :class:`SendResult` instead of stopping the batch. *items* is
+        read lazily, so it may be a generator.
+
+        Returns:
+            A :class:`SendManyResult` yielding results in input order, or as
+            each send completes when *ordered* is false.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        def send_one(job: tuple[int, SendItem]) -> SendResult:
+            index, item = job
+            key = _batch_key(item)
+            params: SendEventParams | None = None
+            started = time.monotonic()
+            try:
+                # Validated here so a malformed item fails alone, not the batch.
+                params = _batch_params(item)
+                response = self.send(
+                    application_id,
+                    event_type=params.event_type,
+                    payload=params.payload,
+                    event_id=params.event_id,
+                    metadata=params.metadata,
+                    endpoint_ids=params.endpoint_ids,
+                    idempotency_key=key,
+                )
+            except (HookbaseError, ValueError) as exc:
+                failed = params if params is not None else item
+                return SendResult(index, failed, key, None, exc, time.monotonic() - started)
+            return SendResult(index, params, key, response, None, time.monotonic() - started)
+
+        return SendManyResult(
+            map_bounded(send_one, enumerate(items), concurrency, ordered=ordered)
+        )
+
 
 class AsyncMessages(AsyncResource):
     """Send webhook events via the send-event endpoint (async)."""
 
+    def __init__(self, transport: AsyncTransport, outbox: Outbox | None = None) -> None:
+        super().__init__(transport)
+        self._outbox = outbox
+
+    @property
+    def outbox(self) -> Outbox | None:
+        """The durable outbox, if one is configured."""
+        return self._outbox
+
     async def send(
         self,
         application_id: str,
         *,
         event_type: str,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> SendEventResponse:
+        """Send an event to the application's subscribed endpoints.
+
+        Async counterpart of :meth:`Messages.send`.
+        """
+        body = _send_event_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        )
+        return await self._post(body, idempotency_key)
+
+    def spool(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
         event_id: str | None = None,
         metadata: dict[str, Any] | None = None,
         endpoint_ids: list[str] | None = None,
         idempotency_key: str | None = None,
+    ) -> str:
+        """Write an event to the outbox; see :meth:`Messages.spool`.
+
+        A local SQLite write, so this is a plain (blocking) method.
+        """
+        outbox = _require(self._outbox)
+        key = idempotency_key or str(uuid.uuid4())
+        outbox.append(key, _encoded_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        ))
+        return key
+
+    async def send_or_spool(
+        self,
+        application_id: str,
+        *,
+        event_type: str,
+        payload: dict[str, Any] | bytes,
+        event_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        endpoint_ids: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> SendEventResponse | None:
+        """Send an event, spooling it if the API is unreachable.
+
+        Async counterpart of :meth:`Messages.send_or_spool`.
+        """
+        outbox = _require(self._outbox)
+        key = idempotency_key or str(uuid.uuid4())
+        body = _encoded_body(
+            self._transport.codec, application_id, event_type, payload,
+            event_id, metadata, endpoint_ids,
+        )
+        try:
+            return await self._post(body, key)
+        except HookbaseError as exc:
+            if not _is_transient(exc):
+                raise
+        outbox.append(key, body)
+        return None
+
+    async def drain_outbox(
+        self, *, batch_size: int = DEFAULT_DRAIN_BATCH_SIZE, concurrency: int = 1
+    ) -> OutboxDrainResult:
+        """Send spooled events, oldest first; see :meth:`Messages.drain_outbox`."""
+        outbox = _require(self._outbox)
+        rejected: list[tuple[OutboxEvent, HookbaseError]] = []
+        sent = 0
+        while True:
+            batch = outbox.peek(batch_size)
+            if not batch:
+                return OutboxDrainResult(sent, rejected, outbox.depth, None)
+            errors = [e async for e in async_map_bounded(self._resend, batch, concurrency)]
+            count, stopped = _settle(outbox, batch, errors, rejected)
+            sent += count
+            if stopped is not None:
+                return OutboxDrainResult(sent, rejected, outbox.depth, stopped)
+
+    async def _resend(self, event: OutboxEvent) -> HookbaseError | None:
+        try:
+            await self._post(event.body, event.idempotency_key)
+        except HookbaseError as exc:
+            return exc
+        return None
+
+    async def _post(
+        self, body: dict[str, Any] | bytes, idempotency_key: str | None
     ) -> SendEventResponse:
-        body: dict[str, Any] = {
-            "applicationId": application_id,
-            "eventType": event_type,
-            "payload": payload,
-        }
-        if event_id is not None:
-            body["eventId"] = event_id
-        if metadata is not None:
-            body["metadata"] = metadata
-        if endpoint_ids is not None:
-            body["endpointIds"] = endpoint_ids
         resp = await self._request(
             "POST", "/api/send-event", json=body, idempotency_key=idempotency_key
         )
         data = resp.get("data", resp) if isinstance(resp, dict) else resp
         return self._parse(SendEventResponse, data)
+
+    def send_many(
+        self,
+        application_id: str,
+        items: Iterable[SendItem],
+        *,
+        concurrency: int = DEFAULT_SEND_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncSendManyResult:
+        """Send many events with at most *concurrency* requests in flight.
+
+        Async counterpart of :meth:`Messages.send_many`; iterate the result
+        with ``async for`` or ``await`` its :meth:`~AsyncSendManyResult.wait`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def send_one(job: tuple[int, SendItem]) -> SendResult:
+            index, item = job
+            key = _batch_key(item)
+            params: SendEventParams | None = None
+            started = time.monotonic()
+            try:
+                # Validated here so a malformed item fails alone, not the batch.
+                params = _batch_params(item)
+                response = await self.send(
+                    application_id,
+                    event_type=params.event_type,
+                    payload=params.payload,
+                    event_id=params.event_id,
+                    metadata=params.metadata,
+                    endpoint_ids=params.endpoint_ids,
+                    idempotency_key=key,
+                )
+            except (HookbaseError, ValueError) as exc:
+                failed = params if params is not None else item
+                return SendResult(index, failed, key, None, exc, time.monotonic() - started)
+            return SendResult(index, params, key, response, None, time.monotonic() - started)
+
+        return AsyncSendManyResult(
+            async_map_bounded(send_one, enumerate(items), concurrency, ordered=ordered)
+        )
@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -17,6 +18,16 @@ from ..models.routes import (
     UpdateRouteParams,
 )
 from ._base import AsyncResource, SyncResource, _to_body
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_delete,
+    merge_dicts,
+    run_bulk,
+)
+
+_PAGINATION = PageNumberPagination(data_key="routes")
 
 
 class Routes(SyncResource):
@@ -35,7 +46,7 @@ class Routes(SyncResource):
         })
         return _fetch_offset_page(
             self._transport, "/api/routes", params, Route,
-            data_key="routes",
+            strategy=_PAGINATION,
         )
 
     def get(self, id: str) -> Route:
@@ -68,16 +79,49 @@ class Routes(SyncResource):
         self._request("PATCH", f"/api/routes/{id}/circuit-config", json=body)
 
     def bulk_update(
-        self, ids: list[str], is_active: bool,
+        self,
+        ids: list[str],
+        is_active: bool,
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> dict[str, Any]:
-        return self._request(
-            "PATCH", "/api/routes/bulk",
-            json={"ids": ids, "isActive": is_active},
+        """Activate or deactivate routes, ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def update(chunk: list[str]) -> dict[str, Any]:
+            return self._request(
+                "PATCH", "/api/routes/bulk",
+                json={"ids": chunk, "isActive": is_active},
+            )
+
+        return run_bulk(
+            update, ids, merge_dicts,
+            chunk_size=chunk_size, concurrency=concurrency,
         )
 
-    def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = self._request("DELETE", "/api/routes/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete routes by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = self._request("DELETE", "/api/routes/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
     def export(self, *, ids: list[str] | None = None) -> dict[str, Any]:
         params = {"ids": ",".join(ids)} if ids else None
@@ -114,7 +158,7 @@ class AsyncRoutes(AsyncResource):
         })
         return await _async_fetch_offset_page(
             self._transport, "/api/routes", params, Route,
-            data_key="routes",
+            strategy=_PAGINATION,
         )
 
     async def get(self, id: str) -> Route:
@@ -147,16 +191,49 @@ class AsyncRoutes(AsyncResource):
         await self._request("PATCH", f"/api/routes/{id}/circuit-config", json=body)
 
     async def bulk_update(
-        self, ids: list[str], is_active: bool,
+        self,
+        ids: list[str],
+        is_active: bool,
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> dict[str, Any]:
-        return await self._request(
-            "PATCH", "/api/routes/bulk",
-            json={"ids": ids, "isActive": is_active},
+        """Activate or deactivate routes, ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def update(chunk: list[str]) -> dict[str, Any]:
+            return await self._request(
+                "PATCH", "/api/routes/bulk",
+                json={"ids": chunk, "isActive": is_active},
+            )
+
+        return await async_run_bulk(
+            update, ids, merge_dicts,
+            chunk_size=chunk_size, concurrency=concurrency,
         )
 
-    async def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = await self._request("DELETE", "/api/routes/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    async def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete routes by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = await self._request("DELETE", "/api/routes/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return await async_run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
     async def export(self, *, ids: list[str] | None = None) -> dict[str, Any]:
         params = {"ids": ",".join(ids)} if ids else None
@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -11,6 +12,8 @@ from .._pagination import (
 from ..models.schemas import CreateSchemaParams, Schema, UpdateSchemaParams
 from ._base import AsyncResource, SyncResource, _to_body
 
+_PAGINATION = PageNumberPagination(data_key="schemas")
+
 
 class Schemas(SyncResource):
     def list(
@@ -22,7 +25,7 @@ class Schemas(SyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return _fetch_offset_page(
             self._transport, "/api/schemas", params, Schema,
-            data_key="schemas",
+            strategy=_PAGINATION,
         )
 
     def get(self, id: str) -> Schema:
@@ -52,7 +55,7 @@ class AsyncSchemas(AsyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return await _async_fetch_offset_page(
             self._transport, "/api/schemas", params, Schema,
-            data_key="schemas",
+            strategy=_PAGINATION,
         )
 
     async def get(self, id: str) -> Schema:
@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -16,6 +17,15 @@ from ..models.sources import (
     UpdateSourceParams,
 )
 from ._base import AsyncResource, SyncResource, _to_body
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_delete,
+    run_bulk,
+)
+
+_PAGINATION = PageNumberPagination(data_key="sources")
 
 
 class Sources(SyncResource):
@@ -34,7 +44,7 @@ class Sources(SyncResource):
         })
         return _fetch_offset_page(
             self._transport, "/api/sources", params, Source,
-            data_key="sources",
+            strategy=_PAGINATION,
         )
 
     def get(self, id: str) -> Source:
@@ -79,9 +89,26 @@ class Sources(SyncResource):
         })
         return self._parse(ImportResult, resp)
 
-    def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = self._request("DELETE", "/api/sources/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete sources by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = self._request("DELETE", "/api/sources/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
 
 class AsyncSources(AsyncResource):
@@ -100,7 +127,7 @@ class AsyncSources(AsyncResource):
         })
         return await _async_fetch_offset_page(
             self._transport, "/api/sources", params, Source,
-            data_key="sources",
+            strategy=_PAGINATION,
         )
 
     async def get(self, id: str) -> Source:
@@ -145,6 +172,23 @@ class AsyncSources(AsyncResource):
         })
         return self._parse(ImportResult, resp)
 
-    async def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = await self._request("DELETE", "/api/sources/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    async def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete sources by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = await self._request("DELETE", "/api/sources/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return await async_run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
@@ -14,6 +14,13 @@ from ..models.subscriptions import (
     UpdateSubscriptionParams,
 )
 from ._base import AsyncResource, SyncResource, _to_body
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_lists,
+    run_bulk,
+)
 
 
 class Subscriptions(SyncResource):
@@ -55,13 +62,31 @@ class Subscriptions(SyncResource):
     def delete(self, id: str) -> None:
         self._request("DELETE", f"/api/webhook-subscriptions/{id}")
 
-    def bulk_create(self, endpoint_id: str, event_type_ids: list[str]) -> list[Subscription]:
-        resp = self._request("POST", "/api/webhook-subscriptions/bulk", json={
-            "endpointId": endpoint_id,
-            "eventTypeIds": event_type_ids,
-        })
-        items = resp.get("data", resp) if isinstance(resp, dict) else resp
-        return self._parse_list(Subscription, items)
+    def bulk_create(
+        self,
+        endpoint_id: str,
+        event_type_ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[Subscription]:
+        """Subscribe an endpoint to event types, ``chunk_size`` types per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def create(chunk: list[str]) -> list[Subscription]:
+            resp = self._request("POST", "/api/webhook-subscriptions/bulk", json={
+                "endpointId": endpoint_id,
+                "eventTypeIds": chunk,
+            })
+            items = resp.get("data", resp) if isinstance(resp, dict) else resp
+            return self._parse_list(Subscription, items)
+
+        return run_bulk(
+            create, event_type_ids, merge_lists,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
 
 class AsyncSubscriptions(AsyncResource):
@@ -105,10 +130,28 @@ class AsyncSubscriptions(AsyncResource):
     async def delete(self, id: str) -> None:
         await self._request("DELETE", f"/api/webhook-subscriptions/{id}")
 
-    async def bulk_create(self, endpoint_id: str, event_type_ids: list[str]) -> list[Subscription]:
-        resp = await self._request("POST", "/api/webhook-subscriptions/bulk", json={
-            "endpointId": endpoint_id,
-            "eventTypeIds": event_type_ids,
-        })
-        items = resp.get("data", resp) if isinstance(resp, dict) else resp
-        return self._parse_list(Subscription, items)
+    async def bulk_create(
+        self,
+        endpoint_id: str,
+        event_type_ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[Subscription]:
+        """Subscribe an endpoint to event types, ``chunk_size`` types per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def create(chunk: list[str]) -> list[Subscription]:
+            resp = await self._request("POST", "/api/webhook-subscriptions/bulk", json={
+                "endpointId": endpoint_id,
+                "eventTypeIds": chunk,
+            })
+            items = resp.get("data", resp) if isinstance(resp, dict) else resp
+            return self._parse_list(Subscription, items)
+
+        return await async_run_bulk(
+            create, event_type_ids, merge_lists,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
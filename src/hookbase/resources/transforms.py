@@ -4,6 +4,7 @@ from typing import Any
 
 from .._pagination import (
     AsyncOffsetPage,
+    PageNumberPagination,
     SyncOffsetPage,
     _async_fetch_offset_page,
     _fetch_offset_page,
@@ -16,6 +17,8 @@ from ..models.transforms import (
 )
 from ._base import AsyncResource, SyncResource, _to_body
 
+_PAGINATION = PageNumberPagination(data_key="transforms")
+
 
 class Transforms(SyncResource):
     def list(
@@ -27,7 +30,7 @@ class Transforms(SyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return _fetch_offset_page(
             self._transport, "/api/transforms", params, Transform,
-            data_key="transforms",
+            strategy=_PAGINATION,
         )
 
     def get(self, id: str) -> Transform:
@@ -77,7 +80,7 @@ class AsyncTransforms(AsyncResource):
         params = self._clean_params({"page": page, "pageSize": page_size})
         return await _async_fetch_offset_page(
             self._transport, "/api/transforms", params, Transform,
-            data_key="transforms",
+            strategy=_PAGINATION,
         )
 
     async def get(self, id: str) -> Transform:
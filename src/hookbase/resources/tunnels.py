@@ -5,6 +5,13 @@ from typing import Any
 from ..models.common import BulkDeleteResult
 from ..models.tunnels import CreateTunnelParams, Tunnel
 from ._base import AsyncResource, SyncResource, _to_body
+from ._bulk import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    async_run_bulk,
+    merge_delete,
+    run_bulk,
+)
 
 
 class Tunnels(SyncResource):
@@ -24,9 +31,26 @@ class Tunnels(SyncResource):
         data = resp.get("tunnel", resp.get("data", resp))
         return self._parse(Tunnel, data)
 
-    def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = self._request("DELETE", "/api/tunnels/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete tunnels by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = self._request("DELETE", "/api/tunnels/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
 
 
 class AsyncTunnels(AsyncResource):
@@ -46,6 +70,23 @@ class AsyncTunnels(AsyncResource):
         data = resp.get("tunnel", resp.get("data", resp))
         return self._parse(Tunnel, data)
 
-    async def bulk_delete(self, ids: list[str]) -> BulkDeleteResult:
-        resp = await self._request("DELETE", "/api/tunnels/bulk", json={"ids": ids})
-        return self._parse(BulkDeleteResult, resp)
+    async def bulk_delete(
+        self,
+        ids: list[str],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkDeleteResult:
+        """Delete tunnels by id, sending ``chunk_size`` ids per request.
+
+        Raises:
+            BulkOperationError: If only some chunks succeeded.
+        """
+        async def delete(chunk: list[str]) -> BulkDeleteResult:
+            resp = await self._request("DELETE", "/api/tunnels/bulk", json={"ids": chunk})
+            return self._parse(BulkDeleteResult, resp)
+
+        return await async_run_bulk(
+            delete, ids, merge_delete,
+            chunk_size=chunk_size, concurrency=concurrency,
+        )
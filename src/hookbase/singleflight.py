@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one.
+
+    While a call for a key is in flight, other threads asking for the same
+    key wait for it and share its result (or exception) instead of issuing
+    their own. Nothing is cached: once the call finishes the next request
+    for the key goes to the network again.
+
+    Example::
+
+        from hookbase import Hookbase
+
+        client = Hookbase(api_key="whr_...", coalesce_requests=True)
+        # ... many threads calling client.routes.get_circuit_status(route_id)
+        print(client.single_flight.hits, client.single_flight.misses)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Calls that shared another caller's in-flight request."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Calls that issued their own request."""
+        return self._misses
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, sharing the result with concurrent callers of *key*."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            result = call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Collapse concurrent identical coroutine calls into one.
+
+    Async counterpart of :class:`SingleFlight`. The shared call runs as its
+    own task, so cancelling one waiter does not cancel it for the others;
+    it is only cancelled once every waiter has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Calls that shared another caller's in-flight request."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Calls that issued their own request."""
+        return self._misses
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, sharing the result with concurrent callers of *key*."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, fn)
+            self._misses += 1
+        else:
+            self._hits += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)  # type: ignore[no-any-return]
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> _Flight:
+        flight = _Flight(asyncio.ensure_future(fn()))
+
+        def _finished(_: asyncio.Future[Any]) -> None:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+        flight.task.add_done_callback(_finished)
+        self._flights[key] = flight
+        return flight
@@ -3,32 +3,131 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import math
 import secrets
 import time
-from typing import Any
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
 
-from .errors import WebhookVerificationError
+from .codec import DEFAULT_CODEC, JSONCodec
+from .errors import WebhookReplayError, WebhookVerificationError
+
+if TYPE_CHECKING:
+    from .replay import ReplayGuard
 
 DEFAULT_TOLERANCE = 300  # 5 minutes
 
+# Raw request body; buffers are hashed and parsed in place, without copies.
+WebhookPayload = Union[str, bytes, bytearray, memoryview]
+
+# Outcome of one item in Webhook.verify_batch: the payload or the error.
+BatchResult = Union[dict[str, Any], WebhookVerificationError]
+
+DEFAULT_BATCH_WORKERS = 4
+
+
+class WebhookSecret(NamedTuple):
+    """A signing secret that stops being accepted at ``expires_at``.
+
+    ``expires_at`` is a Unix timestamp or an aware ``datetime``; ``None``
+    means the secret never expires.
+    """
+
+    secret: str
+    expires_at: float | datetime | None = None
+
+
+class _Key(NamedTuple):
+    mac: hmac.HMAC
+    expires_at: float | None
+    secret: str
+
 
 class Webhook:
     """Verify and parse incoming webhook payloads.
 
+    Several secrets can be active at once, e.g. while an endpoint secret is
+    rotated with a grace period: a signature made with any of them is
+    accepted, and each secret is dropped once it expires.
+
     Args:
-        secret: The webhook signing secret (with or without ``whsec_`` prefix).
+        secret: The webhook signing secret (with or without ``whsec_``
+            prefix), a :class:`WebhookSecret`, or a list of either.
+        replay_guard: Reject webhooks whose ``webhook-id`` was already
+            verified, raising :class:`WebhookReplayError` (default: none).
+        json_codec: Codec used to parse payloads (default: :class:`OrjsonCodec`
+            when orjson is installed, otherwise the standard library).
+
+    Example::
+
+        from hookbase import Webhook, WebhookSecret
+
+        wh = Webhook([
+            WebhookSecret("whsec_old...", expires_at=rotated_at + grace_period),
+            "whsec_new...",
+        ])
     """
 
-    def __init__(self, secret: str) -> None:
+    def __init__(
+        self,
+        secret: str | WebhookSecret | Iterable[str | WebhookSecret],
+        *,
+        replay_guard: ReplayGuard | None = None,
+        json_codec: JSONCodec | None = None,
+    ) -> None:
+        entries = [secret] if isinstance(secret, (str, WebhookSecret)) else list(secret)
+        if not entries:
+            raise ValueError("Webhook secret is required")
+        self._keys: list[_Key] = []
+        self._next_expiry: float | None = None
+        for entry in entries:
+            self.add_secret(entry)
+        self._replay_guard = replay_guard
+        self._codec = json_codec or DEFAULT_CODEC
+        self._pool: Executor | None = None
+        self._pool_spec: tuple[Any, ...] | None = None
+
+    def add_secret(
+        self, secret: str | WebhookSecret, expires_at: float | datetime | None = None
+    ) -> None:
+        """Start accepting signatures made with *secret*.
+
+        Args:
+            secret: The signing secret, or a :class:`WebhookSecret`.
+            expires_at: When to stop accepting it (Unix timestamp or
+                ``datetime``); ignored when *secret* carries its own expiry.
+        """
+        if isinstance(secret, WebhookSecret):
+            secret, expires_at = secret
         if not secret:
             raise ValueError("Webhook secret is required")
-        self._secret = secret
+        if isinstance(expires_at, datetime):
+            expires_at = expires_at.timestamp()
+        # Decode the key and run the HMAC key schedule once; each message
+        # hashes into a copy of this keyed state.
+        mac = hmac.new(_decode_secret(secret), digestmod=hashlib.sha256)
+        self._keys = [*self._keys, _Key(mac, expires_at, secret)]
+        self._next_expiry = _earliest(self._keys)
+
+    @property
+    def replay_guard(self) -> ReplayGuard | None:
+        return self._replay_guard
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._codec
+
+    @property
+    def active_secrets(self) -> int:
+        """Number of secrets currently accepted."""
+        return len(self._active_keys(raise_if_empty=False))
 
     def verify(
         self,
-        payload: str | bytes,
+        payload: WebhookPayload,
         headers: dict[str, str],
         *,
         tolerance: int = DEFAULT_TOLERANCE,
@@ -36,7 +135,9 @@ class Webhook:
         """Verify a webhook payload and return the parsed JSON.
 
         Args:
-            payload: Raw request body as a string or bytes.
+            payload: Raw request body as a string or a bytes-like buffer
+                (``bytes``, ``bytearray`` or ``memoryview``). Buffers are
+                hashed and parsed without being decoded or copied first.
             headers: Request headers containing ``webhook-id``,
                 ``webhook-timestamp``, and ``webhook-signature``.
             tolerance: Maximum age of the webhook in seconds (default 300).
@@ -46,38 +147,146 @@ class Webhook:
 
         Raises:
             WebhookVerificationError: If verification fails.
+            WebhookReplayError: If a replay guard is set and the webhook was
+                already received.
         """
-        if isinstance(payload, bytes):
-            payload = payload.decode("utf-8")
+        webhook_id, webhook_timestamp, webhook_signature = self._check_headers(
+            headers, tolerance
+        )
 
-        normalized = {k.lower(): v for k, v in headers.items()}
+        # Verify signature
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        self._verify_signature(body, webhook_id, webhook_timestamp, webhook_signature)
 
-        webhook_id = normalized.get("webhook-id")
-        webhook_timestamp = normalized.get("webhook-timestamp")
-        webhook_signature = normalized.get("webhook-signature")
+        # Parse before recording the id, so an unparsable body does not use
+        # up the id and block a redelivery.
+        data = _parse(payload, self._codec)
+        self._check_replay(webhook_id, webhook_timestamp)
+        return data
 
-        if not webhook_id:
-            raise WebhookVerificationError("Missing webhook-id header")
-        if not webhook_timestamp:
-            raise WebhookVerificationError("Missing webhook-timestamp header")
-        if not webhook_signature:
-            raise WebhookVerificationError("Missing webhook-signature header")
+    def verify_batch(
+        self,
+        items: Iterable[tuple[WebhookPayload, dict[str, str]]],
+        *,
+        workers: int = DEFAULT_BATCH_WORKERS,
+        processes: bool = False,
+        tolerance: int = DEFAULT_TOLERANCE,
+    ) -> list[BatchResult]:
+        """Verify and parse many webhooks on a worker pool.
 
-        # Verify timestamp
-        self._verify_timestamp(webhook_timestamp, tolerance)
+        Results come back in input order. A webhook that fails verification
+        yields its :class:`WebhookVerificationError` in place of the payload
+        rather than aborting the batch. The replay guard, if any, is applied
+        in the calling process, in input order.
 
-        # Verify signature
-        self._verify_signature(payload, webhook_id, webhook_timestamp, webhook_signature)
+        Threads share this verifier's keyed HMAC state; hashing large bodies
+        releases the GIL. With ``processes=True`` each worker process builds
+        its own keyed state once and header parsing and JSON decoding run on
+        several cores. The pool is kept for later batches until
+        :meth:`close` is called.
 
-        # Parse and return
-        try:
-            return json.loads(payload)  # type: ignore[no-any-return]
-        except json.JSONDecodeError as exc:
-            raise WebhookVerificationError("Invalid JSON payload") from exc
+        Args:
+            items: ``(payload, headers)`` pairs, as passed to :meth:`verify`.
+            workers: Pool size (default 4).
+            processes: Use a process pool instead of threads.
+            tolerance: Maximum age of each webhook in seconds (default 300).
+
+        Returns:
+            One payload dict or :class:`WebhookVerificationError` per item.
+
+        Raises:
+            WebhookVerificationError: If every secret has expired.
+
+        Example::
+
+            results = wh.verify_batch(batch, workers=8, processes=True)
+            for result in results:
+                if isinstance(result, WebhookVerificationError):
+                    ...
+        """
+        batch = list(items)
+        if not batch:
+            return []
+        pool = self._batch_pool(workers, processes)
+        if processes:
+            # Buffers such as memoryview cannot be pickled.
+            batch = [
+                (bytes(p) if isinstance(p, (bytearray, memoryview)) else p, h) for p, h in batch
+            ]
+            chunksize = max(1, len(batch) // (workers * 4))
+            verify = partial(_verify_in_worker, tolerance=tolerance)
+            outcomes = list(pool.map(verify, batch, chunksize=chunksize))
+        else:
+            outcomes = list(pool.map(partial(_verify_item, self, tolerance=tolerance), batch))
+
+        results: list[BatchResult] = []
+        for result, webhook_id, webhook_timestamp in outcomes:
+            if webhook_id is not None and webhook_timestamp is not None:
+                try:
+                    self._check_replay(webhook_id, webhook_timestamp)
+                except WebhookReplayError as exc:
+                    result = exc
+            results.append(result)
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker pool started by :meth:`verify_batch`."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_spec = None
+
+    def __enter__(self) -> Webhook:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def verifier(
+        self,
+        headers: dict[str, str],
+        *,
+        tolerance: int = DEFAULT_TOLERANCE,
+    ) -> SignatureVerifier:
+        """Start verifying a webhook whose body has not been read yet.
+
+        The headers and timestamp are checked immediately, so stale or
+        unsigned requests can be rejected before any of the body is read.
+        Feed the body to the returned verifier as it arrives, then call
+        :meth:`SignatureVerifier.verify`.
+
+        Args:
+            headers: Request headers containing ``webhook-id``,
+                ``webhook-timestamp``, and ``webhook-signature``.
+            tolerance: Maximum age of the webhook in seconds (default 300).
+
+        Raises:
+            WebhookVerificationError: If a header is missing or malformed or
+                the timestamp is outside the tolerance.
+
+        Example::
+
+            verifier = wh.verifier(request.headers)
+            for chunk in request.stream():
+                verifier.update(chunk)
+            verifier.verify()
+        """
+        webhook_id, webhook_timestamp, webhook_signature = self._check_headers(
+            headers, tolerance
+        )
+        if not _parse_signatures(webhook_signature):
+            raise WebhookVerificationError("No valid signatures found")
+        return SignatureVerifier(
+            self,
+            self._start(webhook_id, webhook_timestamp),
+            webhook_id,
+            webhook_timestamp,
+            webhook_signature,
+        )
 
     def generate_test_headers(
         self,
-        payload: str,
+        payload: WebhookPayload,
         *,
         webhook_id: str | None = None,
         timestamp: int | None = None,
@@ -85,24 +294,68 @@ class Webhook:
         """Generate valid webhook headers for testing.
 
         Args:
-            payload: The payload string to sign.
+            payload: The payload to sign, as a string or bytes-like buffer.
             webhook_id: Optional webhook ID (generated if not provided).
             timestamp: Optional Unix timestamp (current time if not provided).
 
         Returns:
-            Dict with ``webhook-id``, ``webhook-timestamp``, ``webhook-signature``.
+            Dict with ``webhook-id``, ``webhook-timestamp``, ``webhook-signature``
+            (signed with every active secret).
         """
         wh_id = webhook_id or f"msg_{secrets.token_urlsafe(18)}"
         ts = str(timestamp or math.floor(time.time()))
-        signed_content = f"{wh_id}.{ts}.{payload}"
-        signature = self._sign(signed_content)
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        signature = " ".join(
+            f"v1,{base64.b64encode(digest).decode()}" for digest in self._digest(wh_id, ts, body)
+        )
 
         return {
             "webhook-id": wh_id,
             "webhook-timestamp": ts,
-            "webhook-signature": f"v1,{signature}",
+            "webhook-signature": signature,
         }
 
+    def _batch_pool(self, workers: int, processes: bool) -> Executor:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        keys = self._active_keys()
+        # Worker processes hold a copy of the keyring; rebuild them if it changed.
+        secrets_ = tuple(WebhookSecret(k.secret, k.expires_at) for k in keys) if processes else ()
+        spec = (processes, workers, secrets_, self._codec)
+        if self._pool is None or self._pool_spec != spec:
+            self.close()
+            if processes:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(list(secrets_), self._codec),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="hookbase-webhook"
+                )
+            self._pool_spec = spec
+        return self._pool
+
+    def _check_headers(self, headers: dict[str, str], tolerance: int) -> tuple[str, str, str]:
+        """Return the id, timestamp and signature headers after validating them."""
+        normalized = {k.lower(): v for k, v in headers.items()}
+
+        webhook_id = normalized.get("webhook-id")
+        webhook_timestamp = normalized.get("webhook-timestamp")
+        webhook_signature = normalized.get("webhook-signature")
+
+        if not webhook_id:
+            raise WebhookVerificationError("Missing webhook-id header")
+        if not webhook_timestamp:
+            raise WebhookVerificationError("Missing webhook-timestamp header")
+        if not webhook_signature:
+            raise WebhookVerificationError("Missing webhook-signature header")
+
+        # Verify timestamp
+        self._verify_timestamp(webhook_timestamp, tolerance)
+        return webhook_id, webhook_timestamp, webhook_signature
+
     def _verify_timestamp(self, timestamp: str, tolerance: int) -> None:
         try:
             webhook_time = int(timestamp)
@@ -119,14 +372,26 @@ class Webhook:
 
     def _verify_signature(
         self,
-        payload: str,
+        payload: bytes | bytearray | memoryview,
         webhook_id: str,
         webhook_timestamp: str,
         webhook_signature: str,
     ) -> None:
-        signed_content = f"{webhook_id}.{webhook_timestamp}.{payload}"
-        expected = self._sign(signed_content)
+        self._match(self._digest(webhook_id, webhook_timestamp, payload), webhook_signature)
+
+    def _check_replay(self, webhook_id: str, webhook_timestamp: str) -> None:
+        # Only called after the signature checked out, so forged requests
+        # cannot fill the guard or block a genuine id.
+        guard = self._replay_guard
+        if guard is not None and not guard.add(webhook_id, int(webhook_timestamp)):
+            raise WebhookReplayError(webhook_id)
+
+    def _match(self, expected: list[bytes], webhook_signature: str) -> None:
+        """Raise unless a ``v1`` signature in the header is one of *expected*.
 
+        Each signature is decoded once and compared with the digest of every
+        active key.
+        """
         signatures = _parse_signatures(webhook_signature)
         if not signatures:
             raise WebhookVerificationError("No valid signatures found")
@@ -134,25 +399,141 @@ class Webhook:
         for version, sig in signatures:
             if version == "v1":
                 try:
-                    expected_bytes = base64.b64decode(expected)
-                    actual_bytes = base64.b64decode(sig)
-                    if hmac.compare_digest(expected_bytes, actual_bytes):
-                        return
-                except Exception:
+                    actual = base64.b64decode(sig)
+                except ValueError:
                     continue
+                for digest in expected:
+                    if hmac.compare_digest(digest, actual):
+                        return
 
         raise WebhookVerificationError("Webhook signature verification failed")
 
-    def _sign(self, signed_content: str) -> str:
-        key = self._decode_secret()
-        mac = hmac.new(key, signed_content.encode("utf-8"), hashlib.sha256)
-        return base64.b64encode(mac.digest()).decode("utf-8")
+    def _digest(
+        self, webhook_id: str, webhook_timestamp: str, payload: bytes | bytearray | memoryview
+    ) -> list[bytes]:
+        """HMAC of ``{id}.{timestamp}.{payload}`` under each active key."""
+        digests = []
+        for mac in self._start(webhook_id, webhook_timestamp):
+            mac.update(payload)
+            digests.append(mac.digest())
+        return digests
+
+    def _start(self, webhook_id: str, webhook_timestamp: str) -> list[hmac.HMAC]:
+        """Per-key HMAC states with the ``{id}.{timestamp}.`` prefix already fed."""
+        prefix = f"{webhook_id}.{webhook_timestamp}.".encode()
+        macs = []
+        for key in self._active_keys():
+            mac = key.mac.copy()
+            mac.update(prefix)
+            macs.append(mac)
+        return macs
+
+    def _active_keys(self, *, raise_if_empty: bool = True) -> list[_Key]:
+        """Return the unexpired keys, dropping expired ones from the keyring."""
+        keys = self._keys
+        now = time.time()
+        if self._next_expiry is None or self._next_expiry > now:
+            active = keys
+        else:
+            active = [k for k in keys if k.expires_at is None or k.expires_at > now]
+            self._keys = active
+            self._next_expiry = _earliest(active)
+        if not active and raise_if_empty:
+            raise WebhookVerificationError("All webhook secrets have expired")
+        return active
+
+
+class SignatureVerifier:
+    """Incremental signature check for a body that arrives in chunks.
+
+    Created by :meth:`Webhook.verifier` after the headers have been checked.
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        macs: list[hmac.HMAC],
+        webhook_id: str,
+        webhook_timestamp: str,
+        signature: str,
+    ) -> None:
+        self._webhook = webhook
+        self._macs = macs
+        self._webhook_id = webhook_id
+        self._webhook_timestamp = webhook_timestamp
+        self._signature = signature
+
+    @property
+    def webhook_id(self) -> str:
+        return self._webhook_id
+
+    def update(self, chunk: bytes | bytearray | memoryview) -> None:
+        """Hash the next chunk of the body."""
+        for mac in self._macs:
+            mac.update(chunk)
+
+    def verify(self) -> None:
+        """Check the signature over every chunk fed so far.
+
+        Raises:
+            WebhookVerificationError: If no signature matches.
+            WebhookReplayError: If a replay guard is set and the webhook was
+                already received.
+        """
+        self._webhook._match([mac.digest() for mac in self._macs], self._signature)
+        self._webhook._check_replay(self._webhook_id, self._webhook_timestamp)
+
+
+# Verifier owned by a verify_batch worker process.
+_worker_webhook: Webhook | None = None
+
+
+def _init_worker(secrets_: list[WebhookSecret], codec: JSONCodec) -> None:
+    global _worker_webhook
+    _worker_webhook = Webhook(secrets_, json_codec=codec)
+
+
+def _verify_in_worker(
+    item: tuple[WebhookPayload, dict[str, str]], tolerance: int
+) -> tuple[BatchResult, str | None, str | None]:
+    assert _worker_webhook is not None
+    return _verify_item(_worker_webhook, item, tolerance=tolerance)
+
+
+def _verify_item(
+    webhook: Webhook, item: tuple[WebhookPayload, dict[str, str]], tolerance: int
+) -> tuple[BatchResult, str | None, str | None]:
+    """Verify one batch item; return the outcome and its id and timestamp."""
+    payload, headers = item
+    try:
+        webhook_id, webhook_timestamp, webhook_signature = webhook._check_headers(
+            headers, tolerance
+        )
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        webhook._verify_signature(body, webhook_id, webhook_timestamp, webhook_signature)
+        return _parse(payload, webhook._codec), webhook_id, webhook_timestamp
+    except WebhookVerificationError as exc:
+        # No id is returned, so verify_batch records nothing for a webhook
+        # that failed its signature or JSON parsing.
+        return exc, None, None
+
+
+def _parse(payload: WebhookPayload, codec: JSONCodec) -> dict[str, Any]:
+    try:
+        return codec.loads(payload)  # type: ignore[no-any-return]
+    except ValueError as exc:  # JSONDecodeError or invalid UTF-8
+        raise WebhookVerificationError("Invalid JSON payload") from exc
+
+
+def _earliest(keys: list[_Key]) -> float | None:
+    expiries = [k.expires_at for k in keys if k.expires_at is not None]
+    return min(expiries) if expiries else None
+
 
-    def _decode_secret(self) -> bytes:
-        secret = self._secret
-        if secret.startswith("whsec_"):
-            secret = secret[6:]
-        return base64.b64decode(secret)
+def _decode_secret(secret: str) -> bytes:
+    if secret.startswith("whsec_"):
+        secret = secret[6:]
+    return base64.b64decode(secret)
 
 
 def _parse_signatures(header: str) -> list[tuple[str, str]]:
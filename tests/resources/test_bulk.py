@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, BulkOperationError, Hookbase, NotFoundError
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+@pytest.fixture
+def client(mock_api):
+    c = Hookbase(api_key="whr_test", max_retries=0)
+    yield c
+    c.close()
+
+
+def _ids(request: httpx.Request, key: str = "ids") -> list[str]:
+    return json.loads(request.content)[key]
+
+
+def test_bulk_delete_splits_into_chunks_and_merges(mock_api, client):
+    route = mock_api.delete("/api/sources/bulk").mock(
+        side_effect=lambda r: httpx.Response(200, json={"success": True, "deleted": len(_ids(r))})
+    )
+
+    result = client.sources.bulk_delete([f"src_{n}" for n in range(250)], chunk_size=100)
+
+    assert result.deleted == 250 and result.success
+    assert sorted(len(_ids(call.request)) for call in route.calls) == [50, 100, 100]
+
+
+def test_small_bulk_call_is_a_single_request(mock_api, client):
+    route = mock_api.delete("/api/tunnels/bulk").respond(404, json={"error": "nope"})
+
+    with pytest.raises(NotFoundError):
+        client.tunnels.bulk_delete(["tun_1", "tun_2"])
+    assert route.call_count == 1
+
+
+def test_transient_chunk_failure_is_retried_on_its_own(mock_api, client):
+    attempts: dict[str, int] = {}
+
+    def respond(request):
+        first = _ids(request)[0]
+        attempts[first] = attempts.get(first, 0) + 1
+        if first == "del_2" and attempts[first] == 1:
+            return httpx.Response(503, json={"error": "busy"})
+        ids = _ids(request)
+        return httpx.Response(200, json={"queued": len(ids), "results": [{"id": i} for i in ids]})
+
+    mock_api.post("/api/deliveries/bulk-replay").mock(side_effect=respond)
+
+    result = client.deliveries.bulk_replay([f"del_{n}" for n in range(6)], chunk_size=2)
+
+    assert result.queued == 6
+    assert [r["id"] for r in result.results] == [f"del_{n}" for n in range(6)]
+    assert attempts == {"del_0": 1, "del_2": 2, "del_4": 1}
+
+
+def test_partial_failure_carries_merged_result(mock_api, client):
+    def respond(request):
+        ids = _ids(request)
+        if "rt_3" in ids:
+            return httpx.Response(400, json={"error": "invalid id"})
+        return httpx.Response(200, json={"success": True, "updated": len(ids)})
+
+    route = mock_api.patch("/api/routes/bulk").mock(side_effect=respond)
+
+    with pytest.raises(BulkOperationError) as info:
+        client.routes.bulk_update([f"rt_{n}" for n in range(6)], True, chunk_size=2)
+
+    assert info.value.result == {"success": True, "updated": 4}
+    assert [chunk for chunk, _ in info.value.failed] == [["rt_2", "rt_3"]]
+    assert route.call_count == 3  # validation errors are not retried
+
+
+async def test_async_bulk_create_keeps_input_order(mock_api):
+    def respond(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"data": [
+            {"id": f"sub_{t}", "endpointId": body["endpointId"], "eventTypeId": t}
+            for t in body["eventTypeIds"]
+        ]})
+
+    mock_api.post("/api/webhook-subscriptions/bulk").mock(side_effect=respond)
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        subs = await client.outbound.subscriptions.bulk_create(
+            "ep_1", [f"et_{n}" for n in range(7)], chunk_size=3, concurrency=3
+        )
+
+    assert [s.event_type_id for s in subs] == [f"et_{n}" for n in range(7)]
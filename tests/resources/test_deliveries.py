@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, Hookbase
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+@pytest.fixture
+def client(mock_api):
+    c = Hookbase(api_key="whr_test")
+    yield c
+    c.close()
+
+
+def _delivery(n: int, event: str, day: int) -> dict:
+    return {
+        "id": f"del_{n}", "eventId": event, "routeId": "rt_1", "destinationId": "dst_1",
+        "organizationId": "org_1", "status": "failed",
+        "createdAt": f"2024-03-{day:02d}T12:00:00.000Z",
+    }
+
+
+# Two failed deliveries per event (e.g. retries), spread over ten days.
+DELIVERIES = [_delivery(n, f"evt_{n // 2}", 1 + n // 3) for n in range(30)]
+
+
+def _list(request: httpx.Request) -> httpx.Response:
+    assert request.url.params["status"] == "failed"
+    assert request.url.params["destinationId"] == "dst_1"
+    limit = int(request.url.params["limit"])
+    offset = int(request.url.params.get("offset", 0))
+    return httpx.Response(200, json={
+        "deliveries": DELIVERIES[offset:offset + limit],
+        "pagination": {"total": len(DELIVERIES), "limit": limit, "offset": offset},
+    })
+
+
+def _replay(request: httpx.Request) -> httpx.Response:
+    ids = json.loads(request.content)["eventIds"]
+    return httpx.Response(200, json={"message": "ok", "queued": len(ids), "skipped": 0})
+
+
+def test_replay_failed_dedupes_events_in_window(mock_api, client):
+    listing = mock_api.get("/api/deliveries").mock(side_effect=_list)
+    replay = mock_api.post("/api/deliveries/bulk-replay").mock(side_effect=_replay)
+
+    result = client.deliveries.replay_failed(
+        destination_id="dst_1",
+        since="2024-03-03",
+        until=datetime(2024, 3, 6, tzinfo=timezone.utc),
+        page_size=7,
+        chunk_size=2,
+        rate=1000,
+    )
+
+    # Days 3-5 hold deliveries 6..14, i.e. events 3..7.
+    assert (result.scanned, result.deliveries) == (30, 9)
+    assert result.event_ids == [f"evt_{n}" for n in range(3, 8)]
+    assert (result.queued, result.dry_run) == (5, False)
+    assert listing.call_count == 5
+    sent = [json.loads(call.request.content)["eventIds"] for call in replay.calls]
+    assert sent == [["evt_3", "evt_4"], ["evt_5", "evt_6"], ["evt_7"]]
+
+
+def test_replay_failed_dry_run_only_scans(mock_api, client):
+    mock_api.get("/api/deliveries").mock(side_effect=_list)
+
+    # No bulk-replay route: respx fails the test if one is attempted.
+    result = client.deliveries.replay_failed(destination_id="dst_1", dry_run=True)
+
+    assert (result.deliveries, len(result.event_ids), result.queued) == (30, 15, 0)
+    assert result.dry_run
+
+
+async def test_async_replay_failed(mock_api):
+    mock_api.get("/api/deliveries").mock(side_effect=_list)
+    replay = mock_api.post("/api/deliveries/bulk-replay").mock(side_effect=_replay)
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        result = await client.deliveries.replay_failed(
+            destination_id="dst_1", since="2024-03-10T00:00:00Z", page_size=10
+        )
+
+    assert result.event_ids == ["evt_13", "evt_14"]
+    assert result.queued == 2
+    assert replay.call_count == 1
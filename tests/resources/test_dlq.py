@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
+
+import httpx
 import pytest
 import respx
 
-from hookbase import Hookbase
+from hookbase import APIError, AsyncHookbase, Hookbase
 from hookbase.models import DlqMessage, DlqRetryResult, DlqStats
 
 from ..conftest import make_cursor_response
@@ -86,3 +89,79 @@ def test_dlq_bulk_delete(mock_api, client):
     mock_api.delete("/api/outbound-messages/dlq/bulk").respond(200, json={"total": 2, "deleted": 2})
     result = client.outbound.dlq.bulk_delete(["dlq_1", "dlq_2"])
     assert result.deleted == 2
+
+
+class FakeDLQ:
+    """DLQ listing in cursor pages plus a retry-bulk that can be broken."""
+
+    def __init__(self, count: int, page_size_cap: int = 1000) -> None:
+        self.ids = [f"dlq_{n}" for n in range(count)]
+        self.cap = page_size_cap
+        self.retried: list[str] = []
+        self.fail_on: str | None = None
+
+    def list(self, request: httpx.Request) -> httpx.Response:
+        limit = min(int(request.url.params.get("limit", 50)), self.cap)
+        start = int(request.url.params.get("cursor") or 0)
+        chunk = self.ids[start:start + limit]
+        more = start + limit < len(self.ids)
+        items = [{**DLQ_MSG, "id": i} for i in chunk]
+        return httpx.Response(200, json=make_cursor_response(
+            items, has_more=more, next_cursor=str(start + limit) if more else None
+        ))
+
+    def retry(self, request: httpx.Request) -> httpx.Response:
+        ids = json.loads(request.content)["ids"]
+        if self.fail_on in ids:
+            return httpx.Response(500, json={"error": "boom"})
+        self.retried.extend(ids)
+        return httpx.Response(200, json={"total": len(ids), "retried": len(ids), "failed": 0})
+
+
+@pytest.fixture
+def fake_dlq(mock_api):
+    fake = FakeDLQ(25)
+    mock_api.get("/api/outbound-messages/dlq/messages").mock(side_effect=fake.list)
+    mock_api.post("/api/outbound-messages/dlq/retry-bulk").mock(side_effect=fake.retry)
+    return fake
+
+
+def test_drain_retries_every_message_in_chunks(fake_dlq, client):
+    progress = []
+
+    final = client.outbound.dlq.drain(
+        endpoint_id="ep_1", chunk_size=10, concurrency=3, on_progress=progress.append
+    )
+
+    assert sorted(fake_dlq.retried) == sorted(fake_dlq.ids)
+    assert (final.pages, final.chunks, final.retried, final.done) == (3, 3, 25, True)
+    assert [p.retried for p in progress] == [10, 20, 25]
+
+
+def test_drain_resumes_from_checkpoint(fake_dlq, tmp_path):
+    checkpoint = tmp_path / "drain.json"
+    client = Hookbase(api_key="whr_test", max_retries=0)
+    fake_dlq.fail_on = "dlq_12"
+
+    with pytest.raises(APIError):
+        client.outbound.dlq.drain(chunk_size=10, concurrency=1, checkpoint=checkpoint)
+    assert json.loads(checkpoint.read_text())["cursor"] == "10"
+
+    fake_dlq.fail_on = None
+    final = client.outbound.dlq.drain(chunk_size=10, checkpoint=checkpoint)
+
+    assert fake_dlq.retried == fake_dlq.ids
+    assert (final.pages, final.retried) == (3, 25)
+    assert not checkpoint.exists()
+    with pytest.raises(ValueError):
+        checkpoint.write_text(json.dumps({"filters": {"eventType": "x"}, "cursor": "10"}))
+        client.outbound.dlq.drain(checkpoint=checkpoint)
+    client.close()
+
+
+async def test_async_drain_with_rate(fake_dlq):
+    async with AsyncHookbase(api_key="whr_test") as client:
+        final = await client.outbound.dlq.drain(chunk_size=5, concurrency=4, rate=1000)
+
+    assert sorted(fake_dlq.retried) == sorted(fake_dlq.ids)
+    assert final.chunks == 5
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, Hookbase
+
+from ..conftest import make_cursor_response
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+MESSAGES = [{"id": f"msg_{n}", "eventType": "order.created", "status": "failed"} for n in range(7)]
+
+
+def _list(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params.get("cursor") or 0)
+    limit = int(request.url.params["limit"])
+    more = start + limit < len(MESSAGES)
+    return httpx.Response(200, json=make_cursor_response(
+        MESSAGES[start:start + limit], has_more=more,
+        next_cursor=str(start + limit) if more else None,
+    ))
+
+
+class Attempts:
+    """Attempts endpoint that records how many requests overlap."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        message_id = request.url.path.split("/")[-2]
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return httpx.Response(200, json={"data": [
+            {"id": f"{message_id}_a{n}", "outboundMessageId": message_id, "attemptNumber": n}
+            for n in (1, 2)
+        ]})
+
+
+def test_iter_with_attempts_joins_concurrently(mock_api):
+    mock_api.get("/api/outbound-messages").mock(side_effect=_list)
+    attempts = Attempts()
+    route = mock_api.get(url__regex=r"/api/outbound-messages/msg_\d+/attempts").mock(
+        side_effect=attempts
+    )
+    client = Hookbase(api_key="whr_test")
+
+    joined = list(client.outbound.message_log.iter_with_attempts(
+        status="failed", limit=3, concurrency=3
+    ))
+
+    assert [j.message.id for j in joined] == [m["id"] for m in MESSAGES]
+    assert [a.attempt_number for a in joined[4].attempts] == [1, 2]
+    assert joined[4].attempts[0].outbound_message_id == "msg_4"
+    assert route.call_count == 7
+    assert attempts.peak == 3
+    client.close()
+
+
+def test_iter_with_attempts_is_lazy_and_stops_prefetch_on_close(mock_api):
+    listing = mock_api.get("/api/outbound-messages").mock(side_effect=_list)
+    mock_api.get(url__regex=r"/api/outbound-messages/msg_\d+/attempts").mock(
+        side_effect=Attempts()
+    )
+    client = Hookbase(api_key="whr_test")
+
+    joined = client.outbound.message_log.iter_with_attempts(limit=2, concurrency=1)
+    assert not listing.called
+    assert next(joined).message.id == "msg_0"
+    joined.close()
+
+    prefetch = [t for t in threading.enumerate() if t.name == "hookbase-prefetch"]
+    for thread in prefetch:
+        thread.join(timeout=1)
+    assert not any(t.is_alive() for t in prefetch)
+    client.close()
+
+
+async def test_async_iter_with_attempts(mock_api):
+    mock_api.get("/api/outbound-messages").mock(side_effect=_list)
+    mock_api.get(url__regex=r"/api/outbound-messages/msg_\d+/attempts").mock(
+        side_effect=Attempts()
+    )
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        joined = [
+            j async for j in client.outbound.message_log.iter_with_attempts(limit=4)
+        ]
+
+    assert [j.message.id for j in joined] == [m["id"] for m in MESSAGES]
+    assert all(len(j.attempts) == 2 for j in joined)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import gc
+import json
+
+import httpx
+import pydantic
 import pytest
 import respx
 
-from hookbase import Hookbase
-from hookbase.models import OutboundMessage, SendEventResponse, StatsSummary
+from hookbase import AsyncHookbase, Hookbase, ValidationError
+from hookbase.models import OutboundMessage, SendEventParams, SendEventResponse, StatsSummary
 
 from ..conftest import make_cursor_response
 
@@ -82,3 +87,148 @@ def test_get_stats(mock_api, client):
     assert isinstance(stats, StatsSummary)
     assert stats.total == 112
     assert stats.success == 100
+
+
+def test_send_event_splices_raw_payload_bytes(mock_api, client):
+    route = mock_api.post("/api/send-event").respond(200, json={
+        "data": {"eventId": "evt_123", "messagesQueued": 1, "endpoints": []}
+    })
+    raw = b'{"orderId": "123",  "items": [ 1, 2 ]}'
+
+    client.outbound.messages.send(
+        "app_1", event_type="order.created", payload=raw, metadata={"tenant": "acme"}
+    )
+
+    request = route.calls[0].request
+    assert raw in request.content
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == {
+        "applicationId": "app_1",
+        "eventType": "order.created",
+        "metadata": {"tenant": "acme"},
+        "payload": {"orderId": "123", "items": [1, 2]},
+    }
+
+
+async def test_async_send_event_splices_raw_payload_bytes(mock_api):
+    route = mock_api.post("/api/send-event").respond(200, json={
+        "data": {"eventId": "evt_123", "messagesQueued": 1, "endpoints": []}
+    })
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        await client.outbound.messages.send("app_1", event_type="e", payload=b"[1,2]")
+
+    assert json.loads(route.calls[0].request.content)["payload"] == [1, 2]
+
+
+def test_send_event_rejects_empty_payload_bytes(client):
+    with pytest.raises(ValueError):
+        client.outbound.messages.send("app_1", event_type="e", payload=b"")
+
+
+def test_send_event_params_rejects_str_payload(client):
+    with pytest.raises(pydantic.ValidationError):
+        SendEventParams(event_type="x", payload="not json")
+    results = list(client.outbound.messages.send_many(
+        "app_1", [{"event_type": "x", "payload": '{"a":1} , "applicationId":"evil"'}]
+    ))
+
+    # Rejected before sending: the mock has no send-event route.
+    assert isinstance(results[0].error, ValueError)
+
+
+def _send_response(request):
+    body = json.loads(request.content)
+    if body["eventType"] == "bad":
+        return httpx.Response(400, json={"error": "invalid event"})
+    return httpx.Response(200, json={
+        "data": {"eventId": body.get("eventId", ""), "messagesQueued": 1, "endpoints": []}
+    })
+
+
+def test_send_many_collects_results_and_errors(mock_api, client):
+    route = mock_api.post("/api/send-event").mock(side_effect=_send_response)
+    items = [
+        {"event_type": "order.created", "payload": {"n": 1}, "event_id": "e1"},
+        {"event_type": "bad", "payload": {"n": 2}},
+        SendEventParams(event_type="order.created", payload=b'{"n": 3}', event_id="e3"),
+        {"event_type": "order.created", "payload": {}, "event_id": "e4",
+         "idempotency_key": "mine"},
+    ]
+
+    batch = client.outbound.messages.send_many("app_1", items, concurrency=3)
+    results = list(batch)
+
+    assert [r.position for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert results[0].response.event_id == "e1"
+    assert isinstance(results[1].error, ValidationError)
+    assert batch.done and batch.errors == [results[1]]
+    keys = [call.request.headers["idempotency-key"] for call in route.calls]
+    assert len(set(keys)) == 4 and "mine" in keys
+    assert results[3].idempotency_key == "mine"
+
+    stats = batch.stats
+    assert (stats.total, stats.succeeded, stats.failed) == (4, 3, 1)
+    assert 0 < stats.latency_p50 <= stats.latency_p99 <= stats.latency_max
+    assert stats.throughput > 0
+
+
+def test_send_many_reports_invalid_items_without_aborting(mock_api, client):
+    route = mock_api.post("/api/send-event").mock(side_effect=_send_response)
+    items = [
+        {"event_type": "a", "payload": {}},
+        {"payload": {}, "idempotency_key": "k2"},
+        {"event_type": "c", "payload": {}},
+    ]
+
+    results = list(client.outbound.messages.send_many("app_1", items))
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].item == items[1]
+    assert results[1].idempotency_key == "k2"
+    assert route.call_count == 2
+
+
+async def test_async_send_many_reports_invalid_items(mock_api):
+    mock_api.post("/api/send-event").mock(side_effect=_send_response)
+    items = [{"event_type": "a", "payload": {}}, {"payload": {}}]
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        batch = await client.outbound.messages.send_many("app_1", items).wait()
+
+    assert [r.ok for r in batch.results] == [True, False]
+
+
+def test_send_many_stops_sending_when_iteration_stops(mock_api, client):
+    route = mock_api.post("/api/send-event").mock(side_effect=_send_response)
+    items = [{"event_type": "a", "payload": {"n": n}} for n in range(20)]
+
+    batch = client.outbound.messages.send_many("app_1", items, concurrency=2)
+    for _ in batch:
+        break
+    sent = route.call_count
+
+    assert list(batch) == [] and batch.wait() is batch
+    assert not batch.done
+    assert route.call_count == sent < 20
+
+
+def test_unsent_send_many_batch_warns(client):
+    with pytest.warns(RuntimeWarning, match="no events were sent"):
+        client.outbound.messages.send_many("app_1", [{"event_type": "a", "payload": {}}])
+        gc.collect()
+
+
+async def test_async_send_many_unordered(mock_api):
+    mock_api.post("/api/send-event").mock(side_effect=_send_response)
+    items = ({"event_type": "order.created", "payload": {"n": n}} for n in range(10))
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        batch = await client.outbound.messages.send_many(
+            "app_1", items, concurrency=4, ordered=False
+        ).wait()
+
+    assert sorted(r.position for r in batch.results) == list(range(10))
+    assert batch.stats.succeeded == 10
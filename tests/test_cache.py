@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, CacheEntry, Hookbase, InMemoryCache, ResponseCache
+
+SOURCE = {"id": "src_1", "organizationId": "org_1", "name": "GitHub", "slug": "github"}
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as respx_mock:
+        yield respx_mock
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    backend = InMemoryCache(max_entries=2)
+    backend.set("a", CacheEntry(b"1", None, 0))
+    backend.set("b", CacheEntry(b"2", None, 0))
+    backend.get("a")
+    backend.set("c", CacheEntry(b"3", None, 0))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert len(backend) == 2
+
+
+def test_delete_prefix_matches_whole_segments():
+    backend = InMemoryCache()
+    for key in ("/api/routes?", "/api/routes/rt_1?", "/api/routes-archive?"):
+        backend.set(key, CacheEntry(b"{}", None, 0))
+    backend.delete_prefix("/api/routes")
+
+    assert backend.get("/api/routes-archive?") is not None
+    assert len(backend) == 1
+
+
+class CountingCache(InMemoryCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scans: list[str] = []
+
+    def delete_prefix(self, prefix: str) -> None:
+        self.scans.append(prefix)
+        super().delete_prefix(prefix)
+
+
+def test_invalidate_skips_uncached_resources():
+    backend = CountingCache()
+    cache = ResponseCache(backend, ttls={"/api/sources": 60, "/api/outbound-messages/dlq": 5})
+    cache.invalidate("/api/send-event")
+    cache.invalidate("/api/routes/bulk")
+    cache.invalidate("/api/sources/src_1")
+    cache.invalidate("/api/outbound-messages/dlq/retry-bulk")
+
+    assert backend.scans == ["/api/sources", "/api/outbound-messages"]
+
+
+def test_ttl_for_uses_longest_prefix():
+    cache = ResponseCache(ttls={"/api/routes": 30, "/api/routes/rte_hot": 1})
+    assert cache.ttl_for("/api/routes/rte_1") == 30
+    assert cache.ttl_for("/api/routes/rte_hot") == 1
+    assert cache.ttl_for("/api/routes/rte_1/circuit-status") is None
+    assert cache.ttl_for("/api/events") is None
+
+
+def test_get_served_from_cache(mock_api):
+    route = mock_api.get("/api/sources/src_1").mock(
+        return_value=httpx.Response(200, json={"source": SOURCE})
+    )
+    with Hookbase(api_key="whr_test", cache=True) as client:
+        first = client.sources.get("src_1")
+        second = client.sources.get("src_1")
+
+    assert route.call_count == 1
+    assert first == second
+    assert (client.cache.hits, client.cache.misses) == (1, 1)
+
+
+def test_write_invalidates_resource(mock_api):
+    route = mock_api.get("/api/sources/src_1").mock(
+        return_value=httpx.Response(200, json={"source": SOURCE})
+    )
+    mock_api.patch("/api/sources/src_2").mock(return_value=httpx.Response(204))
+    with Hookbase(api_key="whr_test", cache=True) as client:
+        client.sources.get("src_1")
+        client.sources.update("src_2", {"name": "Renamed"})
+        client.sources.get("src_1")
+
+    assert route.call_count == 2
+
+
+def test_expired_entry_revalidated_with_etag(mock_api):
+    route = mock_api.get("/api/sources/src_1").mock(
+        side_effect=[
+            httpx.Response(200, json={"source": SOURCE}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    cache = ResponseCache(ttls={"/api/sources": 0.01})
+    with Hookbase(api_key="whr_test", cache=cache) as client:
+        client.sources.get("src_1")
+        time.sleep(0.02)
+        source = client.sources.get("src_1")
+
+    assert source.id == "src_1"
+    assert route.calls.last.request.headers["if-none-match"] == '"v1"'
+    assert cache.revalidations == 1
+
+
+def test_uncached_resources_always_fetched(mock_api):
+    route = mock_api.get("/api/routes/rte_1/circuit-status").mock(
+        return_value=httpx.Response(200, json={"circuitState": "closed"})
+    )
+    with Hookbase(api_key="whr_test", cache=True) as client:
+        client.routes.get_circuit_status("rte_1")
+        client.routes.get_circuit_status("rte_1")
+
+    assert route.call_count == 2
+
+
+async def test_async_get_served_from_cache(mock_api):
+    route = mock_api.get("/api/sources/src_1").mock(
+        return_value=httpx.Response(200, json={"source": SOURCE})
+    )
+    mock_api.delete("/api/sources/src_1").mock(return_value=httpx.Response(204))
+    async with AsyncHookbase(api_key="whr_test", cache=True) as client:
+        await client.sources.get("src_1")
+        source = await client.sources.get("src_1")
+        await client.sources.delete("src_1")
+
+    assert source.name == "GitHub"
+    assert route.call_count == 1
+    assert len(client.cache.backend) == 0
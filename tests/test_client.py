@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import httpx
 import pytest
+import respx
 
-from hookbase import AsyncHookbase, Hookbase
+from hookbase import AsyncHookbase, Hookbase, NetworkError
 
 
 def test_requires_api_key():
@@ -63,3 +65,51 @@ def test_async_has_all_resources():
     # Admin
     for attr in ("organizations", "api_keys", "analytics", "cron_jobs", "tunnels"):
         assert hasattr(client, attr)
+
+
+def test_timeout_splits_default_to_timeout():
+    client = Hookbase(api_key="whr_test", timeout=10.0, connect_timeout=2.0)
+    timeout = client._transport._client.timeout
+    assert timeout.connect == 2.0
+    assert timeout.read == timeout.write == timeout.pool == 10.0
+    client.close()
+
+
+def test_pool_limits_applied():
+    client = Hookbase(
+        api_key="whr_test", max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5
+    )
+    pool = client._transport._client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 1.5
+    client.close()
+
+
+def test_warmup_opens_connections():
+    with respx.mock(base_url="https://api.hookbase.app") as mock_api:
+        route = mock_api.head("/").mock(return_value=httpx.Response(200))
+        with Hookbase(api_key="whr_test") as client:
+            client.warmup(connections=3)
+    assert route.call_count == 3
+
+
+def test_warmup_connection_error():
+    with respx.mock(base_url="https://api.hookbase.app") as mock_api:
+        mock_api.head("/").mock(side_effect=httpx.ConnectError("refused"))
+        with Hookbase(api_key="whr_test") as client, pytest.raises(NetworkError):
+            client.warmup()
+
+
+def test_warmup_requires_positive_connections():
+    with Hookbase(api_key="whr_test") as client, pytest.raises(ValueError):
+        client.warmup(connections=0)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_opens_connections():
+    with respx.mock(base_url="https://api.hookbase.app") as mock_api:
+        route = mock_api.head("/").mock(return_value=httpx.Response(405))
+        async with AsyncHookbase(api_key="whr_test", max_connections=5) as client:
+            await client.warmup(connections=5)
+    assert route.call_count == 5
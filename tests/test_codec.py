@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import base64
+import json
+
+import httpx
+import pytest
+import respx
+
+from hookbase import (
+    AsyncHookbase,
+    Hookbase,
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    Webhook,
+    WebhookVerificationError,
+)
+from hookbase.codec import default_codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+needs_orjson = pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+
+SECRET = "whsec_" + base64.b64encode(b"test-secret-key-for-webhook-sign").decode()
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as respx_mock:
+        yield respx_mock
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self) -> None:
+        self.encoded: list[object] = []
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+CODECS = [
+    pytest.param(StdlibJSONCodec, id="json"),
+    pytest.param(OrjsonCodec, id="orjson", marks=needs_orjson),
+]
+
+
+@pytest.mark.parametrize("codec_cls", CODECS)
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, lambda b: b.decode()])
+def test_codecs_round_trip(codec_cls, wrap):
+    codec: JSONCodec = codec_cls()
+    doc = {"id": "evt_1", "name": "café", "items": [1, 2.5, None, True]}
+
+    encoded = codec.dumps(doc)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == doc
+    assert codec.loads(wrap(encoded)) == doc
+
+
+@pytest.mark.parametrize("codec_cls", CODECS)
+def test_decode_errors_are_value_errors(codec_cls):
+    with pytest.raises(ValueError):
+        codec_cls().loads(b"{not json")
+
+
+@needs_orjson
+def test_default_codec_prefers_orjson():
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_client_encodes_and_decodes_with_codec(mock_api):
+    route = mock_api.post("/api/sources").mock(
+        return_value=httpx.Response(
+            201,
+            json={"source": {"id": "src_1", "organizationId": "org_1", "name": "S", "slug": "s"}},
+        )
+    )
+    codec = RecordingCodec()
+
+    with Hookbase(api_key="whr_test", json_codec=codec) as client:
+        source = client.sources.create({"name": "S", "slug": "s"})
+
+    request = route.calls[0].request
+    assert client.json_codec is codec
+    assert source.id == "src_1"
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == codec.encoded[0]
+    assert codec.decoded == 1
+
+
+async def test_async_client_uses_codec(mock_api):
+    mock_api.get("/api/sources/src_1").mock(
+        return_value=httpx.Response(
+            200,
+            json={"source": {"id": "src_1", "organizationId": "org_1", "name": "S", "slug": "s"}},
+        )
+    )
+    codec = RecordingCodec()
+
+    async with AsyncHookbase(api_key="whr_test", json_codec=codec) as client:
+        await client.sources.get("src_1")
+
+    assert codec.encoded == []
+    assert codec.decoded == 1
+
+
+def test_webhook_parses_with_codec():
+    codec = RecordingCodec()
+    wh = Webhook(SECRET, json_codec=codec)
+    payload = b'{"type": "order.created"}'
+
+    assert wh.verify(payload, wh.generate_test_headers(payload)) == {"type": "order.created"}
+    assert codec.decoded == 1
+
+
+@pytest.mark.parametrize("codec_cls", CODECS)
+def test_webhook_invalid_json_with_codec(codec_cls):
+    wh = Webhook(SECRET, json_codec=codec_cls())
+    payload = b"{not json"
+
+    with pytest.raises(WebhookVerificationError, match="Invalid JSON"):
+        wh.verify(payload, wh.generate_test_headers(payload))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, ConcurrencyLimiter
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+async def test_limit_bounds_in_flight_and_reports_queue_depth():
+    limiter = ConcurrencyLimiter(initial=2, max_limit=2)
+    peak = 0
+    depths = []
+
+    async def work() -> None:
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        depths.append(limiter.queue_depth)
+        await asyncio.sleep(0.01)
+        limiter.release(0.01)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+    assert max(depths) > 0
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+async def test_overload_cuts_limit_multiplicatively():
+    limiter = ConcurrencyLimiter(initial=8)
+    await limiter.acquire()
+    limiter.release(0.05, overloaded=True)
+    assert limiter.limit == 4
+
+
+async def test_saturated_success_grows_limit_additively():
+    limiter = ConcurrencyLimiter(initial=2, max_limit=3)
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.release(0.01)
+        limiter.release(0.01)
+    assert limiter.limit == 3
+
+
+async def test_latency_spike_counts_as_congestion():
+    limiter = ConcurrencyLimiter(initial=8, latency_tolerance=2.0)
+    await limiter.acquire()
+    limiter.release(0.01)
+    await limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.limit == 4
+
+
+async def test_cancelled_waiter_leaves_queue():
+    limiter = ConcurrencyLimiter(initial=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+async def test_client_requests_respect_limit(mock_api):
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"source": {
+            "id": "src_1", "organizationId": "org_1", "name": "S", "slug": "s",
+        }})
+
+    mock_api.get("/api/sources/src_1").mock(side_effect=handler)
+    limiter = ConcurrencyLimiter(initial=3, max_limit=3)
+    async with AsyncHookbase(api_key="whr_test", adaptive_concurrency=limiter) as client:
+        assert client.concurrency_limiter is limiter
+        await asyncio.gather(*(client.sources.get("src_1") for _ in range(10)))
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+async def test_client_concurrency_disabled_by_default():
+    async with AsyncHookbase(api_key="whr_test") as client:
+        assert client.concurrency_limiter is None
+    async with AsyncHookbase(api_key="whr_test", adaptive_concurrency=True) as client:
+        assert client.concurrency_limiter is not None
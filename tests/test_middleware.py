@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import base64
+import io
+import json
+
+import pytest
+
+from hookbase import InMemoryReplayGuard, Webhook
+from hookbase.middleware import ASGIWebhookMiddleware, ChunkReader, WSGIWebhookMiddleware
+
+SECRET = "whsec_" + base64.b64encode(b"test-secret-key-for-webhook-sign").decode()
+PAYLOAD = json.dumps({"type": "order.created", "data": {"id": "ord_1"}}).encode()
+
+
+@pytest.fixture
+def wh():
+    return Webhook(SECRET)
+
+
+async def echo_app(scope, receive, send):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message["body"])
+        if not message["more_body"]:
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"|".join(chunks)})
+
+
+async def call_asgi(app, headers, chunks, path="/webhooks"):
+    scope = {
+        "type": "http",
+        "path": path,
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    received = []
+
+    async def receive():
+        received.append(1)
+        return messages.pop(0)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], sent[1]["body"], len(received)
+
+
+async def test_asgi_replays_verified_chunks(wh):
+    app = ASGIWebhookMiddleware(echo_app, wh)
+    chunks = [PAYLOAD[:10], PAYLOAD[10:]]
+
+    status, body, _ = await call_asgi(app, wh.generate_test_headers(PAYLOAD), chunks)
+
+    assert status == 200
+    assert body == b"|".join(chunks)
+
+
+async def test_asgi_rejects_bad_signature(wh):
+    app = ASGIWebhookMiddleware(echo_app, wh)
+    headers = wh.generate_test_headers(PAYLOAD)
+
+    status, body, _ = await call_asgi(app, headers, [PAYLOAD + b" "])
+
+    assert status == 401
+    assert b"verification failed" in body
+
+
+async def test_asgi_rejects_stale_timestamp_before_reading_body(wh):
+    app = ASGIWebhookMiddleware(echo_app, wh)
+    headers = wh.generate_test_headers(PAYLOAD, timestamp=1_000_000_000)
+
+    status, _, reads = await call_asgi(app, headers, [PAYLOAD])
+
+    assert status == 401
+    assert reads == 0
+
+
+async def test_asgi_enforces_max_body_size(wh):
+    app = ASGIWebhookMiddleware(echo_app, wh, max_body_size=16)
+    headers = wh.generate_test_headers(PAYLOAD)
+
+    status, _, _ = await call_asgi(app, headers, [PAYLOAD[:10], PAYLOAD[10:]])
+
+    assert status == 413
+
+
+async def test_asgi_skips_other_paths(wh):
+    app = ASGIWebhookMiddleware(echo_app, wh, paths={"/webhooks"})
+
+    status, _, _ = await call_asgi(app, {}, [b"{}"], path="/health")
+
+    assert status == 200
+
+
+async def test_asgi_acknowledges_duplicate_without_calling_app():
+    wh = Webhook(SECRET, replay_guard=InMemoryReplayGuard())
+    app = ASGIWebhookMiddleware(echo_app, wh)
+    headers = wh.generate_test_headers(PAYLOAD)
+
+    first = await call_asgi(app, headers, [PAYLOAD])
+    second = await call_asgi(app, headers, [PAYLOAD])
+
+    assert first[:2] == (200, PAYLOAD)
+    assert second[0] == 200
+    assert b"Duplicate" in second[1]
+
+
+def wsgi_echo(environ, start_response):
+    body = environ["wsgi.input"].read()
+    start_response("200 OK", [("Content-Type", "application/json")])
+    return [body]
+
+
+def call_wsgi(app, headers, body):
+    environ = {
+        "PATH_INFO": "/webhooks",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    for name, value in headers.items():
+        environ["HTTP_" + name.upper().replace("-", "_")] = value
+    statuses = []
+    result = app(environ, lambda status, headers: statuses.append(status))
+    return statuses[0], b"".join(result)
+
+
+def test_wsgi_verifies_and_replays_body(wh):
+    app = WSGIWebhookMiddleware(wsgi_echo, SECRET)
+
+    status, body = call_wsgi(app, wh.generate_test_headers(PAYLOAD), PAYLOAD)
+
+    assert status == "200 OK"
+    assert body == PAYLOAD
+
+
+def test_wsgi_rejects_bad_signature(wh):
+    app = WSGIWebhookMiddleware(wsgi_echo, wh)
+    headers = wh.generate_test_headers(PAYLOAD)
+
+    status, _ = call_wsgi(app, headers, b"{}")
+
+    assert status == "401 Unauthorized"
+
+
+def test_wsgi_rejects_declared_oversized_body(wh):
+    app = WSGIWebhookMiddleware(wsgi_echo, wh, max_body_size=8)
+
+    status, _ = call_wsgi(app, wh.generate_test_headers(PAYLOAD), PAYLOAD)
+
+    assert status == "413 Payload Too Large"
+
+
+def test_chunk_reader_reads_across_chunks():
+    reader = ChunkReader([b"ab\ncd", b"ef\n", b"gh"])
+
+    assert reader.readline() == b"ab\n"
+    assert reader.read(4) == b"cdef"
+    assert reader.readline() == b"\n"
+    assert reader.read() == b"gh"
+    assert reader.read() == b""
+
+
+def test_verifier_checks_headers_before_body(wh):
+    headers = wh.generate_test_headers(PAYLOAD)
+    verifier = wh.verifier(headers)
+    for i in range(0, len(PAYLOAD), 7):
+        verifier.update(memoryview(PAYLOAD)[i:i + 7])
+    verifier.verify()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, Hookbase, Outbox, OutboxFullError, ValidationError
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as respx_mock:
+        yield respx_mock
+
+
+class FakeServer:
+    """send-event endpoint that can be taken down and deduplicates by key."""
+
+    def __init__(self) -> None:
+        self.down = False
+        self.received: list[dict] = []
+        self.keys: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.down:
+            raise httpx.ConnectError("connection refused")
+        body = json.loads(request.content)
+        if body["eventType"] == "bad":
+            return httpx.Response(400, json={"error": "invalid event"})
+        key = request.headers["idempotency-key"]
+        if key not in self.keys:
+            self.keys.add(key)
+            self.received.append(body)
+        return httpx.Response(200, json={
+            "data": {"eventId": body.get("eventId", ""), "messagesQueued": 1, "endpoints": []}
+        })
+
+
+@pytest.fixture
+def server(mock_api):
+    fake = FakeServer()
+    mock_api.post("/api/send-event").mock(side_effect=fake)
+    return fake
+
+
+def test_spooled_events_survive_reopen_and_drain_in_order(server, tmp_path):
+    path = tmp_path / "outbox.db"
+    with Outbox(path) as outbox:
+        client = Hookbase(api_key="whr_test", outbox=outbox, max_retries=0)
+        for n in range(5):
+            client.outbound.messages.spool(
+                "app_1", event_type="order.created", payload=b'{"n":%d}' % n, event_id=f"e{n}"
+            )
+        assert outbox.depth == 5
+        client.close()
+
+    with Outbox(path) as outbox:
+        assert outbox.stats().depth == 5
+        client = Hookbase(api_key="whr_test", outbox=outbox, max_retries=0)
+        result = client.outbound.messages.drain_outbox(batch_size=2)
+        client.close()
+
+    assert (result.sent, result.remaining, result.error) == (5, 0, None)
+    assert [body["eventId"] for body in server.received] == [f"e{n}" for n in range(5)]
+    assert server.received[0]["payload"] == {"n": 0}
+
+
+def test_send_or_spool_falls_back_when_server_is_down(server):
+    outbox = Outbox(":memory:")
+    client = Hookbase(api_key="whr_test", outbox=outbox, max_retries=0)
+    messages = client.outbound.messages
+
+    assert messages.send_or_spool("app_1", event_type="a", payload={}).messages_queued == 1
+    server.down = True
+    assert messages.send_or_spool("app_1", event_type="b", payload={}) is None
+    assert messages.send_or_spool("app_1", event_type="c", payload={}) is None
+    server.down = False
+    with pytest.raises(ValidationError):
+        messages.send_or_spool("app_1", event_type="bad", payload={})
+    assert outbox.depth == 2
+
+    server.down = True
+    stopped = messages.drain_outbox()
+    assert (stopped.sent, stopped.remaining) == (0, 2)
+    assert stopped.error is not None
+
+    server.down = False
+    drained = messages.drain_outbox()
+    assert (drained.sent, drained.remaining) == (2, 0)
+    assert [body["eventType"] for body in server.received] == ["a", "b", "c"]
+    client.close()
+
+
+def test_drain_removes_rejected_events(server):
+    outbox = Outbox(":memory:")
+    client = Hookbase(api_key="whr_test", outbox=outbox, max_retries=0)
+    client.outbound.messages.spool("app_1", event_type="bad", payload={})
+    client.outbound.messages.spool("app_1", event_type="ok", payload={})
+
+    result = client.outbound.messages.drain_outbox(concurrency=2)
+
+    assert result.sent == 1
+    assert isinstance(result.rejected[0][1], ValidationError)
+    assert outbox.depth == 0
+    client.close()
+
+
+def test_outbox_caps():
+    outbox = Outbox(":memory:", max_events=2, max_bytes=1_000)
+    outbox.append("k1", b"{}")
+    with pytest.raises(OutboxFullError):
+        outbox.append("k2", b"x" * 1_000)
+    outbox.append("k3", b"{}")
+    with pytest.raises(OutboxFullError):
+        outbox.append("k4", b"{}")
+
+    outbox.remove(outbox.peek(1))
+    assert (outbox.depth, outbox.size_bytes) == (1, 2)
+
+
+def test_spool_requires_outbox():
+    client = Hookbase(api_key="whr_test")
+    with pytest.raises(RuntimeError):
+        client.outbound.messages.spool("app_1", event_type="a", payload={})
+
+
+async def test_async_send_or_spool_and_drain(server):
+    outbox = Outbox(":memory:")
+    async with AsyncHookbase(api_key="whr_test", outbox=outbox, max_retries=0) as client:
+        server.down = True
+        assert await client.outbound.messages.send_or_spool(
+            "app_1", event_type="a", payload={}
+        ) is None
+        server.down = False
+        result = await client.outbound.messages.drain_outbox()
+
+    assert (result.sent, outbox.depth) == (1, 0)
+    assert len(server.keys) == 1
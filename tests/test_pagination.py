@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import httpx
 import pytest
 import respx
 
-from hookbase import Hookbase
+from hookbase import AsyncHookbase, Hookbase, NotFoundError
 
 from .conftest import make_cursor_response, make_paginated_response
 
@@ -82,3 +83,179 @@ def test_cursor_page_no_more(mock_api, client):
     page = client.outbound.applications.list()
     assert page.has_more is False
     assert page.next_cursor is None
+
+
+def _source_pages(count: int, page_size: int = 1):
+    return [
+        make_paginated_response(
+            [{"id": f"src_{n}", "organizationId": "org_1", "name": f"S{n}", "slug": f"s{n}"}],
+            data_key="sources", total=count, page=n, page_size=page_size,
+        )
+        for n in range(1, count + 1)
+    ]
+
+
+def test_offset_auto_paging_prefetch(mock_api, client):
+    pages = iter(_source_pages(5))
+    mock_api.get("/api/sources").mock(side_effect=lambda req: httpx.Response(200, json=next(pages)))
+    page = client.sources.list(page_size=1)
+    items = list(page.auto_paging_iter(prefetch=2))
+    assert [s.id for s in items] == [f"src_{n}" for n in range(1, 6)]
+
+
+def test_cursor_auto_paging_prefetch(mock_api, client):
+    def app(n: int) -> dict:
+        return {"id": f"app_{n}", "name": f"A{n}", "organizationId": "org_1", "uid": f"u{n}"}
+
+    responses = iter([
+        make_cursor_response([app(1)], has_more=True, next_cursor="c1"),
+        make_cursor_response([app(2)], has_more=True, next_cursor="c2"),
+        make_cursor_response([app(3)], has_more=False),
+    ])
+    route = mock_api.get("/api/webhook-applications").mock(
+        side_effect=lambda req: httpx.Response(200, json=next(responses))
+    )
+    page = client.outbound.applications.list()
+    items = list(page.auto_paging_iter(prefetch=1))
+    assert [a.id for a in items] == ["app_1", "app_2", "app_3"]
+    assert route.calls[-1].request.url.params["cursor"] == "c2"
+
+
+def test_prefetch_propagates_errors(mock_api, client):
+    first = _source_pages(3)[0]
+    mock_api.get("/api/sources", params={"page": "2"}).respond(404, json={"error": "gone"})
+    mock_api.get("/api/sources").respond(200, json=first)
+    page = client.sources.list(page_size=1)
+    it = page.auto_paging_iter(prefetch=2)
+    assert next(it).id == "src_1"
+    with pytest.raises(NotFoundError):
+        next(it)
+
+
+def test_prefetch_stops_on_early_exit(mock_api, client):
+    pages = iter(_source_pages(50))
+    route = mock_api.get("/api/sources").mock(
+        side_effect=lambda req: httpx.Response(200, json=next(pages))
+    )
+    page = client.sources.list(page_size=1)
+    it = page.auto_paging_iter(prefetch=2)
+    assert next(it).id == "src_1"
+    it.close()
+    # Initial request plus at most ``prefetch`` pages fetched ahead.
+    assert route.call_count <= 3
+
+
+async def test_async_auto_paging_prefetch(mock_api):
+    pages = iter(_source_pages(4))
+    mock_api.get("/api/sources").mock(side_effect=lambda req: httpx.Response(200, json=next(pages)))
+    async with AsyncHookbase(api_key="whr_test") as client:
+        page = await client.sources.list(page_size=1)
+        items = [s.id async for s in page.auto_paging_iter(prefetch=2)]
+    assert items == ["src_1", "src_2", "src_3", "src_4"]
+
+
+async def test_async_prefetch_propagates_errors(mock_api):
+    first = _source_pages(3)[0]
+    mock_api.get("/api/sources", params={"page": "2"}).respond(404, json={"error": "gone"})
+    mock_api.get("/api/sources").respond(200, json=first)
+    async with AsyncHookbase(api_key="whr_test") as client:
+        page = await client.sources.list(page_size=1)
+        with pytest.raises(NotFoundError):
+            async for _ in page.auto_paging_iter(prefetch=2):
+                pass
+
+
+def _page_from_request(pages):
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params.get("page", "1"))
+        return httpx.Response(200, json=pages[number - 1])
+    return handler
+
+
+def test_offset_fetch_all_concurrent(mock_api, client):
+    route = mock_api.get("/api/sources").mock(side_effect=_page_from_request(_source_pages(7)))
+    page = client.sources.list(page_size=1)
+    items = page.fetch_all(concurrency=3)
+    assert [s.id for s in items] == [f"src_{n}" for n in range(1, 8)]
+    requested = sorted(int(c.request.url.params["page"]) for c in route.calls[1:])
+    assert requested == [2, 3, 4, 5, 6, 7]
+
+
+def test_offset_iter_unordered(mock_api, client):
+    mock_api.get("/api/sources").mock(side_effect=_page_from_request(_source_pages(5)))
+    page = client.sources.list(page_size=1)
+    ids = {s.id for s in page.iter_unordered(concurrency=4)}
+    assert ids == {f"src_{n}" for n in range(1, 6)}
+
+
+def test_offset_fetch_all_single_page(mock_api, client):
+    route = mock_api.get("/api/sources").mock(side_effect=_page_from_request(_source_pages(1)))
+    page = client.sources.list(page_size=1)
+    assert [s.id for s in page.fetch_all()] == ["src_1"]
+    assert route.call_count == 1
+
+
+async def test_async_offset_fetch_all(mock_api):
+    mock_api.get("/api/sources").mock(side_effect=_page_from_request(_source_pages(6)))
+    async with AsyncHookbase(api_key="whr_test") as client:
+        page = await client.sources.list(page_size=1)
+        items = await page.fetch_all(concurrency=3)
+        unordered = {s.id async for s in page.iter_unordered(concurrency=2)}
+    assert [s.id for s in items] == [f"src_{n}" for n in range(1, 7)]
+    assert unordered == {f"src_{n}" for n in range(1, 7)}
+
+
+def _event_pages(count: int, limit: int = 2):
+    events = [
+        {"id": f"evt_{n}", "sourceId": "src_1", "organizationId": "org_1"}
+        for n in range(count)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", "0"))
+        size = int(request.url.params.get("limit", str(limit)))
+        return httpx.Response(200, json={
+            "events": events[offset:offset + size],
+            "pagination": {"total": count, "limit": size, "offset": offset},
+        })
+    return handler
+
+
+def test_limit_offset_next_page(mock_api, client):
+    route = mock_api.get("/api/events").mock(side_effect=_event_pages(5))
+    page = client.events.list(limit=2)
+    assert page.page == 1
+    assert page.page_size == 2
+    items = list(page.auto_paging_iter())
+    assert [e.id for e in items] == [f"evt_{n}" for n in range(5)]
+    offsets = [c.request.url.params.get("offset") for c in route.calls]
+    assert offsets == [None, "2", "4"]
+    assert "page" not in route.calls[1].request.url.params
+
+
+def test_limit_offset_get_page_and_fetch_all(mock_api, client):
+    mock_api.get("/api/events").mock(side_effect=_event_pages(7))
+    page = client.events.list(limit=2)
+    third = page.get_page(3)
+    assert third.page == 3
+    assert [e.id for e in third.data] == ["evt_4", "evt_5"]
+    assert [e.id for e in page.fetch_all(concurrency=3)] == [f"evt_{n}" for n in range(7)]
+
+
+def test_limit_offset_zero_limit(mock_api, client):
+    route = mock_api.get("/api/events").mock(side_effect=_event_pages(5))
+    page = client.events.list(limit=0)
+
+    assert not page.has_more
+    assert list(page.auto_paging_iter()) == []
+    assert page.fetch_all() == []
+    with pytest.raises(ValueError, match="limit must be at least 1"):
+        page.get_page(2)
+    assert route.call_count == 1
+
+
+def test_page_number_get_page(mock_api, client):
+    route = mock_api.get("/api/sources").mock(side_effect=_page_from_request(_source_pages(4)))
+    page = client.sources.list(page_size=1)
+    assert page.get_page(4).data[0].id == "src_4"
+    assert route.calls[-1].request.url.params["page"] == "4"
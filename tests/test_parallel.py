@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from hookbase._parallel import async_map_bounded, map_bounded
+
+
+def test_map_bounded_preserves_order():
+    def slow_square(n: int) -> int:
+        time.sleep(0.01 * (5 - n))
+        return n * n
+
+    assert list(map_bounded(slow_square, range(5), 3)) == [0, 1, 4, 9, 16]
+
+
+def test_map_bounded_unordered_and_errors():
+    assert sorted(map_bounded(lambda n: n, range(10), 4, ordered=False)) == list(range(10))
+
+    def boom(n: int) -> int:
+        if n == 2:
+            raise RuntimeError("boom")
+        return n
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(map_bounded(boom, range(5), 2))
+
+
+async def test_async_map_bounded_limits_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def work(n: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return n
+
+    results = [r async for r in async_map_bounded(work, range(10), 3)]
+    assert results == list(range(10))
+    assert peak == 3
+
+
+async def test_async_map_bounded_accepts_async_iterables():
+    async def source():
+        for n in range(5):
+            yield n
+
+    async def double(n: int) -> int:
+        await asyncio.sleep(0)
+        return n * 2
+
+    results = [r async for r in async_map_bounded(double, source(), 2)]
+    assert results == [0, 2, 4, 6, 8]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, AsyncProducer, Hookbase, Producer, QueueFullError
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as respx_mock:
+        yield respx_mock
+
+
+def _respond(request):
+    body = json.loads(request.content)
+    if body["eventType"] == "bad":
+        return httpx.Response(400, json={"error": "invalid event"})
+    return httpx.Response(200, json={
+        "data": {"eventId": body["eventId"], "messagesQueued": 1, "endpoints": []}
+    })
+
+
+def test_enqueue_returns_futures_resolved_in_background(mock_api):
+    route = mock_api.post("/api/send-event").mock(side_effect=_respond)
+    client = Hookbase(api_key="whr_test")
+
+    with Producer(client.outbound.messages, linger_ms=1) as producer:
+        futures = [
+            producer.enqueue("app_1", event_type="order.created", payload={}, event_id=f"e{n}")
+            for n in range(20)
+        ]
+        bad = producer.enqueue("app_1", event_type="bad", payload={})
+        assert producer.flush(timeout=5)
+        assert producer.pending == 0
+
+    assert [f.result().event_id for f in futures] == [f"e{n}" for n in range(20)]
+    assert isinstance(bad.exception(), Exception)
+    assert route.call_count == 21
+    keys = {call.request.headers["idempotency-key"] for call in route.calls}
+    assert len(keys) == 21
+    client.close()
+
+
+def test_full_queue_raises_and_close_delivers(mock_api):
+    release = threading.Event()
+
+    def slow(request):
+        release.wait(5)
+        return _respond(request)
+
+    route = mock_api.post("/api/send-event").mock(side_effect=slow)
+    client = Hookbase(api_key="whr_test")
+    producer = Producer(client.outbound.messages, max_queue=2, concurrency=1, linger_ms=0)
+
+    accepted = 0
+    with pytest.raises(QueueFullError):
+        for n in range(10):
+            producer.enqueue("app_1", event_type="order.created", payload={}, event_id=f"e{n}")
+            accepted += 1
+            time.sleep(0.01)
+    release.set()
+    producer.close()
+
+    assert route.call_count == accepted
+    with pytest.raises(RuntimeError):
+        producer.enqueue("app_1", event_type="order.created", payload={})
+    client.close()
+
+
+def test_max_batch_dispatches_before_linger(mock_api):
+    mock_api.post("/api/send-event").mock(side_effect=_respond)
+    client = Hookbase(api_key="whr_test")
+    producer = Producer(client.outbound.messages, linger_ms=60_000, max_batch=3)
+
+    futures = [
+        producer.enqueue("app_1", event_type="order.created", payload={}, event_id=f"e{n}")
+        for n in range(3)
+    ]
+
+    assert [f.result(timeout=5).event_id for f in futures] == ["e0", "e1", "e2"]
+    producer.close()
+    client.close()
+
+
+async def test_async_producer_delivers_on_close(mock_api):
+    route = mock_api.post("/api/send-event").mock(side_effect=_respond)
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        async with AsyncProducer(client.outbound.messages, concurrency=2) as producer:
+            futures = [
+                producer.enqueue("app_1", event_type="order.created", payload={}, event_id=f"e{n}")
+                for n in range(10)
+            ]
+            assert producer.pending == 10
+
+    results = await asyncio.gather(*futures)
+    assert [r.event_id for r in results] == [f"e{n}" for n in range(10)]
+    assert route.call_count == 10
+    assert producer.pending == 0
+
+
+async def test_async_producer_backpressure(mock_api):
+    mock_api.post("/api/send-event").mock(side_effect=_respond)
+
+    async with AsyncHookbase(api_key="whr_test") as client:
+        producer = AsyncProducer(client.outbound.messages, max_queue=2)
+        producer.enqueue("app_1", event_type="order.created", payload={}, event_id="e0")
+        producer.enqueue("app_1", event_type="order.created", payload={}, event_id="e1")
+        with pytest.raises(QueueFullError):
+            producer.enqueue("app_1", event_type="order.created", payload={}, event_id="e2")
+        await producer.close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from hookbase import Hookbase, RateLimiter
+from hookbase.ratelimit import parse_retry_after
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+def test_reserve_spaces_requests():
+    limiter = RateLimiter(rate=10)
+    delays = [limiter.reserve() for _ in range(4)]
+    assert delays[0] == pytest.approx(0.0, abs=0.01)
+    assert delays[3] == pytest.approx(0.3, abs=0.02)
+
+
+def test_burst_allows_back_to_back_requests():
+    limiter = RateLimiter(rate=10, burst=3)
+    delays = [limiter.reserve() for _ in range(4)]
+    assert delays[:3] == pytest.approx([0.0, 0.0, 0.0], abs=0.01)
+    assert delays[3] == pytest.approx(0.1, abs=0.02)
+
+
+def test_429_halves_rate_and_pauses_everyone():
+    limiter = RateLimiter(rate=20)
+    limiter.observe(429, {"retry-after": "2"})
+    assert limiter.rate == 10
+    assert limiter.paused_for == pytest.approx(2.0, abs=0.05)
+    delays = [limiter.reserve() for _ in range(3)]
+    assert all(d >= 1.9 for d in delays)
+
+
+def test_unlimited_limiter_learns_from_429():
+    limiter = RateLimiter()
+    for _ in range(20):
+        limiter.reserve()
+    limiter.observe(429, {})
+    assert limiter.rate is not None
+    assert limiter.paused_for > 0
+
+
+def test_rate_limit_headers():
+    limiter = RateLimiter(rate=100)
+    limiter.observe(200, {"x-ratelimit-remaining": "10", "x-ratelimit-reset": "5"})
+    assert limiter.rate == pytest.approx(2.0)
+
+    limiter.observe(200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "3"})
+    assert limiter.paused_for == pytest.approx(3.0, abs=0.05)
+
+
+def test_successes_recover_rate_up_to_ceiling():
+    limiter = RateLimiter(rate=4)
+    limiter.observe(429, {"retry-after": "0"})
+    assert limiter.rate == 2
+    for _ in range(50):
+        limiter.observe(200, {})
+    assert limiter.rate == 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_client_shares_limiter_and_waits_out_429(mock_api):
+    responses = iter([
+        httpx.Response(429, json={"error": "slow down"}, headers={"retry-after": "0.2"}),
+        httpx.Response(200, json={"source": {
+            "id": "src_1", "organizationId": "org_1", "name": "S", "slug": "s",
+        }}),
+    ])
+    mock_api.get("/api/sources/src_1").mock(side_effect=lambda req: next(responses))
+
+    with Hookbase(api_key="whr_test", rate_limit=50) as client:
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.rate == 50
+        start = time.monotonic()
+        source = client.sources.get("src_1")
+        elapsed = time.monotonic() - start
+    assert source.id == "src_1"
+    assert elapsed >= 0.2
+    assert client.rate_limiter.rate < 50
+
+
+def test_client_accepts_limiter_instance():
+    limiter = RateLimiter(rate=5)
+    with Hookbase(api_key="whr_test", rate_limit=limiter) as client:
+        assert client.rate_limiter is limiter
+    with Hookbase(api_key="whr_test") as client:
+        assert client.rate_limiter is None
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import base64
+import json
+import math
+import time
+
+import pytest
+
+from hookbase import InMemoryReplayGuard, Webhook, WebhookReplayError, WebhookVerificationError
+
+SECRET = "whsec_" + base64.b64encode(b"test-secret-key-for-webhook-sign").decode()
+
+
+def test_guard_rejects_second_add():
+    guard = InMemoryReplayGuard()
+    now = math.floor(time.time())
+
+    assert guard.add("msg_1", now) is True
+    assert guard.add("msg_1", now) is False
+    assert guard.add("msg_2", now) is True
+    assert len(guard) == 2
+
+
+def test_guard_discard_allows_redelivery():
+    guard = InMemoryReplayGuard()
+    now = math.floor(time.time())
+    guard.add("msg_1", now)
+    guard.discard("msg_1", now)
+
+    assert guard.add("msg_1", now) is True
+
+
+def test_guard_matches_redelivery_across_bucket_boundary():
+    guard = InMemoryReplayGuard(tolerance=300)
+    boundary = (math.floor(time.time()) // 300) * 300
+
+    assert guard.add("msg_1", boundary - 1) is True
+    assert guard.add("msg_1", boundary + 1) is False
+    guard.discard("msg_1", boundary + 1)
+    assert guard.add("msg_1", boundary + 1) is True
+
+
+def test_guard_evicts_expired_buckets():
+    guard = InMemoryReplayGuard(tolerance=60)
+    now = math.floor(time.time())
+    guard.add("msg_old", now - 600)
+    guard.add("msg_new", now)
+
+    assert len(guard) == 1
+
+
+def test_guard_bounded_by_max_ids():
+    guard = InMemoryReplayGuard(tolerance=60, max_ids=2)
+    now = math.floor(time.time())
+    guard.add("msg_1", now - 60)
+    guard.add("msg_2", now)
+    guard.add("msg_3", now)
+
+    assert len(guard) == 2
+    assert guard.add("msg_1", now - 60) is True
+
+
+def test_webhook_rejects_replayed_id():
+    wh = Webhook(SECRET, replay_guard=InMemoryReplayGuard())
+    payload = json.dumps({"ok": True})
+    headers = wh.generate_test_headers(payload)
+
+    assert wh.verify(payload, headers) == {"ok": True}
+    with pytest.raises(WebhookReplayError) as exc_info:
+        wh.verify(payload, headers)
+    assert exc_info.value.webhook_id == headers["webhook-id"]
+
+
+def test_forged_request_does_not_record_id():
+    guard = InMemoryReplayGuard()
+    wh = Webhook(SECRET, replay_guard=guard)
+    payload = json.dumps({"ok": True})
+    headers = wh.generate_test_headers(payload)
+
+    with pytest.raises(WebhookVerificationError):
+        wh.verify(payload + " ", headers)
+    assert wh.verify(payload, headers) == {"ok": True}
+    assert len(guard) == 1
+
+
+def test_unparsable_body_does_not_record_id():
+    guard = InMemoryReplayGuard()
+    wh = Webhook(SECRET, replay_guard=guard)
+    headers = wh.generate_test_headers("not json")
+
+    with pytest.raises(WebhookVerificationError):
+        wh.verify("not json", headers)
+    assert isinstance(wh.verify_batch([("not json", headers)])[0], WebhookVerificationError)
+    assert len(guard) == 0
+
+    payload = json.dumps({"ok": True})
+    redelivered = wh.generate_test_headers(payload, webhook_id=headers["webhook-id"])
+    assert wh.verify(payload, redelivered) == {"ok": True}
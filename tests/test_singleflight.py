@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+
+from hookbase import AsyncHookbase, AsyncSingleFlight, Hookbase, SingleFlight
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as respx_mock:
+        yield respx_mock
+
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"id": "src_1"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.hits + flight.misses < 5:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"id": "src_1"}] * 5
+    assert (flight.hits, flight.misses) == (4, 1)
+
+
+def test_exception_is_shared_and_key_released():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.misses == 2
+
+
+async def test_async_waiter_cancellation_keeps_flight_alive():
+    flight = AsyncSingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("k", fetch))
+    second = asyncio.ensure_future(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "ok"
+    assert first.cancelled()
+
+
+def test_client_coalesces_identical_gets(mock_api):
+    release = threading.Event()
+
+    def respond(request):
+        release.wait(5)
+        return httpx.Response(200, json={"circuitState": "closed"})
+
+    route = mock_api.get("/api/routes/rte_1/circuit-status").mock(side_effect=respond)
+    client = Hookbase(api_key="whr_test", coalesce_requests=True)
+    threads = [
+        threading.Thread(target=client.routes.get_circuit_status, args=("rte_1",))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while client.single_flight.hits + client.single_flight.misses < 4:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert route.call_count == 1
+    assert client.single_flight.hits == 3
+
+
+async def test_async_client_coalesces_identical_gets(mock_api):
+    async def respond(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"circuitState": "closed"})
+
+    route = mock_api.get("/api/routes/rte_1/circuit-status").mock(side_effect=respond)
+    async with AsyncHookbase(api_key="whr_test", coalesce_requests=True) as client:
+        results = await asyncio.gather(
+            *(client.routes.get_circuit_status("rte_1") for _ in range(5))
+        )
+
+    assert route.call_count == 1
+    assert all(result == results[0] for result in results)
+    assert (client.single_flight.hits, client.single_flight.misses) == (4, 1)
+
+
+async def test_different_params_are_not_coalesced(mock_api):
+    route = mock_api.get("/api/sources").mock(
+        return_value=httpx.Response(200, json={"data": [], "pagination": {"total": 0}})
+    )
+    async with AsyncHookbase(api_key="whr_test", coalesce_requests=True) as client:
+        await asyncio.gather(client.sources.list(page=1), client.sources.list(page=2))
+
+    assert route.call_count == 2
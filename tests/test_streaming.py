@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+import respx
+
+from hookbase import APIError, AsyncHookbase, Hookbase, NotFoundError
+from hookbase._streaming import CSVParser, JSONArrayParser, NDJSONParser
+
+
+@pytest.fixture
+def mock_api():
+    with respx.mock(base_url="https://api.hookbase.app") as mock:
+        yield mock
+
+
+@pytest.fixture
+def client(mock_api):
+    c = Hookbase(api_key="whr_test")
+    yield c
+    c.close()
+
+
+def _feed_bytewise(parser, data: bytes) -> list:
+    records = []
+    for i in range(len(data)):
+        records.extend(parser.feed(data[i:i + 1]))
+    records.extend(parser.close())
+    return records
+
+
+RECORDS = [
+    {"id": "evt_1", "amount": 12, "note": "brackets [] and \"quotes\""},
+    {"id": "evt_2", "amount": 3.5, "note": "ünïcode"},
+    {"id": "evt_3", "amount": 100, "nested": {"list": [1, 2]}},
+]
+
+
+def test_ndjson_parser_chunk_boundaries():
+    data = "\n".join(json.dumps(r) for r in RECORDS).encode()
+    assert _feed_bytewise(NDJSONParser(), data) == RECORDS
+
+
+def test_json_array_parser_top_level_and_wrapped():
+    top = json.dumps(RECORDS).encode()
+    assert _feed_bytewise(JSONArrayParser(), top) == RECORDS
+
+    wrapped = json.dumps({"meta": "x [y]", "events": RECORDS, "count": 3}).encode()
+    assert _feed_bytewise(JSONArrayParser(), wrapped) == RECORDS
+
+
+def test_json_array_parser_truncated():
+    parser = JSONArrayParser()
+    parser.feed(b'[{"id": 1}, {"id"')
+    with pytest.raises(json.JSONDecodeError):
+        parser.close()
+
+
+def test_csv_parser_quoted_newlines():
+    data = b'id,note\r\nevt_1,"line one\nline two"\r\nevt_2,"say ""hi"""\r\n'
+    assert _feed_bytewise(CSVParser(), data) == [
+        {"id": "evt_1", "note": "line one\nline two"},
+        {"id": "evt_2", "note": 'say "hi"'},
+    ]
+
+
+def test_events_iter_export_ndjson(mock_api, client):
+    body = "\n".join(json.dumps(r) for r in RECORDS).encode()
+    route = mock_api.get("/api/events/export").respond(200, content=body)
+    records = list(client.events.iter_export(format="ndjson", source_id="src_1"))
+    assert records == RECORDS
+    assert route.calls[0].request.url.params["format"] == "ndjson"
+    assert route.calls[0].request.url.params["sourceId"] == "src_1"
+
+
+def test_events_iter_export_error(mock_api, client):
+    mock_api.get("/api/events/export").respond(404, json={"error": "nope"})
+    with pytest.raises(NotFoundError):
+        list(client.events.iter_export())
+
+
+def test_message_log_export_to_file(mock_api, client, tmp_path):
+    body = b"id,status\nom_1,success\n"
+    mock_api.get("/api/outbound-messages/export").respond(200, content=body)
+
+    target = tmp_path / "export.csv"
+    written = client.outbound.message_log.export_to(target, format="csv")
+    assert written == len(body)
+    assert target.read_bytes() == body
+
+    buffer = io.BytesIO()
+    client.outbound.message_log.export_to(buffer, format="csv", chunk_size=4)
+    assert buffer.getvalue() == body
+
+
+def test_failed_export_to_keeps_existing_file(mock_api, tmp_path):
+    mock_api.get("/api/events/export").respond(500, json={"error": "boom"})
+    target = tmp_path / "export.json"
+    target.write_bytes(b"previous export")
+
+    with Hookbase(api_key="whr_test", max_retries=0) as client, pytest.raises(APIError):
+        client.events.export_to(target)
+
+    assert target.read_bytes() == b"previous export"
+    assert [p.name for p in tmp_path.iterdir()] == ["export.json"]
+
+
+async def test_async_export_to_file(mock_api, tmp_path):
+    mock_api.get("/api/events/export").respond(200, content=b"[]")
+    target = tmp_path / "export.json"
+    async with AsyncHookbase(api_key="whr_test") as client:
+        assert await client.events.export_to(target, chunk_size=1) == 2
+    assert target.read_bytes() == b"[]"
+
+
+async def test_async_iter_export(mock_api):
+    mock_api.get("/api/outbound-messages/export").respond(200, json={"data": RECORDS})
+    async with AsyncHookbase(api_key="whr_test") as client:
+        records = [r async for r in client.outbound.message_log.iter_export()]
+    assert records == RECORDS
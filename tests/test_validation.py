@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from hookbase import Hookbase, _validation
+from hookbase.models import Event, Source
+
+
+def test_adapter_is_cached_per_type():
+    assert _validation.get_adapter(Source) is _validation.get_adapter(Source)
+    assert _validation.get_adapter(list[Source]) is _validation.get_adapter(list[Source])
+    assert _validation.get_adapter(Source) is not _validation.get_adapter(list[Source])
+
+
+def test_parse_list():
+    items = _validation.parse_list(Event, [
+        {"id": "evt_1", "sourceId": "src_1", "organizationId": "org_1"},
+    ])
+    assert len(items) == 1
+    assert isinstance(items[0], Event)
+    assert items[0].source_id == "src_1"
+
+
+def test_warm_up_compiles_all_models():
+    _validation.clear()
+    count = _validation.warm_up()
+    assert count > 0
+    assert Source in _validation._adapters
+    assert list[Event] in _validation._adapters
+
+
+def test_client_warm_validators():
+    _validation.clear()
+    client = Hookbase(api_key="whr_test", warm_validators=True)
+    assert Event in _validation._adapters
+    client.close()
@@ -4,10 +4,17 @@ import base64
 import json
 import math
 import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from hookbase import Webhook, WebhookVerificationError
+from hookbase import (
+    InMemoryReplayGuard,
+    Webhook,
+    WebhookReplayError,
+    WebhookSecret,
+    WebhookVerificationError,
+)
 
 SECRET_RAW = base64.b64encode(b"test-secret-key-for-webhook-sign").decode()
 SECRET_PREFIXED = f"whsec_{SECRET_RAW}"
@@ -149,3 +156,108 @@ def test_custom_tolerance(wh):
     # Should fail with 30s tolerance
     with pytest.raises(WebhookVerificationError, match="outside tolerance"):
         wh.verify(payload, headers, tolerance=30)
+
+
+def test_verify_skips_malformed_signature(wh):
+    payload = json.dumps({"ok": True})
+    headers = wh.generate_test_headers(payload)
+    headers["webhook-signature"] = f"v1,@@not-base64@@ {headers['webhook-signature']}"
+    assert wh.verify(payload, headers) == {"ok": True}
+
+
+def test_verifier_reused_across_messages(wh):
+    for i in range(3):
+        payload = json.dumps({"n": i})
+        assert wh.verify(payload, wh.generate_test_headers(payload)) == {"n": i}
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_verify_buffer_payloads(wh, wrap):
+    payload = json.dumps({"key": "välue"}).encode("utf-8")
+    headers = wh.generate_test_headers(payload)
+    assert wh.verify(wrap(payload), headers) == {"key": "välue"}
+
+
+def test_verify_invalid_utf8_payload(wh):
+    payload = b'{"key": "\xff"}'
+    headers = wh.generate_test_headers(payload)
+    with pytest.raises(WebhookVerificationError, match="Invalid JSON"):
+        wh.verify(memoryview(payload), headers)
+
+
+NEW_SECRET = "whsec_" + base64.b64encode(b"rotated-secret-key-for-webhooks!").decode()
+
+
+def test_keyring_accepts_old_and_new_secret():
+    wh = Webhook([WebhookSecret(SECRET_PREFIXED, expires_at=time.time() + 60), NEW_SECRET])
+    payload = json.dumps({"ok": True})
+    for secret in (SECRET_PREFIXED, NEW_SECRET):
+        headers = Webhook(secret).generate_test_headers(payload)
+        assert wh.verify(payload, headers) == {"ok": True}
+
+
+def test_keyring_drops_expired_secret():
+    expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+    wh = Webhook([WebhookSecret(SECRET_PREFIXED, expires_at=expired), NEW_SECRET])
+    payload = json.dumps({"ok": True})
+    headers = Webhook(SECRET_PREFIXED).generate_test_headers(payload)
+
+    with pytest.raises(WebhookVerificationError, match="verification failed"):
+        wh.verify(payload, headers)
+    assert wh.active_secrets == 1
+
+
+def test_keyring_all_expired():
+    wh = Webhook(WebhookSecret(SECRET_PREFIXED, expires_at=time.time() - 1))
+    payload = json.dumps({"ok": True})
+    with pytest.raises(WebhookVerificationError, match="expired"):
+        wh.verify(payload, Webhook(SECRET_PREFIXED).generate_test_headers(payload))
+
+
+def test_keyring_matches_any_signature_in_header():
+    wh = Webhook(NEW_SECRET)
+    payload = json.dumps({"ok": True})
+    ts = math.floor(time.time())
+    headers = Webhook(SECRET_PREFIXED).generate_test_headers(payload, timestamp=ts)
+    new = wh.generate_test_headers(payload, webhook_id=headers["webhook-id"], timestamp=ts)
+    headers["webhook-signature"] += " " + new["webhook-signature"]
+    assert wh.verify(payload, headers) == {"ok": True}
+
+
+def test_generate_signs_with_every_active_secret():
+    wh = Webhook(SECRET_PREFIXED)
+    wh.add_secret(NEW_SECRET, expires_at=time.time() + 60)
+    headers = wh.generate_test_headers("{}")
+    assert len(headers["webhook-signature"].split(" ")) == 2
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_verify_batch_keeps_input_order(processes):
+    with Webhook(SECRET_PREFIXED) as wh:
+        items = []
+        for i in range(12):
+            payload = json.dumps({"n": i}).encode()
+            headers = wh.generate_test_headers(payload)
+            if i % 4 == 3:
+                headers["webhook-signature"] = "v1,aW52YWxpZHNpZ25hdHVyZQ=="
+            items.append((memoryview(payload), headers))
+
+        results = wh.verify_batch(items, workers=2, processes=processes)
+
+    for i, result in enumerate(results):
+        if i % 4 == 3:
+            assert isinstance(result, WebhookVerificationError)
+        else:
+            assert result == {"n": i}
+
+
+def test_verify_batch_applies_replay_guard_in_order():
+    wh = Webhook(SECRET_PREFIXED, replay_guard=InMemoryReplayGuard())
+    payload = json.dumps({"ok": True})
+    headers = wh.generate_test_headers(payload)
+
+    results = wh.verify_batch([(payload, headers)] * 3)
+    wh.close()
+
+    assert results[0] == {"ok": True}
+    assert all(isinstance(r, WebhookReplayError) for r in results[1:])